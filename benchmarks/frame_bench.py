@@ -0,0 +1,227 @@
+"""Benchmark de tempo de frame sobre os mapas do jogo.
+
+Carrega cada mapa em modo headless (drivers SDL "dummy"), conduz o player por um
+roteiro fixo de teclas, adiciona inimigos e rajadas de projéteis em leque e mede,
+a cada passo, EntityManager.update, CollisionManager.update e Level.draw.
+O resultado (p50/p95/p99 em ms) sai em JSON para comparar execuções.
+
+Uso (a partir da raiz do repositório):
+    python benchmarks/frame_bench.py
+    python benchmarks/frame_bench.py --maps starter level_3 --hammer-bots 20 --drones 10 --output antes.json
+"""
+import argparse
+import contextlib
+import io
+import json
+import logging
+import os
+import platform
+import sys
+import time
+
+ROOT = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+INVOCATION_DIR = os.getcwd()
+os.environ.setdefault("SDL_VIDEODRIVER", "dummy")
+os.environ.setdefault("SDL_AUDIODRIVER", "dummy")
+sys.path.insert(0, os.path.join(ROOT, "src"))
+os.chdir(ROOT)  # Os caminhos de assets são relativos à raiz
+
+import pygame  # noqa: E402
+from config import FIXED_TIMESTEP  # noqa: E402
+from game_random import GameRandom  # noqa: E402
+from input_manager import InputManager  # noqa: E402
+from level import Level  # noqa: E402
+from levelArena import LevelArena  # noqa: E402
+from object_factory import ObjectFactory  # noqa: E402
+from spell_system.rune import Rune  # noqa: E402
+from spell_system.rune_type import RuneType  # noqa: E402
+
+MAPS = ["starter", "level_2", "level_3", "level_4"]
+SECTIONS = ["entity_update", "collision_update", "level_draw"]
+
+
+def scripted_keys(step):
+    """Roteiro do player: anda para a direita, volta de tempos em tempos, pula e ataca."""
+    keys = {pygame.K_RIGHT} if (step // 360) % 3 != 2 else {pygame.K_LEFT}
+    if step % 150 < 8:
+        keys.add(pygame.K_SPACE)
+    if step % 90 < 3:
+        keys.add(pygame.K_q)
+    return keys
+
+
+def percentile(sorted_samples, fraction):
+    """Percentil com interpolação linear entre as amostras vizinhas."""
+    if not sorted_samples:
+        return 0.0
+    position = (len(sorted_samples) - 1) * fraction
+    lower = int(position)
+    upper = min(lower + 1, len(sorted_samples) - 1)
+    weight = position - lower
+    return sorted_samples[lower] * (1 - weight) + sorted_samples[upper] * weight
+
+
+def summarize(samples):
+    ordered = sorted(samples)
+    to_ms = 1000.0
+    return {
+        "samples": len(ordered),
+        "p50_ms": round(percentile(ordered, 0.50) * to_ms, 4),
+        "p95_ms": round(percentile(ordered, 0.95) * to_ms, 4),
+        "p99_ms": round(percentile(ordered, 0.99) * to_ms, 4),
+        "mean_ms": round(sum(ordered) / len(ordered) * to_ms, 4) if ordered else 0.0,
+        "max_ms": round(ordered[-1] * to_ms, 4) if ordered else 0.0,
+    }
+
+
+def timed(func, samples, extend_last=False):
+    """Envolve um método vinculado acumulando a duração de cada chamada em samples.
+
+    Com extend_last, a duração soma na última amostra em vez de abrir uma nova
+    (para uma etapa que roda logo depois de outra no mesmo passo).
+    """
+    def wrapper(*args, **kwargs):
+        start = time.perf_counter()
+        try:
+            return func(*args, **kwargs)
+        finally:
+            elapsed = time.perf_counter() - start
+            if extend_last and samples:
+                samples[-1] += elapsed
+            else:
+                samples.append(elapsed)
+    return wrapper
+
+
+def spawn_enemies(level, player, hammer_bots, drones):
+    """Adiciona inimigos espalhados à frente do spawn do player."""
+    base_x, base_y = player.position.x, player.position.y - 10
+    specs = [("hammer_bot", i) for i in range(hammer_bots)] + [("drone_bot", i) for i in range(drones)]
+    for index, (name, i) in enumerate(specs):
+        enemy = ObjectFactory.create_object({
+            "type": "spawn",
+            "name": name,
+            "x": base_x + 60 + index * 28,
+            "y": base_y - (40 if name == "drone_bot" else 0),
+            "width": 22,
+            "height": 31,
+            "id": f"bench_{name}_{i}",
+        })
+        if enemy:
+            level.entity_manager.add_entity(enemy, is_enemy=True)
+            level.all_sprites.append(enemy)
+
+
+def run_map(screen, map_name, args):
+    GameRandom.get_instance().seed(args.seed)
+    InputManager.get_instance().set_script(scripted_keys)
+
+    level_class = LevelArena if map_name == "level_3" else Level
+    level = level_class(screen, map_name, None, None, 0, [], None)
+    player = level.entity_manager.get_player()
+    # Player imortal: uma morte recarregaria o mapa no meio da medição
+    player.max_health = player.health = 10 ** 9
+    spawn_enemies(level, player, args.hammer_bots, args.drones)
+
+    fan_spell = player.spell_system.spellbook[0]
+    fan_spell.major_rune = Rune("fan", RuneType.MAJOR, 0, {})
+    fan_every = max(1, int(round(1.0 / (args.fan_volleys * FIXED_TIMESTEP)))) if args.fan_volleys > 0 else 0
+
+    samples = {section: [] for section in SECTIONS}
+    entity_manager = level.entity_manager
+    collision_manager = level.collision_manager
+    entity_update, collision_update = entity_manager.update, collision_manager.update
+    projectile_hits = entity_manager.resolve_projectile_hits
+    entity_manager.update = timed(entity_update, samples["entity_update"])
+    collision_manager.update = timed(collision_update, samples["collision_update"])
+    # Acertos dos projéteis entram em collision_update, como em update.collision no Level
+    entity_manager.resolve_projectile_hits = timed(projectile_hits, samples["collision_update"], extend_last=True)
+
+    steps_run = 0
+    door_steps = 0
+    try:
+        for step in range(args.warmup + args.steps):
+            if step == args.warmup:
+                for section in samples.values():
+                    section.clear()
+            if fan_every and step % fan_every == 0:
+                fan_spell.execute(1 if player.facing_right else -1, player)
+
+            if level.update(FIXED_TIMESTEP):
+                door_steps += 1  # Passou por uma porta: o benchmark permanece no mesmo mapa
+            start = time.perf_counter()
+            level.draw()
+            samples["level_draw"].append(time.perf_counter() - start)
+            steps_run = step + 1
+    finally:
+        # EntityManager e CollisionManager são singletons: desfaz os wrappers
+        del entity_manager.update
+        del entity_manager.resolve_projectile_hits
+        del collision_manager.update
+
+    return {
+        "steps": max(0, steps_run - args.warmup),
+        "entities_at_end": len(entity_manager.entities),
+        "door_steps": door_steps,
+        "sections": {section: summarize(values) for section, values in samples.items()},
+    }
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description="Benchmark de tempo de frame dos mapas do Manastride.")
+    parser.add_argument("--maps", nargs="+", default=MAPS, help="Mapas a medir (padrão: todos)")
+    parser.add_argument("--steps", type=int, default=1200, help="Passos medidos por mapa (120 por segundo)")
+    parser.add_argument("--warmup", type=int, default=120, help="Passos descartados antes de medir")
+    parser.add_argument("--hammer-bots", type=int, default=10, help="HammerBots extras por mapa")
+    parser.add_argument("--drones", type=int, default=5, help="Drones extras por mapa")
+    parser.add_argument("--fan-volleys", type=float, default=2.0,
+                        help="Rajadas em leque (5 projéteis) por segundo de simulação; 0 desliga")
+    parser.add_argument("--seed", type=int, default=1234, help="Semente do GameRandom")
+    parser.add_argument("--width", type=int, default=1600)
+    parser.add_argument("--height", type=int, default=900)
+    parser.add_argument("--output", help="Arquivo JSON de saída (padrão: stdout)")
+    args = parser.parse_args(argv)
+
+    pygame.init()
+    pygame.mixer.quit()  # Sons mudos: o benchmark não depende de placa de som
+    screen = pygame.display.set_mode((args.width, args.height))
+    logging.disable(logging.INFO)
+
+    results = {}
+    for map_name in args.maps:
+        # Os níveis imprimem bastante no stdout; o JSON precisa sair limpo
+        with contextlib.redirect_stdout(io.StringIO()):
+            results[map_name] = run_map(screen, map_name, args)
+        print(f"{map_name}: {results[map_name]['steps']} passos", file=sys.stderr)
+
+    report = {
+        "config": {
+            "maps": args.maps,
+            "steps": args.steps,
+            "warmup": args.warmup,
+            "hammer_bots": args.hammer_bots,
+            "drones": args.drones,
+            "fan_volleys_per_second": args.fan_volleys,
+            "seed": args.seed,
+            "screen": [args.width, args.height],
+            "timestep": FIXED_TIMESTEP,
+        },
+        "environment": {
+            "python": platform.python_version(),
+            "pygame": pygame.version.ver,
+            "platform": platform.platform(),
+        },
+        "results": results,
+    }
+
+    output = json.dumps(report, indent=2)
+    if args.output:
+        with open(os.path.join(INVOCATION_DIR, args.output), "w") as file:
+            file.write(output + "\n")
+    else:
+        print(output)
+    pygame.quit()
+
+
+if __name__ == "__main__":
+    main()
@@ -3,6 +3,27 @@ import os
 import pygame
 import xml.etree.ElementTree as ET
 from typing import Dict, List, Tuple, Optional
+from map_data import MapData, compiled_path
+from parallax_background import ParallaxBackground
+
+
+class SilentSound:
+    """Substituto de pygame.mixer.Sound usado quando não há mixer (modo headless)."""
+
+    def play(self, *args, **kwargs):
+        return None
+
+    def stop(self):
+        pass
+
+    def set_volume(self, volume: float):
+        pass
+
+    def get_volume(self) -> float:
+        return 0.0
+
+    def get_length(self) -> float:
+        return 0.0
 
 
 class AssetLoader:
@@ -13,12 +34,39 @@ class AssetLoader:
     #  MÉTODOS ESTÁTICOS
     # ------------------------------------------------------------------ #
     @staticmethod
-    def load_map_data(level_name: str, base_path: str = _DEFAULT_BASE_PATH) -> Optional[ET.Element]:
-        """Carrega e retorna o XML do mapa."""
+    def convert_surface(surface: pygame.Surface, alpha: bool = True) -> pygame.Surface:
+        """Converte para o formato da tela; sem janela (headless) mantém a superfície como está."""
+        if pygame.display.get_surface() is None:
+            return surface
+        return surface.convert_alpha() if alpha else surface.convert()
+
+    @staticmethod
+    def load_sound(path: str):
+        """Carrega um efeito sonoro; sem mixer inicializado retorna um som mudo."""
+        if not pygame.mixer.get_init():
+            return SilentSound()
+        try:
+            return pygame.mixer.Sound(path)
+        except (FileNotFoundError, pygame.error) as e:
+            print(f"[AssetLoader] Som não carregado: {path} → {e}")
+            return SilentSound()
+
+    @staticmethod
+    def load_map_data(level_name: str, base_path: str = _DEFAULT_BASE_PATH) -> Optional[MapData]:
+        """Carrega o mapa: usa a versão compilada (.msmap) se estiver em dia com o XML, senão o XML."""
         file_path = os.path.join(base_path, f"{level_name}.xml")
+        bundle_path = compiled_path(file_path)
+        if os.path.exists(bundle_path):
+            try:
+                map_data = MapData.load_compiled(bundle_path, file_path)
+                if map_data is not None:
+                    return map_data
+                print(f"[AssetLoader] Mapa compilado desatualizado, usando o XML: {bundle_path}")
+            except (OSError, ValueError, KeyError) as e:
+                print(f"[AssetLoader] Mapa compilado inválido: {bundle_path} → {e}")
+
         try:
-            tree = ET.parse(file_path)
-            return tree.getroot()
+            return MapData.from_xml(ET.parse(file_path).getroot())
         except FileNotFoundError:
             print(f"[AssetLoader] Erro: Arquivo não encontrado → {file_path}")
             return None
@@ -27,29 +75,46 @@ class AssetLoader:
             return None
 
     @staticmethod
-    def load_tileset(
-        map_data: ET.Element,
+    def read_tileset_image(
+        map_data: MapData,
         base_path: str = _DEFAULT_BASE_PATH
+    ) -> Optional[pygame.Surface]:
+        """Lê a imagem do tileset sem converter (pode rodar fora da thread principal)."""
+        if map_data.tileset is None:
+            return None
+        full_image_path = os.path.join(base_path, map_data.tileset.image_source)
+        try:
+            return pygame.image.load(full_image_path)
+        except FileNotFoundError:
+            print(f"[AssetLoader] Tileset não encontrado: {full_image_path}")
+            return None
+
+    @staticmethod
+    def load_tileset(
+        map_data: MapData,
+        base_path: str = _DEFAULT_BASE_PATH,
+        image: Optional[pygame.Surface] = None
     ) -> Dict[int, pygame.Surface]:
-        """Carrega o tileset e retorna dicionário {gid: surface}."""
-        tileset = map_data.find("tileset")
-        if not tileset:
+        """Carrega o tileset e retorna dicionário {gid: surface}.
+
+        image: imagem já lida por read_tileset_image (ex: pelo LevelPreloader); só falta converter.
+        """
+        tileset = map_data.tileset
+        if tileset is None:
             print("[AssetLoader] Tileset não encontrado no mapa.")
             return {}
 
-        image_path = tileset.find("image").get("source")
-        tile_width = int(tileset.get("tilewidth"))
-        tile_height = int(tileset.get("tileheight"))
-        columns = int(tileset.get("columns"))
-        tilecount = int(tileset.get("tilecount"))
-        firstgid = int(tileset.get("firstgid"))
+        tile_width = tileset.tile_width
+        tile_height = tileset.tile_height
+        columns = tileset.columns
+        tilecount = tileset.tilecount
+        firstgid = tileset.firstgid
 
-        full_image_path = os.path.join(base_path, image_path)
-        try:
-            tileset_image = pygame.image.load(full_image_path).convert_alpha()
-        except FileNotFoundError:
-            print(f"[AssetLoader] Tileset não encontrado: {full_image_path}")
-            return {}
+        if image is None:
+            image = AssetLoader.read_tileset_image(map_data, base_path)
+            if image is None:
+                return {}
+        tileset_image = AssetLoader.convert_surface(image)
 
         tiles = {}
         for gid_offset in range(tilecount):
@@ -65,49 +130,64 @@ class AssetLoader:
         return tiles
 
     @staticmethod
-    def load_background_layers(
+    def read_background_layers(
         screen_size: Tuple[int, int],
         world_size: Tuple[int, int],
         camera_zoom: float,
         base_path: str = _DEFAULT_BASE_PATH
-    ) -> List[Dict]:
-        """Carrega camadas de parallax."""
+    ) -> List[Tuple[float, pygame.Surface]]:
+        """Lê e escala as camadas de parallax sem converter: [(fator, surface)]."""
         parallax_configs = [
             (0.2, f"{base_path}/oak_woods_v1.0/background/background_layer_1.png"),
             (0.5, f"{base_path}/oak_woods_v1.0/background/background_layer_2.png"),
             (0.8, f"{base_path}/oak_woods_v1.0/background/background_layer_3.png"),
         ]
 
-        screen_w, screen_h = screen_size
-        world_w, world_h = world_size
         layers = []
 
         for factor, path in parallax_configs:
             try:
-                image = pygame.image.load(path).convert_alpha()
-                # Ajusta ao mundo + tela para evitar bordas
-                scaled_w = int(world_w / camera_zoom / factor) + screen_w
-                scaled_h = int(world_h / camera_zoom / factor) + screen_h
-                scaled = pygame.transform.scale(image, (scaled_w, scaled_h))
-
-                layer = {
-                    'surface': scaled,
-                    'parallax_factor': factor,
-                    'offset_x': 0,
-                    'offset_y': 0
-                }
-                layers.append(layer)
+                image = pygame.image.load(path)
+                # Só o necessário para cobrir a tela; a repetição horizontal fica no desenho
+                size = ParallaxBackground.scaled_size(image.get_size(), factor, screen_size, world_size, camera_zoom)
+                layers.append((factor, pygame.transform.scale(image, size)))
             except FileNotFoundError:
                 print(f"[AssetLoader] Background não encontrado: {path}")
 
         return layers
 
+    @staticmethod
+    def load_background_layers(
+        screen_size: Tuple[int, int],
+        world_size: Tuple[int, int],
+        camera_zoom: float,
+        base_path: str = _DEFAULT_BASE_PATH,
+        raw_layers: Optional[List[Tuple[float, pygame.Surface]]] = None
+    ) -> List[Dict]:
+        """Carrega camadas de parallax.
+
+        raw_layers: resultado de read_background_layers já pronto (ex: pelo LevelPreloader).
+        """
+        if raw_layers is None:
+            raw_layers = AssetLoader.read_background_layers(screen_size, world_size, camera_zoom, base_path)
+
+        return [
+            {
+                # Camadas sem canal alfa (o céu) viram opacas: blit bem mais barato
+                'surface': AssetLoader.convert_surface(surface, alpha=bool(surface.get_flags() & pygame.SRCALPHA)),
+                'parallax_factor': factor,
+                'offset_x': 0,
+                'offset_y': 0
+            }
+            for factor, surface in raw_layers
+        ]
+
     @staticmethod
     def load_image(path: str) -> pygame.Surface:
         """Carrega uma imagem genérica."""
         full_path = os.path.join(path)
         try:
-            return pygame.image.load(full_path).convert_alpha()
+            return AssetLoader.convert_surface(pygame.image.load(full_path))
         except FileNotFoundError:
             print(f"[AssetLoader] Imagem não encontrada: {full_path}")
             return pygame.Surface((32, 32), pygame.SRCALPHA)  # fallback
\ No newline at end of file
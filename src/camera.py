@@ -1,4 +1,5 @@
 import pygame
+from collections import OrderedDict
 from pygame.math import Vector2
 
 class Camera:
@@ -21,9 +22,16 @@ class Camera:
         self.world_height = world_height
         self.zoom = zoom
         self.offset = Vector2(0, 0)
+        self.previous_offset = Vector2(0, 0)  # Offset no início do passo atual, para interpolar o desenho
         self.target_offset = Vector2(0, 0)
         self.lerp_speed = 0.05  # Velocidade de suavização (0.0 a 1.0)
 
+        # Cache LRU de superfícies já escaladas para o zoom atual
+        # id(surface) -> (surface original, surface escalada, bytes)
+        self.surface_cache = OrderedDict()
+        self.surface_cache_budget = 64 * 1024 * 1024  # Orçamento de memória em bytes
+        self.surface_cache_bytes = 0
+
         self._initialized = True
 
     @classmethod
@@ -39,7 +47,10 @@ class Camera:
         return cls._instance
 
     def set_zoom(self, zoom):
-        self.zoom = max(0.5, min(zoom, 3.0))
+        zoom = max(0.5, min(zoom, 3.0))
+        if zoom != self.zoom:
+            self.clear_surface_cache()
+        self.zoom = zoom
 
     def update(self, player):
         if player is None:
@@ -60,6 +71,24 @@ class Camera:
         self.offset.x = max(0, min(self.offset.x, self.world_width - screen_width / self.zoom))
         self.offset.y = max(0, min(self.offset.y, self.world_height - screen_height / self.zoom))
 
+    def snapshot(self):
+        """Guarda o offset atual antes de um passo da simulação."""
+        self.previous_offset.update(self.offset)
+
+    def interpolated_offset(self, alpha):
+        """Offset entre o passo anterior e o atual (alpha de 0.0 a 1.0)."""
+        return self.previous_offset.lerp(self.offset, alpha)
+
+    def get_view_rect(self):
+        """Retângulo do mundo visível na tela, com o offset e o zoom atuais."""
+        screen_width, screen_height = self.screen_size
+        return pygame.Rect(
+            int(self.offset.x),
+            int(self.offset.y),
+            int(screen_width / self.zoom) + 2,  # +2 cobre o arredondamento das bordas
+            int(screen_height / self.zoom) + 2
+        )
+
     def apply(self, rect):
         scaled_width = rect.width * self.zoom
         scaled_height = rect.height * self.zoom
@@ -70,15 +99,50 @@ class Camera:
         return scaled_rect
 
     def apply_surface(self, surface):
-        return pygame.transform.scale(surface,
+        """Retorna a superfície escalada pelo zoom, reaproveitando o cache quando possível."""
+        key = id(surface)
+        entry = self.surface_cache.get(key)
+        if entry is not None and entry[0] is surface:
+            self.surface_cache.move_to_end(key)
+            scaled = entry[1]
+            # set_alpha na original (ex: piscar do player) precisa refletir na cópia
+            alpha = surface.get_alpha()
+            if scaled.get_alpha() != alpha:
+                scaled.set_alpha(alpha)
+            return scaled
+
+        scaled = pygame.transform.scale(surface,
             (int(surface.get_width() * self.zoom), int(surface.get_height() * self.zoom)))
+        size = scaled.get_width() * scaled.get_height() * scaled.get_bytesize()
+        if size > self.surface_cache_budget:
+            return scaled
+
+        if entry is not None:
+            self._evict(key)
+        self.surface_cache[key] = (surface, scaled, size)
+        self.surface_cache_bytes += size
+        while self.surface_cache_bytes > self.surface_cache_budget:
+            self._evict(next(iter(self.surface_cache)))
+        return scaled
+
+    def _evict(self, key):
+        _, _, size = self.surface_cache.pop(key)
+        self.surface_cache_bytes -= size
+
+    def clear_surface_cache(self):
+        """Descarta todas as superfícies escaladas (ex: quando o zoom muda)."""
+        self.surface_cache.clear()
+        self.surface_cache_bytes = 0
 
     # Métodos auxiliares para reinicializar mundo/zoom (útil ao trocar de nível)
     def reset_world(self, world_width, world_height, zoom=1.0):
         self.world_width = world_width
         self.world_height = world_height
+        if zoom != self.zoom:
+            self.clear_surface_cache()
         self.zoom = zoom
         self.offset = Vector2(0, 0)
+        self.previous_offset = Vector2(0, 0)
         self.target_offset = Vector2(0, 0)
 
     def set_screen_size(self, screen_size):
@@ -4,6 +4,7 @@
 # que ele passe por paredes e vãos menores que ele, da mesma forma ele tem um collider na cabeça para registrar
 import pygame
 from pygame.math import Vector2
+from collision_layers import CollisionLayers
 
 class Collider:
     def __init__(self, owner, offset, size, type='body', active=True):
@@ -19,6 +20,12 @@ class Collider:
         self.type = type  # Tipo do collider (ex: hitbox, ataque, damage)
         self.active = active  # Define se a colisão será tratada ou não
 
+        # Camada e tag internadas como inteiros para o CollisionManager não comparar strings
+        self.layer = CollisionLayers.type_bit(type)
+        self.tag_id = CollisionLayers.tag_id(getattr(owner, "tag", None))
+        self.tag_bit = 1 << self.tag_id
+        self.mask, self.target_tags = CollisionLayers.interaction(self.layer, self.tag_id)
+
     def update_position(self, owner_rect, facing_right=None):
         offset_x = self.offset[0]
         offset_y = self.offset[1]
@@ -0,0 +1,81 @@
+# collision_layers.py
+from typing import Dict, Optional, Tuple
+
+
+class CollisionLayers:
+    """Converte tipos de collider em bits de camada e tags de objeto em inteiros.
+
+    A conversão é feita uma vez, na construção do Collider; o CollisionManager
+    compara apenas inteiros e descarta pares que nunca interagem antes do teste de retângulo.
+    """
+
+    _type_bits: Dict[str, int] = {}
+    _tag_ids: Dict[Optional[str], int] = {}
+    _npc_tags = 0  # Bits das tags que contêm "npc"
+
+    @classmethod
+    def type_bit(cls, type_name: str) -> int:
+        bit = cls._type_bits.get(type_name)
+        if bit is None:
+            bit = cls._type_bits[type_name] = 1 << len(cls._type_bits)
+        return bit
+
+    @classmethod
+    def tag_id(cls, tag: Optional[str]) -> int:
+        tag_id = cls._tag_ids.get(tag)
+        if tag_id is None:
+            tag_id = cls._tag_ids[tag] = len(cls._tag_ids)
+            if tag and "npc" in tag:
+                cls._npc_tags |= 1 << tag_id
+        return tag_id
+
+    @classmethod
+    def is_npc(cls, tag_id: int) -> bool:
+        return bool(cls._npc_tags & (1 << tag_id))
+
+    @classmethod
+    def interaction(cls, layer: int, tag_id: int) -> Tuple[int, int]:
+        """Retorna (máscara de camadas, máscara de tags) com que um collider interage.
+
+        Máscara de camadas zero significa que o collider nunca inicia um teste.
+        """
+        if layer == BODY:
+            # O player atravessa barreiras; portas e alarmes são sólidos para os demais
+            mask = SOLID & ~BARRIER if tag_id == TAG_PLAYER else SOLID
+            return mask, ALL_TAGS
+        if layer == HURT_BOX:
+            # Inimigos não se ferem entre si
+            if tag_id == TAG_ENEMY_NPC:
+                return ATTACK_BOX, ALL_TAGS & ~(1 << TAG_ENEMY_NPC)
+            return ATTACK_BOX, ALL_TAGS
+        if layer == ITEM:
+            return BODY, 1 << TAG_PLAYER
+        if layer == PLAYER_CHECK and tag_id == TAG_ENEMY_NPC:
+            return BODY, 1 << TAG_PLAYER
+        return 0, 0
+
+
+# --------------------------------------------------------------
+#  CAMADAS (tipos de collider)
+# --------------------------------------------------------------
+BODY = CollisionLayers.type_bit("body")
+HURT_BOX = CollisionLayers.type_bit("hurt_box")
+ATTACK_BOX = CollisionLayers.type_bit("attack_box")
+ITEM = CollisionLayers.type_bit("item")
+PLAYER_CHECK = CollisionLayers.type_bit("player_check")
+TERRAIN = CollisionLayers.type_bit("terrain")
+DOOR = CollisionLayers.type_bit("door")
+ALARM = CollisionLayers.type_bit("alarm")
+BARRIER = CollisionLayers.type_bit("barrier")
+
+SOLID = TERRAIN | DOOR | ALARM | BARRIER
+
+# --------------------------------------------------------------
+#  TAGS (donos dos colliders)
+# --------------------------------------------------------------
+TAG_NONE = CollisionLayers.tag_id(None)
+TAG_PLAYER = CollisionLayers.tag_id("player")
+TAG_ENEMY_NPC = CollisionLayers.tag_id("enemy_npc")
+TAG_PROJECTILE = CollisionLayers.tag_id("projectile")
+
+ALL_TAGS = -1  # Todos os bits ligados, inclusive de tags registradas depois
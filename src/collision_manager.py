@@ -1,6 +1,9 @@
 # collision_manager.py
 import pygame
 from typing import List, Tuple, Optional
+from spatial_hash import SpatialHash
+from collision_layers import (CollisionLayers, BODY, HURT_BOX, ITEM, PLAYER_CHECK,
+                              DOOR, ALARM, BARRIER, TAG_NONE, TAG_PLAYER, TAG_ENEMY_NPC, TAG_PROJECTILE)
 
 
 class CollisionManager:
@@ -9,6 +12,9 @@ class CollisionManager:
     # --------------------------------------------------------------
     _instance: Optional["CollisionManager"] = None
 
+    # Lado de cada célula da grade espacial, em tiles do mapa
+    CELL_SIZE_IN_TILES = 4
+
     def __new__(cls, *args, **kwargs):
         if cls._instance is None:
             cls._instance = super().__new__(cls)
@@ -27,12 +33,75 @@ class CollisionManager:
         self.world_width = world_width
         self.door_triggered: Optional[Tuple[str, Tuple[float, float]]] = None
         self.alarm_triggered = False
+        self.damaged_this_frame = set()  # Alvos que já levaram dano no frame (um acerto por frame)
+        self.sprite_list = None  # SpriteList do nível: recebe as áreas calculadas para a grade dinâmica
+
+        # Grades espaciais: estáticos indexados no carregamento, dinâmicos a cada frame
+        self.static_index = SpatialHash(24 * self.CELL_SIZE_IN_TILES)
+        self.dynamic_index = SpatialHash(24 * self.CELL_SIZE_IN_TILES)
 
     # --------------------------------------------------------------
     #  MÉTODOS
     # --------------------------------------------------------------
+    @staticmethod
+    def _bounds(obj) -> pygame.Rect:
+        """Retângulo que envolve o rect do objeto e todos os seus colliders."""
+        if not obj.colliders:
+            return obj.rect
+        return obj.rect.unionall([collider.rect for collider in obj.colliders])
+
+    @staticmethod
+    def _static_bounds(obj) -> pygame.Rect:
+        if not obj.colliders:
+            return obj.rect
+        return obj.colliders[0].rect.unionall([collider.rect for collider in obj.colliders[1:]])
+
+    @staticmethod
+    def _tag_bit(obj) -> int:
+        """Bit da tag do objeto, lido do collider (internado na construção)."""
+        return obj.colliders[0].tag_bit if obj.colliders else 1 << TAG_NONE
+
+    def build_static_index(self, static_objects, tile_width):
+        """Indexa os objetos estáticos do nível (chamado uma vez ao carregar o mapa)."""
+        self.static_objects = static_objects
+        cell_size = tile_width * self.CELL_SIZE_IN_TILES
+        self.static_index.clear(cell_size)
+        self.dynamic_index.clear(cell_size)
+        for static in static_objects:
+            self.static_index.insert(static, self._static_bounds(static))
+
+    def add_static(self, static):
+        self.static_index.insert(static, self._static_bounds(static))
+
+    def remove_static(self, static):
+        self.static_index.remove(static)
+
+    def refresh_static(self, static):
+        """Atualiza a posição na grade de um estático cujo collider mudou (ex: terreno crescendo)."""
+        if static in self.static_index:
+            self.static_index.move(static, self._static_bounds(static))
+
+    def _move_dynamic(self, dynamic_object):
+        """Reposiciona o objeto na grade dinâmica e, com a mesma área, na grade de desenho."""
+        bounds = self._bounds(dynamic_object)
+        self.dynamic_index.move(dynamic_object, bounds)
+        if self.sprite_list is not None:
+            self.sprite_list.move(dynamic_object, bounds)
+
+    def _sync_dynamic_index(self):
+        index = self.dynamic_index
+        for order, dynamic_object in enumerate(self.dynamic_objects):
+            self._move_dynamic(dynamic_object)
+            index.order[dynamic_object] = order
+        if len(index) != len(self.dynamic_objects):
+            present = set(self.dynamic_objects)
+            for item in [item for item in index.ranges if item not in present]:
+                index.remove(item)
+
     def update(self, dynamic_objects):
         self.dynamic_objects = dynamic_objects
+        self.damaged_this_frame.clear()
+        self._sync_dynamic_index()
         objects_to_remove = []
 
         for dynamic_object in self.dynamic_objects:
@@ -43,45 +112,55 @@ class CollisionManager:
 
     def _handle_collisions(self, dynamic_object, objects_to_remove):
         for dynamic_collider in dynamic_object.colliders:
-            if not dynamic_collider.active:
+            # Máscara zero: o collider nunca inicia testes (ex: attack_box)
+            if not dynamic_collider.active or not dynamic_collider.mask:
                 continue
             self._handle_collider_collisions(dynamic_object, dynamic_collider, objects_to_remove)
 
     def _handle_collider_collisions(self, dynamic_object, dynamic_collider, objects_to_remove):
-        if dynamic_collider.type == "body":
+        layer = dynamic_collider.layer
+        if layer == BODY:
             self._handle_body_collision(dynamic_object, dynamic_collider, objects_to_remove)
-        elif dynamic_collider.type == "player_check":
+        elif layer == PLAYER_CHECK:
             self._handle_player_detection(dynamic_object, dynamic_collider)
-        elif dynamic_collider.type == "hurt_box":
+        elif layer == HURT_BOX:
             self._handle_hurt_collision(dynamic_object, dynamic_collider)
-        elif dynamic_collider.type == "item":
+        elif layer == ITEM:
             self._handle_item_collision(dynamic_object, dynamic_collider)
 
     def _handle_body_collision(self, dynamic_object, dynamic_collider, objects_to_remove):
         ground_collision_detected = False
-        for static in self.static_objects:
+        mask = dynamic_collider.mask
+        tag_id = dynamic_collider.tag_id
+        is_player = tag_id == TAG_PLAYER
+        is_npc = CollisionLayers.is_npc(tag_id)
+        # Margem do tamanho do collider cobre estáticos alcançados após um empurrão
+        search_rect = dynamic_collider.rect.inflate(dynamic_collider.rect.width * 2, dynamic_collider.rect.height * 2)
+        for static in self.static_index.query(search_rect):
             for static_collider in static.colliders:
-                if not dynamic_collider.rect.colliderect(static_collider.rect):
+                static_layer = static_collider.layer
+                # Pares fora da máscara (ex: player x barreira) nem chegam ao teste de retângulo
+                if not static_layer & mask or not static_collider.active:
                     continue
-                if not static_collider.active or not dynamic_collider.active:
+                if not dynamic_collider.rect.colliderect(static_collider.rect):
                     continue
 
-                if static_collider.type == "barrier" and dynamic_object.tag == "player":
-                    continue
-                if static_collider.type == "door" and dynamic_object.tag == "player":
-                    self.door_triggered = (static.target_map, static.player_spawn)
-                    continue
-                if static_collider.type == "alarm" and dynamic_object.tag == "player":
-                    self.alarm_triggered = True
-                    if dynamic_object.dash_timer > 0:
-                        dynamic_object.dash_timer = 0
-                        dynamic_object.speed_vector.x = 0
-                    continue
+                if is_player:
+                    if static_layer == DOOR:
+                        self.door_triggered = (static.target_map, static.player_spawn)
+                        continue
+                    if static_layer == ALARM:
+                        self.alarm_triggered = True
+                        if dynamic_object.dash_timer > 0:
+                            dynamic_object.dash_timer = 0
+                            dynamic_object.speed_vector.x = 0
+                        continue
 
-                if dynamic_object.tag == "projectile":
+                if tag_id == TAG_PROJECTILE:
                     objects_to_remove.append(dynamic_object)
                     return
 
+                turns_around = is_npc and not (static_layer == BARRIER and tag_id == TAG_ENEMY_NPC)
                 intersection = dynamic_collider.rect.clip(static_collider.rect)
                 largura_invasao = intersection.width
                 altura_invasao = intersection.height
@@ -89,14 +168,12 @@ class CollisionManager:
                 if largura_invasao < altura_invasao:
                     if dynamic_object.rect.centerx < static_collider.rect.centerx:
                         dynamic_object.position.x -= largura_invasao + dynamic_collider.offset[0]
-                        if "npc" in dynamic_object.tag:
-                            if not (static_collider.type == "barrier" and dynamic_object.tag == "enemy_npc"):
-                                dynamic_object.facing_right = False
+                        if turns_around:
+                            dynamic_object.facing_right = False
                     else:
                         dynamic_object.position.x += largura_invasao + dynamic_collider.offset[0]
-                        if "npc" in dynamic_object.tag:
-                            if not (static_collider.type == "barrier" and dynamic_object.tag == "enemy_npc"):
-                                dynamic_object.facing_right = True
+                        if turns_around:
+                            dynamic_object.facing_right = True
                     dynamic_object.speed_vector.x = 0
                 else:
                     if dynamic_object.rect.centery < static_collider.rect.centery:
@@ -114,38 +191,46 @@ class CollisionManager:
                         dynamic_object.speed_vector.y = 0
 
                 dynamic_object.sync_position()
+                self._move_dynamic(dynamic_object)
 
         self._detect_is_on_ground(ground_collision_detected, dynamic_object)
 
     def _handle_hurt_collision(self, dynamic_object, hurt_collider):
-        for other_object in self.dynamic_objects:
-            if other_object is dynamic_object or other_object.tag == "enemy_npc" and dynamic_object.tag == "enemy_npc":
-                continue
-            if other_object.tag == "projectile" and other_object.owner == dynamic_object:
+        mask = hurt_collider.mask
+        target_tags = hurt_collider.target_tags
+        for other_object in self.dynamic_index.query(hurt_collider.rect):
+            if other_object is dynamic_object:
                 continue
 
             for other_collider in other_object.colliders:
-                if (other_collider.type == "attack_box" and
-                    hurt_collider.rect.colliderect(other_collider.rect) and
-                    other_collider.active):
-
-                    if hasattr(other_object, "already_hit_targets"):
-                        if dynamic_object in other_object.already_hit_targets:
-                            continue
-                        other_object.already_hit_targets.add(dynamic_object)
-                        if other_object.tag in ("player", "projectile"):
-                            other_object.handle_hit()
-
-                    dynamic_object.handle_damage(other_object.damage, other_object.facing_right)
-                    if other_object.tag == "projectile":
-                        other_object.marked_for_removal = True
-                    return
+                # Matriz de tags: descarta pares que nunca causam dano (ex: inimigo x inimigo)
+                if (not other_collider.layer & mask or not other_collider.active or
+                        not other_collider.tag_bit & target_tags):
+                    continue
+                other_tag = other_collider.tag_id
+                if other_tag == TAG_PROJECTILE and other_object.owner == dynamic_object:
+                    break
+                if not hurt_collider.rect.colliderect(other_collider.rect):
+                    continue
+
+                if hasattr(other_object, "already_hit_targets"):
+                    if dynamic_object in other_object.already_hit_targets:
+                        continue
+                    other_object.already_hit_targets.add(dynamic_object)
+                    if other_tag == TAG_PLAYER or other_tag == TAG_PROJECTILE:
+                        other_object.handle_hit()
+
+                dynamic_object.handle_damage(other_object.damage, other_object.facing_right)
+                self.damaged_this_frame.add(dynamic_object)
+                if other_tag == TAG_PROJECTILE:
+                    other_object.marked_for_removal = True
+                return
 
     def _handle_item_collision(self, dynamic_object, item_collider):
-        for other_object in self.dynamic_objects:
+        for other_object in self.dynamic_index.query(item_collider.rect):
             if other_object is dynamic_object:
                 continue
-            if other_object.tag == "player" and item_collider.rect.colliderect(other_object.rect):
+            if self._tag_bit(other_object) & item_collider.target_tags and item_collider.rect.colliderect(other_object.rect):
                 other_object.handle_pickup(dynamic_object)
                 dynamic_object.marked_for_removal = True
                 return
@@ -154,21 +239,22 @@ class CollisionManager:
         if ground_collision_detected:
             dynamic_object.on_ground = True
         elif hasattr(dynamic_object, "speed_vector") and dynamic_object.speed_vector.y > 0:
+            rect = dynamic_object.rect
+            feet_rect = pygame.Rect(rect.left, rect.bottom - 5, rect.width, 6)
             on_platform = any(
                 dynamic_object.rect.bottom >= static_collider.rect.top and
                 dynamic_object.rect.bottom <= static_collider.rect.top + 5 and
                 dynamic_object.rect.left < static_collider.rect.right and
                 dynamic_object.rect.right > static_collider.rect.left
-                for static in self.static_objects
+                for static in self.static_index.query(feet_rect)
                 for static_collider in static.colliders
             )
             dynamic_object.on_ground = on_platform
 
     def _handle_player_detection(self, dynamic_object, detection_collider):
-        if dynamic_object.tag != "enemy_npc":
-            return
-        for other_object in self.dynamic_objects:
-            if other_object.tag == "player" and detection_collider.rect.colliderect(other_object.rect):
+        for other_object in self.dynamic_index.query(detection_collider.rect):
+            if (self._tag_bit(other_object) & detection_collider.target_tags and
+                    detection_collider.rect.colliderect(other_object.rect)):
                 dynamic_object.player_target = other_object
                 dynamic_object.player_detected = True
                 return
@@ -0,0 +1,67 @@
+# command_buffer.py
+from typing import Any, List, Optional, Tuple
+
+
+class CommandBuffer:
+    """Pedidos de criação e remoção de objetos feitos durante o tick (ex: escudos dos feitiços).
+
+    Quem cria o objeto só registra o pedido; o EntityManager aplica a fila uma vez por tick
+    no registro de entidades, no índice de colisão e na lista de desenho, na ordem em que
+    os pedidos chegaram.
+    """
+
+    SPAWN_ENTITY = "spawn_entity"  # Entidade dinâmica (registro + desenho)
+    SPAWN_STATIC = "spawn_static"  # Objeto sólido do cenário (estáticos + colisão + desenho)
+    DESPAWN = "despawn"
+
+    # --------------------------------------------------------------
+    #  SINGLETON
+    # --------------------------------------------------------------
+    _instance: Optional["CommandBuffer"] = None
+
+    def __new__(cls, *args, **kwargs):
+        if cls._instance is None:
+            cls._instance = super().__new__(cls)
+        return cls._instance
+
+    # --------------------------------------------------------------
+    #  __init__ (executado apenas uma vez)
+    # --------------------------------------------------------------
+    def __init__(self):
+        if hasattr(self, "_initialized"):
+            return
+        self._initialized = True
+
+        self.commands: List[Tuple[str, Any]] = []
+
+    # --------------------------------------------------------------
+    #  MÉTODOS
+    # --------------------------------------------------------------
+    def spawn_entity(self, obj):
+        self.commands.append((self.SPAWN_ENTITY, obj))
+
+    def spawn_static(self, obj):
+        self.commands.append((self.SPAWN_STATIC, obj))
+
+    def despawn(self, obj):
+        self.commands.append((self.DESPAWN, obj))
+
+    def drain(self) -> List[Tuple[str, Any]]:
+        """Entrega os pedidos acumulados e esvazia a fila."""
+        commands, self.commands = self.commands, []
+        return commands
+
+    def clear(self):
+        self.commands.clear()
+
+    def __len__(self) -> int:
+        return len(self.commands)
+
+    # --------------------------------------------------------------
+    #  MÉTODO DE FÁBRICA
+    # --------------------------------------------------------------
+    @classmethod
+    def get_instance(cls) -> "CommandBuffer":
+        if cls._instance is None:
+            cls()
+        return cls._instance
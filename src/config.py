@@ -3,6 +3,13 @@ JUMP_SPEED = 500
 GRAVITY = 1000
 DELTA_TIME = 0
 
+# Loop de jogo: simulação em passo fixo, desacoplada da renderização
+FIXED_TIMESTEP = 1 / 120  # Duração de cada passo da simulação (120 Hz)
+MAX_FRAME_TIME = 0.25     # Limite do tempo de um frame, evita a "espiral da morte" após travadas
+MAX_FPS = 144             # Limite de quadros por segundo (0 = sem limite)
+
+DEBUG_COLLIDERS = False   # Desenho dos colliders ao iniciar (alternado em jogo com F1)
+
 
 RUNE_COLORS = {
         'fire_rune': (255, 0, 0),     # Example major rune
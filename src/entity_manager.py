@@ -2,9 +2,14 @@
 from objects.dynamic_objects.hammer_bot import HammerBot
 from objects.dynamic_objects.player import Player
 from objects.dynamic_objects.rune import Rune
+from objects.dynamic_objects.shield_instance import ShieldInstance
 from objects.dynamic_objects.drone import Drone
 from object_factory import ObjectFactory
-import random
+from collision_manager import CollisionManager
+from command_buffer import CommandBuffer
+from entity_store import ENEMIES, PICKUPS, SHIELDS, EntityStore
+from game_random import GameRandom
+from profiler import FrameProfiler
 import logging
 from pygame.math import Vector2
 from typing import Optional, Dict, Any
@@ -33,9 +38,6 @@ class EntityManager:
         logging.basicConfig(level=logging.INFO, format="%(asctime)s - %(levelname)s - %(message)s")
         self.logger = logging.getLogger(__name__)
 
-        self.entities = []
-        self.enemies = []
-
         # Efeitos de runas menores
         self.minor_rune_effects = [
             {"power": 5}, {"cost": -10}, {"cooldown": -2},
@@ -43,20 +45,29 @@ class EntityManager:
             {"power": 10, "cooldown": 8}, {"power": -5, "cooldown": -5},
             {"cost": -5, "cooldown": -5, "power": -8}
         ]
-        self.available_effects = self.minor_rune_effects.copy()
-        self.used_effects = []
 
-        # Mapa de atualização por tipo
-        self.update_map = {
-            Player: self._update_player,
-            HammerBot: self._update_hammer_bot,
-            Rune: self._update_rune,
-            Drone: self._update_drone
-        }
+        # Registro das entidades (handles estáveis, tabelas por arquétipo e por tipo)
+        self.store = EntityStore()
+        self.player_handle: Optional[int] = None
+        self.store.register_system(Player, self._update_entities)
+        self.store.register_system(HammerBot, self._update_with_statics)
+        self.store.register_system(Rune, self._update_entities)
+        self.store.register_system(Drone, self._update_entities)
 
         # Estado de drop de runa menor
-        default_state = {"first_drop": True, "streak": 0, "base_chance": 0.2, "increment": 0.1}
-        self.minor_rune_drop_state = minor_rune_drop_state if minor_rune_drop_state is not None else default_state
+        self.reset_minor_rune_drops(minor_rune_drop_state)
+
+    # --------------------------------------------------------------
+    #  PROPRIEDADES
+    # --------------------------------------------------------------
+    @property
+    def entities(self):
+        """Todas as entidades (tabela densa do registro: a ordem muda com as remoções)."""
+        return self.store.entities.items
+
+    @property
+    def enemies(self):
+        return self.store.of_kind(ENEMIES)
 
     # --------------------------------------------------------------
     #  MÉTODOS PÚBLICOS
@@ -64,32 +75,63 @@ class EntityManager:
     def add_entity(self, entity, is_enemy=False):
         if not hasattr(entity, 'update'):
             return
-        if entity not in self.entities:
-            self.entities.append(entity)
-            if is_enemy:
-                self.enemies.append(entity)
+        kinds = []
+        if is_enemy:
+            kinds.append(ENEMIES)
+        if isinstance(entity, Rune):
+            kinds.append(PICKUPS)
+        elif isinstance(entity, ShieldInstance):
+            kinds.append(SHIELDS)
+        handle = self.store.add(entity, kinds)
+        if isinstance(entity, Player):
+            self.player_handle = handle
+
+    def reset(self, player=None):
+        """Esvazia o registro, mantendo só o jogador (se houver).
+
+        Pedidos pendentes do nível anterior são descartados; os escudos que o jogador ainda
+        mantém são pedidos de novo e entram no nível novo no primeiro tick.
+        """
+        self.store.clear()
+        self.player_handle = None
+        CommandBuffer.get_instance().clear()
+        if player:
+            self.add_entity(player)
+            player.spell_system.respawn()
+
+    def reset_minor_rune_drops(self, minor_rune_drop_state: Optional[Dict[str, Any]] = None):
+        """Volta o sorteio de runas menores ao início da partida (ou ao estado dado)."""
+        self.available_effects = self.minor_rune_effects.copy()
+        self.used_effects = []
+        default_state = {"first_drop": True, "streak": 0, "base_chance": 0.2, "increment": 0.1}
+        self.minor_rune_drop_state = minor_rune_drop_state if minor_rune_drop_state is not None else default_state
 
-    def remove_entity(self, entity, score_callback=None, all_sprites=None, dead_callback=None, current_dead_ids=None):
-        if entity not in self.entities:
+    def remove_entities(self, entities, score_callback=None, all_sprites=None, dead_callback=None, current_dead_ids=None):
+        """Remove um lote de entidades: efeitos de cada uma (pontos, drops) e depois as tabelas de uma vez."""
+        entities = [entity for entity in entities if self.store.contains(entity)]
+        if not entities:
             return
 
-        self.entities.remove(entity)
-        if entity in self.enemies:
-            self.enemies.remove(entity)
-            print(f"Removendo inimigo: {type(entity).__name__} com ID: {getattr(entity, 'id', 'N/A')}")
+        enemies = self.store.kind_table(ENEMIES)
+        for entity in entities:
+            if entity.handle in enemies:
+                self._on_enemy_removed(entity, score_callback, all_sprites, dead_callback, current_dead_ids)
+        self.store.remove_many(entities)
+
+        if all_sprites:
+            all_sprites.remove_many(entity for entity in entities if not isinstance(entity, (HammerBot, Drone)))
 
-            if current_dead_ids is not None and (not hasattr(entity, 'id') or entity.id not in current_dead_ids):
-                if self._should_drop_minor_rune():
-                    self._generate_minor_rune(entity, all_sprites)
+    def _on_enemy_removed(self, entity, score_callback, all_sprites, dead_callback, current_dead_ids):
+        print(f"Removendo inimigo: {type(entity).__name__} com ID: {getattr(entity, 'id', 'N/A')}")
 
-            if score_callback:
-                score_callback(100)
-            if dead_callback and hasattr(entity, 'id'):
-                dead_callback(entity.id)
+        if current_dead_ids is not None and (not hasattr(entity, 'id') or entity.id not in current_dead_ids):
+            if self._should_drop_minor_rune():
+                self._generate_minor_rune(entity, all_sprites)
 
-        if not isinstance(entity, (HammerBot, Drone)):
-            if all_sprites and entity in all_sprites:
-                all_sprites.remove(entity)
+        if score_callback:
+            score_callback(100)
+        if dead_callback and hasattr(entity, 'id'):
+            dead_callback(entity.id)
 
     def _should_drop_minor_rune(self) -> bool:
         state = self.minor_rune_drop_state
@@ -100,7 +142,7 @@ class EntityManager:
         else:
             chance = min(1.0, state["base_chance"] + state["increment"] * state["streak"])
             self.logger.info(f"Chance de drop: {chance*100:.1f}% (streak: {state['streak']})")
-            if random.random() < chance:
+            if GameRandom.get_instance().random() < chance:
                 state["streak"] = 0
                 self.logger.info("Runa menor dropada - streak resetado")
                 return True
@@ -114,7 +156,7 @@ class EntityManager:
             self.available_effects = self.used_effects.copy()
             self.used_effects = []
 
-        effect = random.choice(self.available_effects)
+        effect = GameRandom.get_instance().choice(self.available_effects)
         self.available_effects.remove(effect)
         self.used_effects.append(effect)
 
@@ -133,63 +175,83 @@ class EntityManager:
             self.logger.info(f"Runa menor gerada com efeito: {effect}")
 
     def update(self, delta_time, static_objects, score_callback, all_sprites, dead_callback=None, current_dead_ids=None):
-        for entity in self.entities[:]:
-            if hasattr(entity, "marked_for_removal") and entity.marked_for_removal:
-                self.remove_entity(entity, score_callback, all_sprites, dead_callback, current_dead_ids)
-            else:
-                update_func = self.update_map.get(type(entity))
-                if update_func:
-                    update_func(entity, delta_time, static_objects, all_sprites)
+        # Fecha o frame anterior: tudo o que foi marcado sai num único passe, antes dos sistemas rodarem
+        marked = [entity for entity in self.entities if entity.marked_for_removal]
+        if marked:
+            self.remove_entities(marked, score_callback, all_sprites, dead_callback, current_dead_ids)
+        self.store.update(delta_time, static_objects)
 
-        for static in static_objects:
-            if hasattr(static, "marked_for_removal") and static.marked_for_removal:
-                static_objects.remove(static)
-                if static in all_sprites:
-                    all_sprites.remove(static)
+        removed_statics = [static for static in static_objects if static.marked_for_removal]
+        if removed_statics:
+            self._remove_statics(removed_statics, static_objects, all_sprites)
 
         player = self.get_player()
         if player:
             player_pos = [player.position.x + player.size[0] / 2, player.position.y + player.size[1] / 2]
-            player.spell_system.update(delta_time, player_pos)
-
-            for spell in player.spell_system.spellbook:
-                if not spell:
-                    continue
-                if hasattr(spell, "projectiles"):
-                    for proj in spell.projectiles:
-                        if proj not in self.entities:
-                            self.add_entity(proj)
-                            if proj not in all_sprites:
-                                all_sprites.append(proj)
-                if hasattr(spell, "shields"):
-                    for shield in spell.shields:
-                        if spell.major_rune and spell.major_rune.name == "fan":
-                            if shield not in static_objects:
-                                static_objects.append(shield)
-                                if shield not in all_sprites:
-                                    all_sprites.append(shield)
-                        elif shield not in self.entities:
-                            self.add_entity(shield)
-                            if shield not in all_sprites:
-                                all_sprites.append(shield)
-
-    def _update_player(self, entity, delta_time, static_objects, all_sprites):
-        entity.update(delta_time)
-
-    def _update_hammer_bot(self, entity, delta_time, static_objects, all_sprites):
-        entity.update(delta_time, static_objects)
-
-    def _update_rune(self, entity, delta_time, static_objects, all_sprites):
-        entity.update(delta_time)
-
-    def _update_drone(self, entity, delta_time, static_objects, all_sprites):
-        entity.update(delta_time)
+            with FrameProfiler.get_instance().section("update.entities.spells"):
+                player.spell_system.update(delta_time, player_pos)
+
+        # Objetos que os feitiços criaram ou descartaram neste tick (projéteis ficam no ProjectileStore)
+        self.flush_commands(static_objects, all_sprites)
+
+    def flush_commands(self, static_objects, all_sprites):
+        """Aplica a fila do CommandBuffer no registro, no índice de colisão e na lista de desenho."""
+        commands = CommandBuffer.get_instance().drain()
+        if not commands:
+            return
+
+        collision_manager = CollisionManager.get_instance()
+        despawned_entities, despawned_statics = [], []
+        for command, obj in commands:
+            if command == CommandBuffer.SPAWN_ENTITY:
+                self.add_entity(obj)
+                if obj not in all_sprites:
+                    all_sprites.append(obj)
+            elif command == CommandBuffer.SPAWN_STATIC:
+                if obj not in collision_manager.static_index:
+                    static_objects.append(obj)
+                    collision_manager.add_static(obj)
+                    if obj not in all_sprites:
+                        all_sprites.append(obj)
+            elif self.store.contains(obj):
+                despawned_entities.append(obj)
+            elif obj in collision_manager.static_index:
+                despawned_statics.append(obj)
+
+        if despawned_entities:
+            self.remove_entities(despawned_entities, all_sprites=all_sprites)
+        if despawned_statics:
+            self._remove_statics(despawned_statics, static_objects, all_sprites)
+
+    @staticmethod
+    def _remove_statics(statics, static_objects, all_sprites):
+        removed = set(statics)
+        static_objects[:] = [static for static in static_objects if static not in removed]
+        for static in removed:
+            CollisionManager.get_instance().remove_static(static)
+        all_sprites.remove_many(removed)
+
+    def resolve_projectile_hits(self):
+        """Dano dos projéteis do jogador nos inimigos, depois das colisões do frame."""
+        player = self.get_player()
+        if player:
+            player.spell_system.resolve_hits(self.enemies)
+
+    # --------------------------------------------------------------
+    #  SISTEMAS (um por arquétipo, chamados com a tabela inteira)
+    # --------------------------------------------------------------
+    @staticmethod
+    def _update_entities(entities, delta_time, static_objects):
+        for entity in entities:
+            entity.update(delta_time)
+
+    @staticmethod
+    def _update_with_statics(entities, delta_time, static_objects):
+        for entity in entities:
+            entity.update(delta_time, static_objects)
 
     def get_player(self):
-        for entity in self.entities:
-            if isinstance(entity, Player):
-                return entity
-        return None
+        return self.store.get(self.player_handle)
 
     def check_completion(self):
         return not self.enemies
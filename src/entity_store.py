@@ -0,0 +1,159 @@
+# entity_store.py
+from typing import Callable, Dict, Iterable, List, Optional, Sequence
+
+# Sistema: atualiza de uma vez todas as entidades de um arquétipo -> (entidades, delta_time, static_objects)
+System = Callable[[List, float, List], None]
+
+# Tipos de entidade com tabela própria (os projéteis vivem no ProjectileStore do feitiço)
+ENEMIES = "enemies"
+PICKUPS = "pickups"
+SHIELDS = "shields"
+
+
+class DenseTable:
+    """Lista densa indexada pelo handle das entidades, com remoção por troca com o último.
+
+    Inserção, remoção e pertinência são O(1); a ordem da lista muda quando algo sai do meio.
+    """
+
+    def __init__(self):
+        self.items: List = []
+        self.slots: Dict[int, int] = {}  # handle -> posição em items
+
+    def add(self, handle: int, item):
+        self.slots[handle] = len(self.items)
+        self.items.append(item)
+
+    def remove(self, handle: int):
+        slot = self.slots.pop(handle, None)
+        if slot is None:
+            return
+        last = self.items.pop()
+        if slot < len(self.items):
+            self.items[slot] = last
+            self.slots[last.handle] = slot
+
+    def get(self, handle: Optional[int]):
+        slot = self.slots.get(handle)
+        return self.items[slot] if slot is not None else None
+
+    def clear(self):
+        self.items.clear()  # Mesma lista: quem guardou a referência continua vendo a tabela
+        self.slots.clear()
+
+    def __contains__(self, handle) -> bool:
+        return handle in self.slots
+
+    def __len__(self) -> int:
+        return len(self.items)
+
+    def __iter__(self):
+        return iter(self.items)
+
+
+class Archetype(DenseTable):
+    """Tabela densa das entidades de uma mesma classe, com o sistema que as atualiza."""
+
+    def __init__(self, entity_type: type, system: Optional[System]):
+        super().__init__()
+        self.entity_type = entity_type
+        self.system = system  # None: a entidade é atualizada por quem a criou (ex: escudos pelo feitiço)
+
+
+class EntityStore:
+    """Registro das entidades do nível, com handles inteiros estáveis.
+
+    Cada entidade recebe um handle ao entrar e fica em tabelas densas: a de todas as
+    entidades, a do seu arquétipo (a classe concreta) e as dos tipos pedidos (inimigos,
+    coletáveis, escudos). Entrar, sair e testar pertinência são O(1) em todas elas.
+
+    O sistema de um arquétipo é resolvido uma vez, quando a primeira entidade da classe
+    chega, pela MRO: um novo tipo de inimigo herda o sistema da classe base registrada.
+    A atualização percorre tabela por tabela, sem despacho nem hasattr por entidade.
+    """
+
+    def __init__(self):
+        self.systems: Dict[type, System] = {}
+        self.archetypes: Dict[type, Archetype] = {}
+        self.entities = DenseTable()  # Todas as entidades
+        self.kinds: Dict[str, DenseTable] = {}
+        self._next_handle = 0  # Handles não são reaproveitados
+
+    def register_system(self, entity_type: type, system: System):
+        self.systems[entity_type] = system
+        for archetype in self.archetypes.values():
+            archetype.system = self._resolve_system(archetype.entity_type)
+
+    def _resolve_system(self, entity_type: type) -> Optional[System]:
+        for base in entity_type.__mro__:
+            system = self.systems.get(base)
+            if system is not None:
+                return system
+        return None
+
+    # --------------------------------------------------------------
+    #  REGISTRO
+    # --------------------------------------------------------------
+    def add(self, entity, kinds: Sequence[str] = ()) -> int:
+        """Registra a entidade (se ainda não estiver) e devolve o seu handle."""
+        if self.contains(entity):
+            return entity.handle
+
+        handle = self._next_handle
+        self._next_handle += 1
+        entity.handle = handle
+        self.entities.add(handle, entity)
+
+        entity_type = type(entity)
+        archetype = self.archetypes.get(entity_type)
+        if archetype is None:
+            archetype = Archetype(entity_type, self._resolve_system(entity_type))
+            self.archetypes[entity_type] = archetype
+        archetype.add(handle, entity)
+
+        for kind in kinds:
+            self.kind_table(kind).add(handle, entity)
+        return handle
+
+    def remove_many(self, entities: Iterable):
+        """Tira as entidades de todas as tabelas de uma vez (troca com o último em cada uma)."""
+        for entity in entities:
+            if not self.contains(entity):
+                continue
+            handle = entity.handle
+            self.entities.remove(handle)
+            self.archetypes[type(entity)].remove(handle)
+            for table in self.kinds.values():
+                table.remove(handle)
+
+    def contains(self, entity) -> bool:
+        return self.entities.get(entity.handle) is entity
+
+    def get(self, handle: Optional[int]):
+        """Entidade do handle, ou None se ela já saiu do registro."""
+        return self.entities.get(handle)
+
+    def kind_table(self, kind: str) -> DenseTable:
+        table = self.kinds.get(kind)
+        if table is None:
+            table = self.kinds[kind] = DenseTable()
+        return table
+
+    def of_kind(self, kind: str) -> List:
+        """Entidades do tipo (a tabela em si: não alterar)."""
+        return self.kind_table(kind).items
+
+    def clear(self):
+        self.entities.clear()
+        for archetype in self.archetypes.values():
+            archetype.clear()
+        for table in self.kinds.values():
+            table.clear()
+
+    # --------------------------------------------------------------
+    #  SISTEMAS
+    # --------------------------------------------------------------
+    def update(self, delta_time: float, static_objects: List):
+        for archetype in list(self.archetypes.values()):
+            if archetype.system is not None and archetype.items:
+                archetype.system(archetype.items, delta_time, static_objects)
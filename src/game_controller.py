@@ -1,3 +1,4 @@
+import os
 import pygame
 import time
 import logging
@@ -6,27 +7,46 @@ from datetime import datetime
 from level import Level
 from levelArena import LevelArena
 from menu.menu import Menu
-from config import DELTA_TIME
+from entity_manager import EntityManager
+from config import DELTA_TIME, FIXED_TIMESTEP, MAX_FRAME_TIME, MAX_FPS
 from music_manager import MusicManager
 from collections import defaultdict
+from input_manager import InputManager
+from game_random import GameRandom
+from replay import Replay
+from profiler import FrameProfiler
 
 class GameController:
-    def __init__(self, width=1600, height=900, title="Manastride"):
+    def __init__(self, width=1600, height=900, title="Manastride", max_fps=MAX_FPS, headless=False,
+                 seed=None, record_path=None):
         logging.basicConfig(level=logging.INFO, format="%(asctime)s - %(levelname)s - %(message)s")
         self.logger = logging.getLogger(__name__)
+        self.headless = headless
+        if headless:
+            # Sem janela nem placa de som: drivers SDL "dummy"
+            os.environ.setdefault("SDL_VIDEODRIVER", "dummy")
+            os.environ.setdefault("SDL_AUDIODRIVER", "dummy")
         pygame.init()
         self.width = width
         self.height = height
-        self.screen = pygame.display.set_mode((self.width, self.height))
+        if headless:
+            pygame.mixer.quit()  # AssetLoader.load_sound passa a devolver sons mudos
+            self.screen = pygame.Surface((self.width, self.height))
+        else:
+            self.screen = pygame.display.set_mode((self.width, self.height))
+            pygame.display.set_caption(title)
         self.starter_level = "starter"
-        pygame.display.set_caption(title)
         self.clock = pygame.time.Clock()
         self.running = True
         self.paused = False
         self.game_started = False
         self.game_ended = False
         self.last_time = time.perf_counter()
-        self.music_manager = MusicManager()
+        self.max_fps = max_fps
+        self.accumulator = 0.0  # Tempo ainda não simulado, consumido em passos de FIXED_TIMESTEP
+        self.seed = seed  # Semente fixa da simulação (None sorteia uma a cada partida)
+        self.record_path = record_path  # Arquivo onde gravar o replay da partida, se houver
+        self.music_manager = MusicManager(enabled=not headless)
         self.menu = Menu(self.screen, self.width, self.height, None)
         self.current_level_name = None
         self.player_name = None
@@ -73,6 +93,18 @@ class GameController:
                 self.logger.info("Evento QUIT recebido - saindo do jogo")
                 self.running = False
 
+            elif event.type == pygame.KEYDOWN and event.key == pygame.K_F1:
+                Level.show_colliders = not Level.show_colliders
+
+            elif event.type == pygame.KEYDOWN and event.key == pygame.K_F3:
+                FrameProfiler.get_instance().toggle()
+
+            elif event.type == pygame.KEYDOWN and event.key == pygame.K_F4:
+                profiler = FrameProfiler.get_instance()
+                if profiler.enabled:
+                    path = profiler.dump_chrome_trace()
+                    self.logger.info(f"Trace do profiler salvo em {path}")
+
             elif event.type == pygame.KEYDOWN and event.key == pygame.K_ESCAPE:
                 if not self.paused:
                     # Apenas pausa o jogo — não deixa o Menu tratar o mesmo ESC
@@ -92,6 +124,7 @@ class GameController:
         start_game, self.running = self.menu.handle_input(events, False, self.running, mouse_pos)
         if start_game:
             self.logger.info("Iniciando o jogo")
+            self.begin_session(self.starter_level)
             self.load_level(self.starter_level)
             self.player = self.level.entity_manager.get_player()
             if self.player is None:
@@ -113,6 +146,7 @@ class GameController:
             self.player_score = self.total_score + (self.level.score if hasattr(self.level, 'score') else 0)
             self.logger.info(f"Dados do jogador capturados - Nome: {self.player_name}, Pontuação: {self.player_score}")
             self.save_score()
+            self.save_recording()
             if action == "Reiniciar":
                 self.logger.info("Reiniciando o jogo")
                 self.game_ended = False
@@ -131,26 +165,24 @@ class GameController:
     def process_gameplay(self, events, delta_time, mouse_pos):
         """Handle gameplay state, including paused and unpaused modes."""
         if self.paused:
+            self.accumulator = 0.0  # Não acumula tempo enquanto pausado
             self.paused, self.running = self.menu.handle_input(events, self.paused, self.running, mouse_pos)
             if self.paused:
                 self.menu.draw()
         else:
-            new_level_data = self.level.update(delta_time)
-            if new_level_data:
-                level_name, player_spawn, player, minor_rune_drop_state = new_level_data
-                print("Minor rune drop state on level change:", minor_rune_drop_state)
-                self.total_score += self.level.score
-                self.dead_enemies_by_level[self.current_level_name].extend(self.level.current_dead_ids)
-                self.logger.info(f"Carregando novo nível: {level_name}")
-                self.load_level(level_name, player, player_spawn, self.total_score, minor_rune_drop_state)
-                self.player = self.level.entity_manager.get_player()
-                if self.player is None:
-                    self.logger.error(f"Nenhum jogador encontrado ao carregar o nível {level_name}")
-                    self.running = False
-                else:
-                    self.menu.player = self.player
-                    self.current_level_name = level_name
-                    self.arena_music_loaded = False  # Reset flag ao carregar novo nível
+            # Simula em passos fixos o tempo acumulado; a renderização interpola o resto
+            self.accumulator += delta_time
+            profiler = FrameProfiler.get_instance()
+            while self.accumulator >= FIXED_TIMESTEP:
+                self.level.snapshot()
+                with profiler.section("update"):
+                    new_level_data = self.level.update(FIXED_TIMESTEP)
+                self.accumulator -= FIXED_TIMESTEP
+                if new_level_data:
+                    self.change_level(new_level_data)
+                    break
+                if self.level.is_completed:
+                    break
             # Verificar ativação da arena e carregar música específica
             if isinstance(self.level, LevelArena) and self.level.arena_activated and not self.arena_music_loaded:
                 self.logger.info("Arena ativada - carregando música da arena")
@@ -159,7 +191,25 @@ class GameController:
             if self.level.is_completed:
                 self.logger.info(f"Nível {self.current_level_name} concluído - exibindo tela de fim")
                 self.game_ended = True
-            self.level.draw()
+            with profiler.section("draw"):
+                self.level.draw(self.accumulator / FIXED_TIMESTEP)
+
+    def change_level(self, new_level_data):
+        """Load the level reached through a door, carrying over the player and score."""
+        level_name, player_spawn, player, minor_rune_drop_state = new_level_data
+        print("Minor rune drop state on level change:", minor_rune_drop_state)
+        self.total_score += self.level.score
+        self.dead_enemies_by_level[self.current_level_name].extend(self.level.current_dead_ids)
+        self.logger.info(f"Carregando novo nível: {level_name}")
+        self.load_level(level_name, player, player_spawn, self.total_score, minor_rune_drop_state)
+        self.player = self.level.entity_manager.get_player()
+        if self.player is None:
+            self.logger.error(f"Nenhum jogador encontrado ao carregar o nível {level_name}")
+            self.running = False
+        else:
+            self.menu.player = self.player
+            self.current_level_name = level_name
+            self.arena_music_loaded = False  # Reset flag ao carregar novo nível
 
     def load_level(self, level_name, player=None, player_spawn=None, total_score=0, minor_rune_drop_state=None):  
         """Load a new level with the specified name and optional player spawn point."""
@@ -168,19 +218,82 @@ class GameController:
             self.level = LevelArena(self.screen, level_name, player, player_spawn, total_score, persistent_dead_ids, minor_rune_drop_state)
         else:
             self.level = Level(self.screen, level_name, player, player_spawn, total_score, persistent_dead_ids, minor_rune_drop_state)
+        # O tempo gasto carregando o mapa não deve ser simulado
+        self.accumulator = 0.0
+        self.last_time = time.perf_counter()
+
+    def begin_session(self, level_name):
+        """Seed the simulation RNG, reset the state that outlives a level and, if requested, start recording."""
+        seed = GameRandom.get_instance().seed(self.seed)
+        # O EntityManager é um singleton: o sorteio de runas menores não pode vir da sessão anterior
+        EntityManager.get_instance().reset_minor_rune_drops()
+        self.logger.info(f"Semente da simulação: {seed}")
+        if self.record_path:
+            InputManager.get_instance().start_recording(Replay(level_name, seed))
+
+    def save_recording(self):
+        """Write the recorded replay, if any, to record_path."""
+        replay = InputManager.get_instance().stop_recording()
+        if replay is None:
+            return
+        try:
+            replay.save(self.record_path)
+            self.logger.info(f"Replay salvo em {self.record_path} ({len(replay)} passos)")
+        except OSError as e:
+            self.logger.error(f"Erro ao salvar replay: {e}")
+
+    def play_replay(self, path, draw=False):
+        """Reproduce a recorded session step by step; returns the level active at the end."""
+        replay = Replay.load(path)
+        self.seed = replay.seed
+        return self.simulate(replay.level_name, len(replay), replay.pressed_at, draw, replay.spell_changes_at)
+
+    def simulate(self, level_name=None, steps=0, script=None, draw=False, spell_changes=None):
+        """Run the simulation headless in fixed steps, as fast as possible, driven by an input script.
+
+        spell_changes, if given, maps a step to the (spell, rune) menu edits applied before it.
+        Returns the level active at the end (it may differ from the first one after a door).
+        """
+        InputManager.get_instance().set_script(script)
+        level_name = level_name or self.starter_level
+        self.begin_session(level_name)
+        self.load_level(level_name, player=self.player)
+        self.player = self.level.entity_manager.get_player()
+        self.menu.player = self.player
+        self.current_level_name = level_name
+        self.game_started = True
+
+        for step in range(steps):
+            if spell_changes and self.player:
+                for spell_index, rune_index in spell_changes(step):
+                    self.menu.change_spell_rune(spell_index, rune_index)
+            new_level_data = self.level.update(FIXED_TIMESTEP)
+            if new_level_data:
+                self.change_level(new_level_data)
+            if self.level.is_completed or not self.running:
+                break
+            if draw:
+                self.level.draw()
+                if not self.headless:
+                    pygame.display.flip()
+        self.save_recording()
+        return self.level
 
     def run(self):
         """Main game loop."""
+        profiler = FrameProfiler.get_instance()
         while self.running:
+            profiler.begin_frame()
             current_time = time.perf_counter()
-            delta_time = (current_time - self.last_time)
+            delta_time = min(current_time - self.last_time, MAX_FRAME_TIME)
             self.last_time = current_time
 
-            events = pygame.event.get()
-            mouse_pos = pygame.mouse.get_pos()
+            with profiler.section("events"):
+                events = pygame.event.get()
+                mouse_pos = pygame.mouse.get_pos()
 
-            # Chama handle_events e verifica se o ESC foi usado
-            esc_consumed = self.handle_events(events)
+                # Chama handle_events e verifica se o ESC foi usado
+                esc_consumed = self.handle_events(events)
 
             if self.game_ended:
                 self.process_game_end(events)
@@ -193,6 +306,12 @@ class GameController:
                 else:
                     self.process_gameplay(events, delta_time, mouse_pos)
 
-            pygame.display.flip()
+            profiler.draw(self.screen)
+            with profiler.section("flip"):
+                pygame.display.flip()
+            with profiler.section("idle"):
+                self.clock.tick(self.max_fps)
+            profiler.end_frame()
 
+        self.save_recording()
         pygame.quit()
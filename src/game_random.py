@@ -0,0 +1,65 @@
+# game_random.py
+import random
+from typing import Any, List, Optional, Sequence
+
+
+class GameRandom:
+    """Gerador de números aleatórios da simulação, com semente conhecida para gravar e reproduzir partidas.
+
+    Aleatoriedade puramente cosmética (ex: qual som tocar) continua no módulo random global
+    para não alterar a sequência da simulação.
+    """
+
+    # --------------------------------------------------------------
+    #  SINGLETON
+    # --------------------------------------------------------------
+    _instance: Optional["GameRandom"] = None
+
+    def __new__(cls, *args, **kwargs):
+        if cls._instance is None:
+            cls._instance = super().__new__(cls)
+        return cls._instance
+
+    # --------------------------------------------------------------
+    #  __init__ (executado apenas uma vez)
+    # --------------------------------------------------------------
+    def __init__(self, seed: Optional[int] = None):
+        if hasattr(self, "_initialized"):
+            return
+        self._initialized = True
+
+        self.rng = random.Random()
+        self.seed_value = 0
+        self.seed(seed)
+
+    # --------------------------------------------------------------
+    #  MÉTODOS
+    # --------------------------------------------------------------
+    def seed(self, seed: Optional[int] = None) -> int:
+        """Reinicia a sequência; sem semente sorteia uma nova. Retorna a semente usada."""
+        if seed is None:
+            seed = random.SystemRandom().getrandbits(63)
+        self.seed_value = int(seed)
+        self.rng.seed(self.seed_value)
+        return self.seed_value
+
+    def random(self) -> float:
+        return self.rng.random()
+
+    def randint(self, a: int, b: int) -> int:
+        return self.rng.randint(a, b)
+
+    def choice(self, seq: Sequence[Any]) -> Any:
+        return self.rng.choice(seq)
+
+    def sample(self, population: Sequence[Any], k: int) -> List[Any]:
+        return self.rng.sample(population, k)
+
+    # --------------------------------------------------------------
+    #  MÉTODO DE FÁBRICA
+    # --------------------------------------------------------------
+    @classmethod
+    def get_instance(cls) -> "GameRandom":
+        if cls._instance is None:
+            cls()
+        return cls._instance
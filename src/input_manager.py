@@ -0,0 +1,95 @@
+# input_manager.py
+import pygame
+from typing import Callable, Iterable, Optional, Sequence, Union
+
+
+class ScriptedKeys:
+    """Estado de teclado indexável como o retorno de pygame.key.get_pressed()."""
+
+    def __init__(self, pressed: Iterable[int] = ()):
+        self.pressed = frozenset(pressed)
+
+    def __getitem__(self, key: int) -> bool:
+        return key in self.pressed
+
+
+# Roteiro de entrada: lista de teclas por passo, ou função passo -> teclas
+InputScript = Union[Sequence[Iterable[int]], Callable[[int], Iterable[int]]]
+
+
+class InputManager:
+    # --------------------------------------------------------------
+    #  SINGLETON
+    # --------------------------------------------------------------
+    _instance: Optional["InputManager"] = None
+
+    def __new__(cls, *args, **kwargs):
+        if cls._instance is None:
+            cls._instance = super().__new__(cls)
+        return cls._instance
+
+    # --------------------------------------------------------------
+    #  __init__ (executado apenas uma vez)
+    # --------------------------------------------------------------
+    def __init__(self):
+        if hasattr(self, "_initialized"):
+            return
+        self._initialized = True
+
+        self.script: Optional[InputScript] = None
+        self.step = 0  # Passos de simulação já capturados
+        self.keys = None
+        self.recorder = None  # Replay que recebe as teclas de cada passo, se gravando
+
+    # --------------------------------------------------------------
+    #  MÉTODOS
+    # --------------------------------------------------------------
+    def set_script(self, script: Optional[InputScript]):
+        """Substitui o teclado por um roteiro (None volta para o teclado real)."""
+        self.script = script
+        self.step = 0
+        self.keys = None
+
+    def start_recording(self, replay):
+        self.recorder = replay
+
+    def stop_recording(self):
+        """Encerra a gravação e devolve o replay gravado (ou None)."""
+        replay, self.recorder = self.recorder, None
+        return replay
+
+    def record_spell_change(self, spell_index: int, rune_index: int):
+        """Grava uma troca de runa feita no menu (ela altera a simulação, como as teclas)."""
+        if self.recorder is not None:
+            self.recorder.record_spell_change(spell_index, rune_index)
+
+    def poll(self):
+        """Captura o estado das teclas para o passo de simulação atual."""
+        if self.script is None:
+            self.keys = pygame.key.get_pressed()
+        else:
+            if callable(self.script):
+                pressed = self.script(self.step)
+            elif self.step < len(self.script):
+                pressed = self.script[self.step]
+            else:
+                pressed = ()
+            self.keys = ScriptedKeys(pressed or ())
+        if self.recorder is not None:
+            self.recorder.record(self.keys)
+        self.step += 1
+
+    def get_pressed(self):
+        """Teclas do passo atual, no mesmo formato de pygame.key.get_pressed()."""
+        if self.keys is None:
+            self.poll()
+        return self.keys
+
+    # --------------------------------------------------------------
+    #  MÉTODO DE FÁBRICA
+    # --------------------------------------------------------------
+    @classmethod
+    def get_instance(cls) -> "InputManager":
+        if cls._instance is None:
+            cls()
+        return cls._instance
@@ -10,10 +10,27 @@ from asset_loader import AssetLoader
 from ui.score import Score
 from ui.status_bar import StatusBar
 from ui.hotbar import HotBar
+from ui.hud import Hud
 from object_factory import ObjectFactory
 from entity_manager import EntityManager
+from input_manager import InputManager
+from profiler import FrameProfiler
+from sprite_list import SpriteList
+from sound_bank import SoundBank
+from spell_system.spells.dash import Dash
+from level_preloader import LevelPreloader
+from config import DEBUG_COLLIDERS
+from tile_layer import TileLayer
+from parallax_background import ParallaxBackground
+from objects.static_objects.terrain import Terrain
+from objects.static_objects.door import Door
 
 class Level:
+    show_colliders = DEBUG_COLLIDERS  # Alternado em tempo de execução (F1)
+    CAMERA_ZOOM = 4.0
+    # Efeitos tocados por path durante o combate: decodificados no load, não no primeiro uso
+    SOUND_EFFECTS = (HammerBot.DEATH_SFX, Drone.DEATH_SFX, Dash.SFX)
+
     def __init__(self, screen, level_name, player=None, player_spawn=None, total_score=0, persistent_dead_ids=None, minor_rune_drop_state=None):
         logging.basicConfig(level=logging.INFO, format="%(asctime)s - %(levelname)s - %(message)s")
         self.logger = logging.getLogger(__name__)
@@ -21,8 +38,11 @@ class Level:
         self.all_sprites = []
         self.entity_manager = EntityManager.get_instance(minor_rune_drop_state)
         self.static_objects = []
+        self.terrains = []  # Terrenos do tilemap, reaproveitados pelo reset
         self.background = [0, 0, 0]
         self.background_layers = []
+        self.parallax = ParallaxBackground(self.background_layers)
+        self.tile_layer = None
         self.tile_size = 24
         self.score = 0
         self.total_score = total_score
@@ -30,52 +50,72 @@ class Level:
         self.status_bar = StatusBar(self.screen)
         self.score_ui = Score(self.screen)
         self.hotbar = HotBar(self.screen)
+        self.hud = Hud(self.screen, self.status_bar, self.hotbar, self.score_ui)
         self.is_completed = False
         self.current_spawn = player_spawn
         self.persistent_dead_ids = persistent_dead_ids
         self.current_dead_ids = []
+        # Entidade -> rect.topleft no início do passo atual (interpolação do desenho)
+        self.previous_positions = {}
 
+        SoundBank.get_instance().preload(self.SOUND_EFFECTS)
         self.load_map(level_name, player, player_spawn)
 
     def load_map(self, level_name, player=None, player_spawn=None):
         print(f"Carregando mapa: {level_name} com spawn em {player_spawn}")
         self.all_sprites = []
         self.static_objects = []
+        self.terrains = []
         self.current_map = level_name
         self.level_name = level_name
-        self.map_data = AssetLoader.load_map_data(level_name)
+        # Mapa lido em segundo plano ao entrar no nível anterior, se houver
+        preloaded = LevelPreloader.get_instance().take(level_name, self.screen.get_size(), self.CAMERA_ZOOM)
+        self.map_data = preloaded.map_data if preloaded else AssetLoader.load_map_data(level_name)
         if self.map_data is None:
             self.logger.error("Falha ao carregar dados do mapa")
             return
         
-        self.tile_width = int(self.map_data.get("tilewidth"))
-        self.tile_height = int(self.map_data.get("tileheight"))
-        self.map_width = int(self.map_data.get("width"))
-        self.map_height = int(self.map_data.get("height"))
+        self.tile_width = self.map_data.tile_width
+        self.tile_height = self.map_data.tile_height
+        self.map_width = self.map_data.width
+        self.map_height = self.map_data.height
 
         world_width = self.map_width * self.tile_width
         world_height = self.map_height * self.tile_height
 
         self.camera = Camera.get_instance()
         self.camera.set_screen_size(self.screen.get_size())
-        self.camera.reset_world(world_width, world_height, zoom=4.0)
+        self.camera.reset_world(world_width, world_height, zoom=self.CAMERA_ZOOM)
         
-        self.tileset = AssetLoader.load_tileset(self.map_data)
+        self.tileset = AssetLoader.load_tileset(
+            self.map_data,
+            image=preloaded.tileset_image if preloaded else None
+        )
         self.background_layers = AssetLoader.load_background_layers(
             screen_size=self.screen.get_size(),
             world_size=(world_width, world_height),
-            camera_zoom=self.camera.zoom
+            camera_zoom=self.camera.zoom,
+            raw_layers=preloaded.background_layers if preloaded else None
         )
+        self.parallax = ParallaxBackground(self.background_layers)
         
         # Process tilemap
         self._process_tilemap()
         
         # Verify terrain creation
-        if not self.static_objects:
+        if not self.terrains:
             self.logger.warning("Nenhum terreno foi criado. Verifique o tilemap.")
-            
-        
-        self.entity_manager.entities = [player] if player else []
+
+        self._populate(player, player_spawn)
+
+    def _populate(self, player=None, player_spawn=None):
+        """Recria o estado inicial do nível (objetos do mapa e entidades) sobre a geometria já carregada.
+
+        Tiles, terrenos e fundos vêm de load_map; o reset só chama este método.
+        """
+        self.previous_positions = {}  # Evita interpolar através do teletransporte
+        self.static_objects = list(self.terrains)
+        self.entity_manager.reset(player)
         # Só processa objetos após o tilemap estar concluído
         self._process_objects(player_spawn)
         player = self.entity_manager.get_player()
@@ -83,49 +123,50 @@ class Level:
         if player and player_spawn is not None:
             self.entity_manager.update_player_position(self.entity_manager.get_player(), player_spawn)
         self.current_spawn = Vector2(player.position)
-        self.all_sprites = self.entity_manager.entities + self.static_objects
+        # Terrenos do tilemap já são desenhados pela tile_layer
+        self.all_sprites = SpriteList(
+            self.tile_width * CollisionManager.CELL_SIZE_IN_TILES,
+            self.entity_manager.entities + [obj for obj in self.static_objects if not isinstance(obj, Terrain)]
+        )
         self.collision_manager = CollisionManager.get_instance(
                     dynamic_objects=self.entity_manager.entities,
                     static_objects=self.static_objects,
-                    world_width=world_width
+                    world_width=self.map_width * self.tile_width
                 )
+        self.collision_manager.build_static_index(self.static_objects, self.tile_width)
+        self.collision_manager.sprite_list = self.all_sprites  # Entidades reposicionadas a cada passo
+        self._preload_door_targets()
+
+    def _preload_door_targets(self):
+        """Começa a ler em segundo plano os mapas de destino das portas deste nível."""
+        targets = {
+            obj.target_map for obj in self.static_objects
+            if isinstance(obj, Door) and obj.target_map not in ("end", self.level_name)
+        }
+        LevelPreloader.get_instance().preload(targets, self.screen.get_size(), self.CAMERA_ZOOM)
 
     def _process_tilemap(self):
-        """Processa a camada de blocos do mapa Tiled usando ObjectFactory para terrenos."""
-        layer = self.map_data.find("layer")
-        if layer is None:
+        """Processa a camada de blocos do mapa Tiled: pré-renderiza os tiles e cria os terrenos de colisão."""
+        if self.map_data.gids is None:
             self.logger.error("Nenhuma camada de tilemap encontrada")
             return
 
-        data = layer.find("data").text.strip()
-        rows = [row for row in data.splitlines() if row.strip()]
-        tilemap = []
-        for row in rows:
-            tiles = [int(tile) if tile.strip() else 0 for tile in row.split(",")]
-            tilemap.append(tiles)
-
-        for row_idx, row in enumerate(tilemap):
-            for col_idx, gid in enumerate(row):
-                if gid != 0:
-                    x = col_idx * self.tile_width
-                    y = row_idx * self.tile_height
-                    if gid in self.tileset:
-                        terrain = ObjectFactory.create_terrain(
-                            position=(x, y),
-                            size=(self.tile_width, self.tile_height),
-                            image=self.tileset[gid]
-                        )
-                        self.all_sprites.append(terrain)
-                        self.static_objects.append(terrain)
+        # Os tiles são desenhados pela camada estática, não individualmente via all_sprites
+        self.tile_layer = TileLayer(self.map_data.gids, self.tileset, self.tile_width, self.tile_height, self.camera.zoom)
+
+        # Colisão: tiles sólidos adjacentes viram um único terreno retangular
+        for rect in self.tile_layer.solid_rects():
+            terrain = ObjectFactory.create_terrain(position=rect.topleft, size=rect.size)
+            self.terrains.append(terrain)
 
     def _process_objects(self, player_spawn=None):
         """Processa a camada de objetos do mapa usando ObjectFactory."""
-        object_group = self.map_data.find("objectgroup[@name='objects']")
+        object_group = self.map_data.object_groups.get("objects")
         if object_group is None:
             self.logger.error("Nenhuma camada de objetos 'objects' encontrada no mapa")
             return
 
-        for obj in object_group.findall("object"):
+        for obj in object_group:
             id_ = obj.get("id")
             if obj.get("type") == "spawn" and (obj.get("name") == "hammer_bot" or obj.get("name") == "drone_bot") and id_ in self.persistent_dead_ids:
                 continue
@@ -142,51 +183,92 @@ class Level:
                     self.static_objects.append(new_obj)
                     self.all_sprites.append(new_obj)
 
-    def draw(self):
-        self.screen.fill(self.background)
-        screen_width, screen_height = self.screen.get_size()
-        for layer in self.background_layers:
-            surface = layer['surface']
-            offset_x = (layer['offset_x'] % surface.get_width()) - surface.get_width()
-            offset_y = (layer['offset_y'] % surface.get_height()) - surface.get_height()
-            for x in range(0, screen_width + surface.get_width(), surface.get_width()):
-                for y in range(0, screen_height + surface.get_height(), surface.get_height()):
-                    self.screen.blit(surface, (offset_x + x, offset_y + y))
-
-        for sprite in self.all_sprites:
-            offset_rect = self.camera.apply(sprite.rect)
-            scaled_image = self.camera.apply_surface(sprite.image)
-            self.screen.blit(scaled_image, offset_rect)
+    def snapshot(self):
+        """Guarda as posições atuais antes de um passo da simulação."""
+        self.previous_positions = {entity: entity.rect.topleft for entity in self.entity_manager.entities}
+        self.camera.snapshot()
 
-        player = self.entity_manager.get_player()
+    def _interpolate_positions(self, alpha):
+        """Desloca os rects para a posição interpolada; retorna o que restaurar depois do desenho."""
+        moved = []
+        for entity in self.entity_manager.entities:
+            previous = self.previous_positions.get(entity)
+            if previous is None:
+                continue
+            current = entity.rect.topleft
+            if previous == current:
+                continue
+            entity.rect.topleft = (
+                round(previous[0] + (current[0] - previous[0]) * alpha),
+                round(previous[1] + (current[1] - previous[1]) * alpha)
+            )
+            moved.append((entity, current))
+        return moved
 
-        for spell in player.spell_system.spellbook:
-            spell.draw(self.screen, self.camera)
-            
-        if player:
-            self.status_bar.draw(player)
-            self.hotbar.draw(player)
+    def draw(self, alpha=1.0):
+        """Desenha o nível interpolando entre o passo anterior e o atual da simulação."""
+        moved = self._interpolate_positions(alpha)
+        camera_offset = Vector2(self.camera.offset)
+        self.camera.offset = self.camera.interpolated_offset(alpha)
+        try:
+            self._draw_frame(alpha)
+        finally:
+            self.camera.offset = camera_offset
+            for entity, topleft in moved:
+                entity.rect.topleft = topleft
+
+    def _draw_frame(self, alpha=1.0):
+        profiler = FrameProfiler.get_instance()
+        with profiler.section("draw.parallax"):
+            self.screen.fill(self.background)
+            self.parallax.draw(self.screen, self.camera)
+
+        with profiler.section("draw.tiles"):
+            if self.tile_layer:
+                self.tile_layer.draw(self.screen, self.camera)
 
-        self.score_ui.draw(self.total_score + self.score)
+        view_rect = self.camera.get_view_rect()
+        with profiler.section("draw.sprites"):
+            # Só os sprites na área visível; a grade (atualizada na colisão) evita percorrer a lista inteira
+            for sprite in self.all_sprites.visible(view_rect):
+                offset_rect = self.camera.apply(sprite.rect)
+                scaled_image = self.camera.apply_surface(sprite.image)
+                self.screen.blit(scaled_image, offset_rect)
 
-        for obj in self.entity_manager.entities:
-            obj.draw_colliders_debug(self.screen, self.camera)
+            player = self.entity_manager.get_player()
+
+            for spell in player.spell_system.spellbook:
+                spell.draw(self.screen, self.camera, alpha)  # Projéteis não passam por _interpolate_positions
+
+        with profiler.section("draw.ui"):
+            self.hud.draw(player, self.total_score + self.score)
+
+        if self.show_colliders:
+            with profiler.section("draw.colliders"):
+                for obj in self.entity_manager.entities:
+                    if any(collider.rect.colliderect(view_rect) for collider in obj.colliders):
+                        obj.draw_colliders_debug(self.screen, self.camera)
 
     def update(self, delta_time):
+        InputManager.get_instance().poll()  # Uma leitura de teclado por passo de simulação
         player = self.entity_manager.get_player()
         if player and player.health <= 0:
             self.reset()
 
-        self.entity_manager.update(
-            delta_time,
-            self.static_objects,
-            lambda points: setattr(self, 'score', self.score + points),
-            self.all_sprites,
-            lambda id_: self.current_dead_ids.append(id_),
-            self.current_dead_ids
-        )
+        profiler = FrameProfiler.get_instance()
+        with profiler.section("update.entities"):
+            self.entity_manager.update(
+                delta_time,
+                self.static_objects,
+                lambda points: setattr(self, 'score', self.score + points),
+                self.all_sprites,
+                lambda id_: self.current_dead_ids.append(id_),
+                self.current_dead_ids
+            )
 
-        self.collision_manager.update(self.entity_manager.entities)
+        with profiler.section("update.collision"):
+            self.collision_manager.update(self.entity_manager.entities)
+            self.entity_manager.resolve_projectile_hits()
         
         
         if self.collision_manager.door_triggered:
@@ -195,18 +277,19 @@ class Level:
             self.collision_manager.door_triggered = None
             return (target_map, player_spawn, player, self.entity_manager.minor_rune_drop_state)
         
-        self.camera.update(self.entity_manager.get_player())
+        with profiler.section("update.camera"):
+            self.camera.update(self.entity_manager.get_player())
 
-        for layer in self.background_layers:
-            layer['offset_x'] = -self.camera.offset.x * layer['parallax_factor']
-            layer['offset_y'] = -self.camera.offset.y * layer['parallax_factor']
+    def restart(self, player=None, player_spawn=None):
+        """Volta ao estado inicial sem recarregar o mapa: tiles, terrenos e fundos são reaproveitados."""
+        self.camera.reset_world(self.camera.world_width, self.camera.world_height, zoom=self.CAMERA_ZOOM)
+        self._populate(player, player_spawn)
 
     def reset(self):
         player = self.entity_manager.get_player()
-        self.entity_manager.entities = [player] if player else []
         spawn_point = self.current_spawn if not self.current_map == "level_3" else Vector2(32.83, 255.67)
         print(f"Resetando nível para spawn em {spawn_point}")
-        self.load_map(self.current_map, player, spawn_point)
+        self.restart(player, spawn_point)
         if player:
             player.health = player.max_health
             player.mana = player.max_mana
@@ -1,7 +1,7 @@
 
 from config import SPEED
 from level import Level
-import random
+from game_random import GameRandom
 from objects.dynamic_objects.hammer_bot import HammerBot
 from objects.dynamic_objects.drone import Drone
 from objects.static_objects.terrain import Terrain
@@ -10,9 +10,13 @@ from objects.dynamic_objects.player import Player
 from objects.dynamic_objects.rune import Rune
 from pygame.math import Vector2
 import pygame
+from sound_bank import SoundBank
 from object_factory import ObjectFactory
 
 class LevelArena(Level):
+    FORCEFIELD_SFX = "assets/audio/soundEffects/door/boss-jump.wav"
+    SOUND_EFFECTS = Level.SOUND_EFFECTS + (FORCEFIELD_SFX,)
+
     def __init__(self, screen, level_name, player, player_spawn=None, total_score=0, persistent_dead_ids=[], minor_rune_drop_state=None):
         self.arena_activated = False  # Tracks if the arena is activated
         self.wave_spawns = []  # List to store wave_spawn data
@@ -24,32 +28,28 @@ class LevelArena(Level):
         self.spawn_interval = 1.0  # Interval between enemy spawns (in seconds)
         super().__init__(screen, level_name, player, player_spawn, total_score, persistent_dead_ids, minor_rune_drop_state)
         
-    def load_map(self, level_name, player=None, player_spawn=None):
-        print(f"Carregando mapa LevelArena: {level_name} com spawn em {player_spawn}")
+    def _populate(self, player=None, player_spawn=None):
+        print(f"Populando LevelArena {self.level_name} com spawn em {player_spawn}")
         self.wave_spawns = []
         self.current_wave = 0
         self.wave_active = False
         self.pending_spawns = []
         self.spawn_timer = 0.0
         self.arena_activated = False
-        super().load_map(level_name, player, player_spawn)
-        
-        # CORREÇÃO: Limpa inimigos fantasmas do entity_manager
-        if hasattr(self.entity_manager, 'enemies'):
-            self.entity_manager.enemies = []
-        
+        super()._populate(player, player_spawn)  # EntityManager.reset já descarta os inimigos do mapa anterior
+
         # Opcional: limpa current_dead_ids se usado para tracking
         self.current_dead_ids = []
         
     def _process_objects(self, player_spawn=None):
         print("Processando objetos no levelArena:")
         """Processa a camada de objetos do mapa, salvando wave_spawns para criação posterior."""
-        object_group = self.map_data.find("objectgroup[@name='objects']")
+        object_group = self.map_data.object_groups.get("objects")
         if object_group is None:
             self.logger.error("Nenhuma camada de objetos 'objects' encontrada no mapa")
             return
 
-        for obj in object_group.findall("object"):
+        for obj in object_group:
             id_ = obj.get("id")
             if obj.get("type") == "spawn" and obj.get("name") == "hammer_bot" and id_ in self.persistent_dead_ids:
                 continue
@@ -75,6 +75,8 @@ class LevelArena(Level):
         for obj in self.static_objects:
             if hasattr(obj, 'update'):
                 obj.update(delta_time)
+                self.collision_manager.refresh_static(obj)
+                self.all_sprites.move(obj)
 
         # Handle arena activation and first wave
         if self.collision_manager.alarm_triggered and not self.arena_activated:
@@ -86,7 +88,7 @@ class LevelArena(Level):
             self.spawn_timer = 0.0
             # Selecionar apenas um spawn para a primeira onda
             # self.pending_spawns = [self.wave_spawns[0]] if self.wave_spawns else []
-            self.pending_spawns = random.sample(self.wave_spawns, len(self.wave_spawns))
+            self.pending_spawns = GameRandom.get_instance().sample(self.wave_spawns, len(self.wave_spawns))
             self.logger.info(f"Primeira onda iniciada com {len(self.pending_spawns)} inimigo para spawnar")  # Shuff
 
         # Handle sequential enemy spawning
@@ -105,7 +107,7 @@ class LevelArena(Level):
                     self.current_wave += 1
                     if self.current_wave <= self.max_waves:
                         self.logger.info(f"Preparando para spawnar onda {self.current_wave}")
-                        self.pending_spawns = random.sample(self.wave_spawns, len(self.wave_spawns))  # Shuffle spawns for next wave
+                        self.pending_spawns = GameRandom.get_instance().sample(self.wave_spawns, len(self.wave_spawns))  # Shuffle spawns for next wave
                         self.spawn_timer = 0.0
                         self.wave_active = True
                         self.logger.info(f"Onda {self.current_wave} iniciada com {len(self.pending_spawns)} inimigo para spawnar")
@@ -165,10 +167,11 @@ class LevelArena(Level):
 
         # Ruído energético translúcido (faíscas de energia)
         noise = pygame.Surface((w, h), pygame.SRCALPHA)
+        rng = GameRandom.get_instance()
         for _ in range(w * h // 25):
-            x = random.randint(0, w - 1)
-            y = random.randint(0, h - 1)
-            alpha = random.randint(15, 60)
+            x = rng.randint(0, w - 1)
+            y = rng.randint(0, h - 1)
+            alpha = rng.randint(15, 60)
             noise.set_at((x, y), (color_energy.r, color_energy.g, color_energy.b, alpha))
         surface.blit(noise, (0, 0), special_flags=pygame.BLEND_ADD)
 
@@ -187,6 +190,7 @@ class LevelArena(Level):
                     self.logger.info("Desativando porta para level_2")
                     # Remove the door from sprites and static objects
                     self.static_objects.remove(door)
+                    self.collision_manager.remove_static(door)
                     self.all_sprites.remove(door)
                     size = (24, 48)  # Size of the force field terrain
                     position = door.position
@@ -212,17 +216,17 @@ class LevelArena(Level):
                     
                     # Add the terrain to the lists
                     self.static_objects.append(terrain)
+                    self.collision_manager.add_static(terrain)
                     self.all_sprites.append(terrain)
-                    sound = pygame.mixer.Sound("assets/audio/soundEffects/door/boss-jump.wav")
-                    sound.set_volume(0.1)  # 0.0 = mudo, 1.0 = volume total
-                    sound.play()
+                    # volume: 0.0 = mudo, 1.0 = volume total
+                    SoundBank.get_instance().play(self.FORCEFIELD_SFX, SoundBank.HIGH, volume=0.1)
                     self.logger.info("Terreno de campo de força adicionado com animação de crescimento no lugar da porta")
 
     def spawn_wave(self):
         """Prepara uma onda de inimigos para spawn sequencial."""
         self.logger.info(f"Preparando onda {self.current_wave} para spawn sequencial")
         # Shuffle the wave_spawns list and store it in pending_spawns
-        self.pending_spawns = random.sample(self.wave_spawns, len(self.wave_spawns))
+        self.pending_spawns = GameRandom.get_instance().sample(self.wave_spawns, len(self.wave_spawns))
         self.spawn_timer = 0.0
         self.logger.info(f"{len(self.pending_spawns)} inimigos preparados para spawn na onda {self.current_wave}")
 
@@ -255,13 +259,7 @@ class LevelArena(Level):
                 self.all_sprites.append(enemy)
                 # Extract position and can_fall for logging
                 position = (float(spawn_data.get("x", 0)), float(spawn_data.get("y", 0)))
-                properties = spawn_data.find("properties")
-                can_fall = False
-                if properties is not None:
-                    for prop in properties.findall("property"):
-                        if prop.get("name") == "can_fall":
-                            can_fall = prop.get("value").lower() == "true"
-                            break
+                can_fall = spawn_data.properties.get("can_fall", "false").lower() == "true"
                 self.logger.info(f"Inimigo criado na onda {self.current_wave}: {position}, can_fall: {can_fall}, "
                                f"max_health: {custom_max_health}, speed: {custom_speed}")
                 
@@ -270,8 +268,8 @@ class LevelArena(Level):
         spawn_point = self.current_spawn if self.current_map != "level_3" else Vector2(32.83, 255.67)
         print(f"Resetando LevelArena com spawn em {spawn_point}")
 
-        # CHAMA O load_map DO LEVELARENA (não do pai!)
-        self.load_map(self.current_map, player, spawn_point)
+        # O _populate do LevelArena também reinicia as ondas
+        self.restart(player, spawn_point)
 
         if player:
             player.health = player.max_health
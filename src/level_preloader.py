@@ -0,0 +1,110 @@
+# level_preloader.py
+import logging
+import pygame
+from concurrent.futures import Future, ThreadPoolExecutor
+from dataclasses import dataclass
+from typing import Dict, Iterable, List, Optional, Tuple
+from asset_loader import AssetLoader
+from map_data import MapData
+
+
+@dataclass
+class PreloadedLevel:
+    """Dados de um mapa lidos em segundo plano, ainda sem conversão para o formato da tela."""
+    level_name: str
+    screen_size: Tuple[int, int]
+    camera_zoom: float
+    map_data: MapData
+    tileset_image: Optional[pygame.Surface]
+    background_layers: List[Tuple[float, pygame.Surface]]
+
+
+class LevelPreloader:
+    """Lê em uma thread de fundo os mapas alcançáveis pelas portas do nível atual.
+
+    O XML, a imagem do tileset e as camadas de parallax (já escaladas) ficam prontos
+    antes do jogador chegar à porta; a thread principal só converte as superfícies
+    (convert/convert_alpha precisam da janela) e monta os objetos.
+    """
+
+    # --------------------------------------------------------------
+    #  SINGLETON
+    # --------------------------------------------------------------
+    _instance: Optional["LevelPreloader"] = None
+
+    def __new__(cls, *args, **kwargs):
+        if cls._instance is None:
+            cls._instance = super().__new__(cls)
+        return cls._instance
+
+    # --------------------------------------------------------------
+    #  __init__ (executado apenas uma vez)
+    # --------------------------------------------------------------
+    def __init__(self):
+        if hasattr(self, "_initialized"):
+            return
+        self._initialized = True
+
+        self.logger = logging.getLogger(__name__)
+        self.executor = ThreadPoolExecutor(max_workers=1, thread_name_prefix="level-preloader")
+        self.pending: Dict[str, Future] = {}  # nome do mapa -> leitura em andamento ou concluída
+
+    # --------------------------------------------------------------
+    #  MÉTODOS
+    # --------------------------------------------------------------
+    def preload(self, level_names: Iterable[str], screen_size: Tuple[int, int], camera_zoom: float):
+        """Agenda a leitura dos mapas; leituras de mapas que saíram do alcance são descartadas."""
+        wanted = set(level_names)
+        for name in list(self.pending):
+            if name not in wanted:
+                self.pending.pop(name).cancel()
+
+        for name in wanted:
+            future = self.pending.get(name)
+            if future is not None and not future.cancelled():
+                continue
+            self.pending[name] = self.executor.submit(self._read_level, name, tuple(screen_size), camera_zoom)
+
+    def take(self, level_name: str, screen_size: Tuple[int, int], camera_zoom: float) -> Optional[PreloadedLevel]:
+        """Resultado da leitura do mapa (espera se ainda estiver em andamento) ou None."""
+        future = self.pending.pop(level_name, None)
+        if future is None or future.cancelled():
+            return None
+        try:
+            preloaded = future.result()
+        except Exception as e:
+            self.logger.error(f"Falha ao pré-carregar {level_name}: {e}")
+            return None
+        if preloaded is None or preloaded.screen_size != tuple(screen_size) or preloaded.camera_zoom != camera_zoom:
+            return None
+        return preloaded
+
+    def clear(self):
+        for future in self.pending.values():
+            future.cancel()
+        self.pending.clear()
+
+    @staticmethod
+    def _read_level(level_name: str, screen_size: Tuple[int, int], camera_zoom: float) -> Optional[PreloadedLevel]:
+        """Executado na thread de fundo: nada aqui pode depender da superfície da tela."""
+        map_data = AssetLoader.load_map_data(level_name)
+        if map_data is None:
+            return None
+        world_size = (map_data.width * map_data.tile_width, map_data.height * map_data.tile_height)
+        return PreloadedLevel(
+            level_name=level_name,
+            screen_size=screen_size,
+            camera_zoom=camera_zoom,
+            map_data=map_data,
+            tileset_image=AssetLoader.read_tileset_image(map_data),
+            background_layers=AssetLoader.read_background_layers(screen_size, world_size, camera_zoom),
+        )
+
+    # --------------------------------------------------------------
+    #  MÉTODO DE FÁBRICA
+    # --------------------------------------------------------------
+    @classmethod
+    def get_instance(cls) -> "LevelPreloader":
+        if cls._instance is None:
+            cls()
+        return cls._instance
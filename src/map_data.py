@@ -0,0 +1,202 @@
+# map_data.py
+import hashlib
+import json
+import os
+import struct
+import numpy as np
+import xml.etree.ElementTree as ET
+from dataclasses import dataclass, field
+from typing import Any, Dict, List, Optional
+
+COMPILED_EXTENSION = ".msmap"
+
+
+@dataclass
+class MapObject:
+    """Objeto de uma camada de objetos do Tiled, com as propriedades já resolvidas.
+
+    get() devolve os atributos como no XML (strings), no lugar de Element.get().
+    """
+    attrib: Dict[str, str]
+    properties: Dict[str, str] = field(default_factory=dict)
+
+    def get(self, key: str, default: Any = None) -> Any:
+        return self.attrib.get(key, default)
+
+
+@dataclass
+class TilesetInfo:
+    image_source: str
+    tile_width: int
+    tile_height: int
+    columns: int
+    tilecount: int
+    firstgid: int
+
+
+@dataclass
+class MapData:
+    """Mapa do Tiled já decodificado: dimensões, tileset, gids (numpy) e objetos por camada."""
+    tile_width: int
+    tile_height: int
+    width: int
+    height: int
+    tileset: Optional[TilesetInfo]
+    gids: Optional[np.ndarray]  # (linhas, colunas) uint32; None se o mapa não tiver camada de tiles
+    object_groups: Dict[str, List[MapObject]]
+
+    # Formato compilado (little-endian):
+    #   magic "MSMP" | versão u16 | reservado u16 | tamanho do cabeçalho u32
+    #   | cabeçalho JSON utf-8 (alinhado a 8 bytes) | gids u32 * linhas * colunas
+    MAGIC = b"MSMP"
+    VERSION = 2  # 2: cabeçalho com tamanho e mtime do XML de origem
+    _PREFIX = struct.Struct("<4sHHI")
+
+    # --------------------------------------------------------------
+    #  XML DO TILED
+    # --------------------------------------------------------------
+    @classmethod
+    def from_xml(cls, root: ET.Element) -> "MapData":
+        tileset = None
+        tileset_elem = root.find("tileset")
+        if tileset_elem:  # Tilesets externos (.tsx) não têm filhos e são ignorados
+            tileset = TilesetInfo(
+                image_source=tileset_elem.find("image").get("source"),
+                tile_width=int(tileset_elem.get("tilewidth")),
+                tile_height=int(tileset_elem.get("tileheight")),
+                columns=int(tileset_elem.get("columns")),
+                tilecount=int(tileset_elem.get("tilecount")),
+                firstgid=int(tileset_elem.get("firstgid")),
+            )
+
+        gids = None
+        layer = root.find("layer")
+        if layer is not None:
+            data = layer.find("data").text.strip()
+            rows = [
+                [int(tile) if tile.strip() else 0 for tile in row.split(",")]
+                for row in data.splitlines() if row.strip()
+            ]
+            columns = max((len(row) for row in rows), default=0)
+            gids = np.zeros((len(rows), columns), dtype=np.uint32)
+            for row_idx, row in enumerate(rows):
+                gids[row_idx, :len(row)] = row
+
+        object_groups = {}
+        for group in root.findall("objectgroup"):
+            objects = []
+            for obj in group.findall("object"):
+                properties = {}
+                properties_elem = obj.find("properties")
+                if properties_elem:
+                    for prop in properties_elem.findall("property"):
+                        properties[prop.get("name")] = prop.get("value")
+                objects.append(MapObject(dict(obj.attrib), properties))
+            object_groups.setdefault(group.get("name"), []).extend(objects)
+
+        return cls(
+            tile_width=int(root.get("tilewidth")),
+            tile_height=int(root.get("tileheight")),
+            width=int(root.get("width")),
+            height=int(root.get("height")),
+            tileset=tileset,
+            gids=gids,
+            object_groups=object_groups,
+        )
+
+    # --------------------------------------------------------------
+    #  FORMATO COMPILADO
+    # --------------------------------------------------------------
+    @staticmethod
+    def source_hash(xml_path: str) -> str:
+        with open(xml_path, "rb") as file:
+            return hashlib.sha1(file.read()).hexdigest()
+
+    @staticmethod
+    def is_current(header: Dict[str, Any], source_path: str) -> bool:
+        """O compilado corresponde ao XML? Compara tamanho e mtime; só lê o XML se eles mudaram."""
+        stat = os.stat(source_path)
+        if stat.st_size == header["source_size"] and stat.st_mtime_ns == header["source_mtime_ns"]:
+            return True
+        # Ex: checkout refaz o arquivo com o mesmo conteúdo e outro mtime
+        return stat.st_size == header["source_size"] and MapData.source_hash(source_path) == header["source_sha1"]
+
+    def save_compiled(self, path: str, source_path: str):
+        stat = os.stat(source_path)
+        header = {
+            "source_sha1": self.source_hash(source_path),
+            "source_size": stat.st_size,
+            "source_mtime_ns": stat.st_mtime_ns,
+            "tile_width": self.tile_width,
+            "tile_height": self.tile_height,
+            "width": self.width,
+            "height": self.height,
+            "tileset": self.tileset.__dict__ if self.tileset else None,
+            "gid_shape": list(self.gids.shape) if self.gids is not None else None,
+            "object_groups": {
+                name: [{"attrib": obj.attrib, "properties": obj.properties} for obj in objects]
+                for name, objects in self.object_groups.items()
+            },
+        }
+        header_bytes = json.dumps(header, ensure_ascii=False, separators=(",", ":")).encode("utf-8")
+        padding = -(self._PREFIX.size + len(header_bytes)) % 8
+        header_bytes += b" " * padding
+
+        with open(path, "wb") as file:
+            file.write(self._PREFIX.pack(self.MAGIC, self.VERSION, 0, len(header_bytes)))
+            file.write(header_bytes)
+            if self.gids is not None:
+                file.write(np.ascontiguousarray(self.gids, dtype="<u4").tobytes())
+
+    @classmethod
+    def load_compiled(cls, path: str, source_path: Optional[str] = None) -> Optional["MapData"]:
+        """Abre o mapa compilado (gids mapeados em memória).
+
+        Retorna None se o arquivo for de outra versão ou, com source_path (o XML), se estiver desatualizado.
+        """
+        with open(path, "rb") as file:
+            prefix = file.read(cls._PREFIX.size)
+            if len(prefix) < cls._PREFIX.size:
+                return None
+            magic, version, _, header_length = cls._PREFIX.unpack(prefix)
+            if magic != cls.MAGIC or version != cls.VERSION:
+                return None
+            header = json.loads(file.read(header_length).decode("utf-8"))
+
+        if source_path is not None and not cls.is_current(header, source_path):
+            return None
+
+        gids = None
+        if header["gid_shape"] is not None:
+            rows, columns = header["gid_shape"]
+            if rows and columns:
+                gids = np.memmap(path, dtype="<u4", mode="r", offset=cls._PREFIX.size + header_length,
+                                 shape=(rows, columns))
+            else:
+                gids = np.zeros((rows, columns), dtype=np.uint32)
+
+        return cls(
+            tile_width=header["tile_width"],
+            tile_height=header["tile_height"],
+            width=header["width"],
+            height=header["height"],
+            tileset=TilesetInfo(**header["tileset"]) if header["tileset"] else None,
+            gids=gids,
+            object_groups={
+                name: [MapObject(obj["attrib"], obj["properties"]) for obj in objects]
+                for name, objects in header["object_groups"].items()
+            },
+        )
+
+
+def compiled_path(xml_path: str) -> str:
+    """Caminho do mapa compilado ao lado do XML (ex: level_2.xml -> level_2.msmap)."""
+    return os.path.splitext(xml_path)[0] + COMPILED_EXTENSION
+
+
+def compile_map(xml_path: str, output_path: Optional[str] = None) -> str:
+    """Converte um mapa .xml do Tiled para o formato compilado; retorna o caminho gerado."""
+    output_path = output_path or compiled_path(xml_path)
+    map_data = MapData.from_xml(ET.parse(xml_path).getroot())
+    map_data.save_compiled(output_path, xml_path)
+    return output_path
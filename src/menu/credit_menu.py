@@ -21,8 +21,8 @@ class CreditMenu:
         """Desenha o menu de créditos."""
         # Título
         title = "Créditos"
-        title_text = self.title_font.render(title, True, (255, 255, 255))
-        title_shadow = self.title_font.render(title, True, (50, 50, 50))  # Sombra cinza
+        title_text = self.menu.text_cache.render(self.title_font, title, (255, 255, 255))
+        title_shadow = self.menu.text_cache.render(self.title_font, title, (50, 50, 50))  # Sombra cinza
         title_rect = title_text.get_rect(center=(self.width // 2, self.height // 2 - 200))
         title_shadow_rect = title_rect.copy()
         title_shadow_rect.move_ip(3, 3)  # Deslocamento da sombra
@@ -31,8 +31,8 @@ class CreditMenu:
 
         # Texto dos créditos
         for i, line in enumerate(self.credits_text[1:]):  # Pula a primeira linha ("Créditos:")
-            text = self.credits_font.render(line, True, (255, 255, 255))
-            shadow = self.credits_font.render(line, True, (50, 50, 50))  # Sombra cinza
+            text = self.menu.text_cache.render(self.credits_font, line, (255, 255, 255))
+            shadow = self.menu.text_cache.render(self.credits_font, line, (50, 50, 50))  # Sombra cinza
             text_rect = text.get_rect(center=(self.width // 2, self.height // 2 - 50 + i * 40))
             shadow_rect = text_rect.copy()
             shadow_rect.move_ip(2, 2)  # Deslocamento da sombra
@@ -42,9 +42,9 @@ class CreditMenu:
         # Botão "Voltar"
         button_text = "Voltar (Enter/Esc)"
         button_y = self.height // 2 + 300
-        button_color = (255, 255, 0) if self.button_font.render(button_text, True, BUTTON_COLOR).get_rect(
+        button_color = (255, 255, 0) if self.menu.text_cache.render(self.button_font, button_text, BUTTON_COLOR).get_rect(
             center=(self.width // 2, button_y)).collidepoint(mouse_pos) else BUTTON_COLOR
-        button = self.button_font.render(button_text, True, button_color)
+        button = self.menu.text_cache.render(self.button_font, button_text, button_color)
         button_rect = button.get_rect(center=(self.width // 2, button_y))
         
         # Fundo do botão com borda
@@ -61,7 +61,7 @@ class CreditMenu:
         for event in events:
             if event.type == pygame.MOUSEBUTTONDOWN and event.button == 1:
                 print("Clique do mouse detectado no menu de créditos")
-                button_rect = self.button_font.render("Voltar (Enter/Esc)", True, (255, 255, 255)).get_rect(
+                button_rect = self.menu.text_cache.render(self.button_font, "Voltar (Enter/Esc)", (255, 255, 255)).get_rect(
                     center=(self.width // 2, self.height // 2 + 300))
                 if button_rect.collidepoint(mouse_pos):
                     print("Voltando ao menu principal via clique do mouse")
@@ -41,26 +41,16 @@ class GameEnd:
         self.cursor_visible = True  # Control cursor blinking
         self.cursor_timer = time.time()  # Timer for cursor blink
 
+        # Superfícies estáticas da tela (criadas uma vez; o Menu aplica o overlay no fundo de 'end')
+        self.overlay = pygame.Surface((self.width, self.height), pygame.SRCALPHA)
+        self.overlay.fill((0, 0, 0, 100))
+        self.panel = None  # Caixa de texto sem o campo de nome e as opções
+        self.panel_text_bottom = 0
+        self.panel_surface = None  # Superfície de trabalho do frame (painel + campo + opções), reaproveitada
+
     def wrap_text(self, text, font, max_width):
         """Quebra o texto em várias linhas com base na largura máxima."""
-        words = text.split(' ')
-        lines = []
-        current_line = ""
-
-        for word in words:
-            test_line = current_line + word + " "
-            test_surface = font.render(test_line, True, (255, 255, 255))
-            if test_surface.get_width() <= max_width:
-                current_line = test_line
-            else:
-                if current_line:
-                    lines.append(current_line.strip())
-                current_line = word + " "
-        
-        if current_line:
-            lines.append(current_line.strip())
-        
-        return lines
+        return self.menu.text_cache.wrap(text, font, max_width)
 
     def handle_input(self, events):
         """Processa entrada do usuário para digitar nome, navegar e selecionar opções."""
@@ -93,7 +83,7 @@ class GameEnd:
                         self.name_input_active = False
                         # Check if an option was clicked
                         for i, option in enumerate(self.options):
-                            option_text = self.body_font.render(option, True, (255, 255, 255))
+                            option_text = self.menu.text_cache.render(self.body_font, option, (255, 255, 255))
                             option_width = option_text.get_width()
                             option_x = (400 - option_width) // 2
                             option_rect = pygame.Rect(
@@ -129,34 +119,19 @@ class GameEnd:
                             return self.options[self.selected_option], self.player_name
         return None, None
 
-    def draw(self):
-        """Desenha a tela de agradecimento com fundo opaco, fade-in e campo de entrada de nome."""
-        # Update cursor blinking
-        if time.time() - self.cursor_timer > 0.5:  # Blink every 0.5 seconds
-            self.cursor_visible = not self.cursor_visible
-            self.cursor_timer = time.time()
-
-        # Desenha o overlay de fundo com transparência fixa
-        overlay = pygame.Surface((self.width, self.height), pygame.SRCALPHA)
-        overlay.fill((0, 0, 0, 100))
-        self.screen.blit(overlay, (0, 0))
-        
+    def _build_panel(self):
+        """Fundo, borda, título e texto da caixa (não mudam entre frames); retorna a superfície e o y após o texto."""
         # Cria uma superfície para a caixa de texto
         description_size = (400, 500)
         menu_surface = pygame.Surface(description_size, pygame.SRCALPHA)
-        
-        center_x = self.width // 2
-        center_y = self.height // 2
-        desc_offset_x = -200
-        desc_offset_y = -250
         desc_rect = pygame.Rect(0, 0, description_size[0], description_size[1])
-        
+
         # Desenha a borda e o fundo da caixa
         pygame.draw.rect(menu_surface, (100, 100, 100), desc_rect, 2)
         menu_surface.fill((0, 0, 0, 180), desc_rect)
-        
+
         # Renderiza o título
-        title_text = self.font.render("Obrigado por jogar!", True, (255, 255, 255))
+        title_text = self.menu.text_cache.render(self.font, "Obrigado por jogar!", (255, 255, 255))
         title_width = title_text.get_width()
         title_x = (description_size[0] - title_width) // 2
         menu_surface.blit(title_text, (title_x, 10))
@@ -168,16 +143,41 @@ class GameEnd:
         for line in desc_lines:
             wrapped_lines = self.wrap_text(line, self.body_font, max_text_width)
             for wrapped_line in wrapped_lines:
-                desc_text = self.body_font.render(wrapped_line, True, (255, 255, 255))
+                desc_text = self.menu.text_cache.render(self.body_font, wrapped_line, (255, 255, 255))
                 menu_surface.blit(desc_text, (10, y_offset))
                 y_offset += 20
             y_offset += 30
+        return menu_surface, y_offset
+
+    def draw(self):
+        """Desenha a tela de agradecimento com fundo opaco, fade-in e campo de entrada de nome."""
+        # Update cursor blinking
+        if time.time() - self.cursor_timer > 0.5:  # Blink every 0.5 seconds
+            self.cursor_visible = not self.cursor_visible
+            self.cursor_timer = time.time()
+
+        # O overlay de fundo (transparência fixa) já vem aplicado no fundo do menu para 'end'
+
+        # Caixa de texto: parte estática composta uma vez, copiada na superfície de trabalho para o fade-in
+        if self.panel is None:
+            self.panel, self.panel_text_bottom = self._build_panel()
+            self.panel_surface = pygame.Surface(self.panel.get_size(), pygame.SRCALPHA)
+        menu_surface = self.panel_surface
+        menu_surface.fill((0, 0, 0, 0))
+        menu_surface.blit(self.panel, (0, 0), special_flags=pygame.BLEND_RGBA_MAX)  # Cópia exata, inclusive do alfa
+        description_size = menu_surface.get_size()
+        y_offset = self.panel_text_bottom
+
+        center_x = self.width // 2
+        center_y = self.height // 2
+        desc_offset_x = -200
+        desc_offset_y = -250
 
         # Renderiza o campo de entrada de nome após o texto descritivo
         name_rect = pygame.Rect(100, y_offset - 50, 200, 30)
         border_color = (255, 255, 0) if self.selected_option == -1 else (255, 255, 255) if self.name_input_active else (150, 150, 150)
         pygame.draw.rect(menu_surface, border_color, name_rect, 2)
-        name_text = self.body_font.render(self.player_name if self.player_name else "Digite seu nome", True, (255, 255, 255))
+        name_text = self.menu.text_cache.render(self.body_font, self.player_name if self.player_name else "Digite seu nome", (255, 255, 255))
         name_text_rect = name_text.get_rect(center=name_rect.center)
         menu_surface.blit(name_text, name_text_rect)
         # Draw blinking cursor
@@ -189,7 +189,7 @@ class GameEnd:
         # Renderiza as opções
         for i, option in enumerate(self.options):
             color = (255, 255, 0) if i == self.selected_option else (255, 255, 255)
-            option_text = self.body_font.render(option, True, color)
+            option_text = self.menu.text_cache.render(self.body_font, option, color)
             option_width = option_text.get_width()
             option_x = (description_size[0] - option_width) // 2
             menu_surface.blit(option_text, (option_x, y_offset + i * 40))
@@ -24,8 +24,8 @@ class InitialMenu:
         """Desenha o menu inicial ou de controles com base no parâmetro is_initial."""
         # Título
         title = "Manastride" if is_initial else "Controles"
-        title_text = self.title_font.render(title, True, (255, 255, 255))
-        title_shadow = self.title_font.render(title, True, (50, 50, 50))  # Sombra cinza
+        title_text = self.menu.text_cache.render(self.title_font, title, (255, 255, 255))
+        title_shadow = self.menu.text_cache.render(self.title_font, title, (50, 50, 50))  # Sombra cinza
         title_rect = title_text.get_rect(center=(self.width // 2, self.height // 2 - 200))
         title_shadow_rect = title_rect.copy()
         title_shadow_rect.move_ip(3, 3)  # Deslocamento da sombra
@@ -35,8 +35,8 @@ class InitialMenu:
         # Texto dos controles (exclui "Controles:" no menu de controles)
         start_index = 0 if is_initial else 1  # Pula a primeira linha ("Controles:") se não for inicial
         for i, line in enumerate(self.controls_text[start_index:]):
-            text = self.controls_font.render(line, True, (255, 255, 255))
-            shadow = self.controls_font.render(line, True, (50, 50, 50))  # Sombra cinza
+            text = self.menu.text_cache.render(self.controls_font, line, (255, 255, 255))
+            shadow = self.menu.text_cache.render(self.controls_font, line, (50, 50, 50))  # Sombra cinza
             text_rect = text.get_rect(center=(self.width // 2, self.height // 2 - 50 + i * 40))
             shadow_rect = text_rect.copy()
             shadow_rect.move_ip(2, 2)  # Deslocamento da sombra
@@ -46,9 +46,9 @@ class InitialMenu:
         # Botão "Iniciar Jogo" (menu inicial) ou "Voltar" (menu de controles)
         button_text = "Iniciar Jogo (Enter)" if is_initial else "Voltar (Enter/Esc)"
         button_y = self.height // 2 + 300  # Mesma posição para ambos os menus
-        button_color = (255, 255, 0) if self.button_font.render(button_text, True, BUTTON_COLOR).get_rect(
+        button_color = (255, 255, 0) if self.menu.text_cache.render(self.button_font, button_text, BUTTON_COLOR).get_rect(
             center=(self.width // 2, button_y)).collidepoint(mouse_pos) else BUTTON_COLOR
-        button = self.button_font.render(button_text, True, button_color)
+        button = self.menu.text_cache.render(self.button_font, button_text, button_color)
         button_rect = button.get_rect(center=(self.width // 2, button_y))
         
         # Fundo do botão com borda
@@ -75,7 +75,7 @@ class InitialMenu:
             elif event.type == pygame.MOUSEBUTTONDOWN and event.button == 1:
                 print("Clique do mouse detectado no menu")
                 button_text = "Iniciar Jogo (Enter)" if is_initial else "Voltar (Enter/Esc)"
-                button_rect = self.button_font.render(button_text, True, (255, 255, 255)).get_rect(
+                button_rect = self.menu.text_cache.render(self.button_font, button_text, (255, 255, 255)).get_rect(
                     center=(self.width // 2, self.height // 2 + 300))
                 if button_rect.collidepoint(mouse_pos):
                     print("Clique do mouse dentro do retângulo do botão")
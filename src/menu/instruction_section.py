@@ -20,24 +20,7 @@ class InstructionSection:
 
     def wrap_text(self, text, font, max_width):
         """Quebra o texto em várias linhas com base na largura máxima."""
-        words = text.split(' ')
-        lines = []
-        current_line = ""
-
-        for word in words:
-            test_line = current_line + word + " "
-            test_surface = font.render(test_line, True, (255, 255, 255))
-            if test_surface.get_width() <= max_width:
-                current_line = test_line
-            else:
-                if current_line:
-                    lines.append(current_line.strip())
-                current_line = word + " "
-        
-        if current_line:
-            lines.append(current_line.strip())
-        
-        return lines
+        return self.menu.text_cache.wrap(text, font, max_width)
 
     def draw(self):
         center_x = self.menu.width // 2
@@ -49,7 +32,7 @@ class InstructionSection:
         pygame.draw.rect(self.menu.screen, (100, 100, 100), desc_rect, 2)
         
         # Renderizar título centralizado
-        desc_title = self.menu.font.render("Instruções", True, (255, 255, 255))
+        desc_title = self.menu.text_cache.render(self.menu.font, "Instruções", (255, 255, 255))
         title_width = desc_title.get_width()
         title_x = center_x + desc_offset_x + (description_size[0] - title_width) // 2  # Centraliza horizontalmente
         self.menu.screen.blit(desc_title, (title_x, center_y + desc_offset_y + 10))
@@ -62,7 +45,7 @@ class InstructionSection:
             # Aplicar quebra de texto automática para cada linha usando a fonte do corpo
             wrapped_lines = self.wrap_text(line, self.body_font, max_text_width)
             for wrapped_line in wrapped_lines:
-                desc_text = self.body_font.render(wrapped_line, True, (255, 255, 255))
+                desc_text = self.menu.text_cache.render(self.body_font, wrapped_line, (255, 255, 255))
                 self.menu.screen.blit(desc_text, (center_x + desc_offset_x + 10, y_offset))
                 y_offset += 30  # Incrementa o offset vertical para cada linha
             y_offset += 30  # Adiciona espaço extra (linha vazia) após cada parágrafo
\ No newline at end of file
@@ -78,8 +78,8 @@ class MainMenu:
 
         # Título
         title = "Menu"
-        title_text = self.title_font.render(title, True, (255, 255, 255))
-        title_shadow = self.title_font.render(title, True, (50, 50, 50))  # Sombra cinza
+        title_text = self.menu.text_cache.render(self.title_font, title, (255, 255, 255))
+        title_shadow = self.menu.text_cache.render(self.title_font, title, (50, 50, 50))  # Sombra cinza
         title_rect = title_text.get_rect(center=(self.menu.width // 2, self.menu.height // 2 - 200))
         title_shadow_rect = title_rect.copy()
         title_shadow_rect.move_ip(3, 3)  # Deslocamento da sombra
@@ -90,14 +90,14 @@ class MainMenu:
         menu_y_start = self.menu.height // 2 - 50
         for i, item in enumerate(self.menu_items):
             # Renderiza o texto do item
-            text = self.item_font.render(item, True, (255, 255, 255))
+            text = self.menu.text_cache.render(self.item_font, item, (255, 255, 255))
             text_rect = text.get_rect(center=(self.menu.width // 2, menu_y_start + i * 60))
             is_hovered = text_rect.collidepoint(mouse_pos)
             color = (255, 255, 0) if (i == self.selected_item or is_hovered) else BUTTON_COLOR
-            text = self.item_font.render(item, True, color)
+            text = self.menu.text_cache.render(self.item_font, item, color)
             
             # Sombra do texto
-            shadow = self.item_font.render(item, True, (50, 50, 50))
+            shadow = self.menu.text_cache.render(self.item_font, item, (50, 50, 50))
             shadow_rect = text_rect.copy()
             shadow_rect.move_ip(2, 2)  # Deslocamento da sombra
             
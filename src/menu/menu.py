@@ -8,6 +8,8 @@ from menu.instruction_section import InstructionSection
 from menu.game_end import GameEnd
 from menu.score_list import ScoreList
 from menu.credit_menu import CreditMenu
+from menu.text_cache import TextCache
+from input_manager import InputManager
 
 class Menu:
     def __init__(self, screen, width, height, player):
@@ -18,6 +20,8 @@ class Menu:
         self.player = player
         self.current_menu = 'initial'
         self.icon_cache = {}
+        self.text_cache = TextCache()
+        self.backgrounds = {}  # 'default'/'inventory'/'end' -> fundo já com o esmaecimento aplicado
         self.selected_spell = None
         self.selected_rune = None
         self.selected_menu_item = 0
@@ -32,6 +36,12 @@ class Menu:
         self.score__list = ScoreList(self)
         self.credits = CreditMenu(self)
 
+    def change_spell_rune(self, spell_index, rune_index):
+        """Vincula/desvincula a runa (índice em spell_system.runes) ao feitiço 1-3 e grava no replay."""
+        spell_system = self.player.spell_system
+        InputManager.get_instance().record_spell_change(spell_index, rune_index)
+        spell_system.update_spell(spell_index, spell_system.runes[rune_index])
+
     def handle_input(self, events, paused, running, mouse_pos=None):
         """Processa entrada e coordena entre as seções, com manejo centralizado de ESC."""
         if mouse_pos is None:
@@ -95,29 +105,37 @@ class Menu:
             paused = True
 
         return paused, running
-    def draw(self):
-        """Desenha o menu apropriado com base no estado."""
-        # --- Carrega o fundo apenas uma vez ---
-        if not hasattr(self, "background_image"):
+
+    def _build_background(self, key):
+        """Fundo do menu com o esmaecimento já aplicado (opaco, um único blit por frame)."""
+        background = pygame.Surface((self.width, self.height)).convert()
+        if key == 'inventory':
+            background.fill((0, 0, 0))  # fundo preto puro para o inventário
+        else:
             try:
-                self.background_image = pygame.image.load("assets/ui/menu_background.png").convert()
-                self.background_image = pygame.transform.scale(self.background_image, (self.width, self.height))
+                image = pygame.image.load("assets/ui/menu_background.png").convert()
+                background.blit(pygame.transform.scale(image, (self.width, self.height)), (0, 0))
             except Exception as e:
                 print(f"Erro ao carregar background do menu: {e}")
-                # fallback em caso de erro
-                self.background_image = pygame.Surface((self.width, self.height))
-                self.background_image.fill((0, 0, 0))
-
-        # --- Desenha o fundo ---
-        if self.current_menu == 'inventory':
-            self.screen.fill((0, 0, 0))  # fundo preto puro para o inventário
-        else:
-            self.screen.blit(self.background_image, (0, 0))
+                background.fill((0, 0, 0))  # fallback em caso de erro
 
         # leve esmaecimento sobre a imagem
         overlay = pygame.Surface((self.width, self.height), pygame.SRCALPHA)
         overlay.fill((0, 0, 0, 100))
-        self.screen.blit(overlay, (0, 0))
+        background.blit(overlay, (0, 0))
+        if key == 'end':
+            background.blit(self.game_end.overlay, (0, 0))  # Esmaecimento extra da tela de fim
+        return background
+
+    def draw(self):
+        """Desenha o menu apropriado com base no estado."""
+        # --- Desenha o fundo (composto uma única vez) ---
+        background_key = self.current_menu if self.current_menu in ('inventory', 'end') else 'default'
+        background = self.backgrounds.get(background_key)
+        if background is None:
+            background = self._build_background(background_key)
+            self.backgrounds[background_key] = background
+        self.screen.blit(background, (0, 0))
 
         # --- Continua com o desenho do menu ---
         mouse_pos = pygame.mouse.get_pos()
@@ -135,7 +153,7 @@ class Menu:
             self.runes_section.draw(mouse_pos)
             self.description_section.draw(mouse_pos)
             self.instruction_section.draw()
-            back_text = self.font.render("Voltar (ESC)", True, (255, 255, 255))
+            back_text = self.text_cache.render(self.font, "Voltar (ESC)", (255, 255, 255))
             back_rect = back_text.get_rect(center=(self.width // 2, self.height // 2 + 350))
             self.screen.blit(back_text, back_rect)
         elif self.current_menu == 'controls':
@@ -31,17 +31,8 @@ class RunesSection:
                     # Se um feitiço já está selecionado, vincular a runa ao feitiço
                     if self.menu.selected_spell is not None and self.selected_item < len(self.menu.player.spell_system.runes):
                         rune = self.menu.player.spell_system.runes[self.selected_item]
-                        spell = self.menu.player.spell_system.spellbook[self.menu.selected_spell]
-                        if rune.rune_type == RuneType.MAJOR:
-                            self.menu.player.spell_system.update_spell(
-                                self.menu.selected_spell + 1,
-                                rune,
-                            )
-                        elif rune.rune_type == RuneType.MINOR:
-                            self.menu.player.spell_system.update_spell(
-                                self.menu.selected_spell + 1,
-                                rune
-                            )
+                        if rune.rune_type in (RuneType.MAJOR, RuneType.MINOR):
+                            self.menu.change_spell_rune(self.menu.selected_spell + 1, self.selected_item)
                         # Resetar seleção
                         self.menu.selected_spell = None
                         self.menu.selected_rune = None
@@ -64,7 +55,7 @@ class RunesSection:
         runes_rect = pygame.Rect(center_x + runes_offset_x, center_y + runes_offset_y, inventory_size[0], inventory_size[1])
         pygame.draw.rect(self.menu.screen, (100, 100, 100), runes_rect, 2)
 
-        runes_title = self.menu.font.render("Runas", True, (255, 255, 255))
+        runes_title = self.menu.text_cache.render(self.menu.font, "Runas", (255, 255, 255))
         self.menu.screen.blit(runes_title, (center_x + runes_offset_x + 270, center_y + runes_offset_y - 30))
 
         cell_size = 100
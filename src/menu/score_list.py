@@ -1,5 +1,6 @@
 import pygame
 import json
+import os
 from datetime import datetime
 from config import HIGHLIGHT_COLOR, BUTTON_COLOR
 
@@ -14,23 +15,37 @@ class ScoreList:
         self.pagination_font = pygame.font.SysFont('arial', 28, bold=True)  # Fonte menor para botões de paginação
         self.current_page = 0  # Página atual (0-based)
         self.items_per_page = 5  # Limite de 5 itens por página
+        self.scores = []
+        self.scores_mtime = None  # mtime do scores.json da última leitura
 
     def load_scores(self):
-        """Carrega as pontuações de scores.json, ordenadas por pontuação descendente."""
+        """Carrega as pontuações de scores.json, ordenadas por pontuação descendente.
+
+        O arquivo só é lido de novo quando o mtime muda; fora isso devolve a lista em memória.
+        """
+        try:
+            mtime = os.stat("scores.json").st_mtime_ns
+        except FileNotFoundError:
+            mtime = None
+        if mtime == self.scores_mtime:
+            return self.scores
+
+        self.scores_mtime = mtime
         try:
             with open("scores.json", "r") as file:
                 scores = json.load(file)
                 # Ordena por pontuação em ordem descendente
-                return sorted(scores, key=lambda x: x["score"], reverse=True)
+                self.scores = sorted(scores, key=lambda x: x["score"], reverse=True)
         except (FileNotFoundError, json.JSONDecodeError):
-            return []
+            self.scores = []
+        return self.scores
 
     def draw(self, mouse_pos):
         """Desenha a tela de lista de pontuações com paginação."""
         # Título
         title = "Pontuações"
-        title_text = self.title_font.render(title, True, (255, 255, 255))
-        title_shadow = self.title_font.render(title, True, (50, 50, 50))  # Sombra cinza
+        title_text = self.menu.text_cache.render(self.title_font, title, (255, 255, 255))
+        title_shadow = self.menu.text_cache.render(self.title_font, title, (50, 50, 50))  # Sombra cinza
         title_rect = title_text.get_rect(center=(self.width // 2, self.height // 2 - 200))
         title_shadow_rect = title_rect.copy()
         title_shadow_rect.move_ip(3, 3)  # Deslocamento da sombra
@@ -40,8 +55,8 @@ class ScoreList:
         # Lista de pontuações
         scores = self.load_scores()
         if not scores:
-            text = self.scores_font.render("Nenhuma pontuação disponível", True, (255, 255, 255))
-            shadow = self.scores_font.render("Nenhuma pontuação disponível", True, (50, 50, 50))
+            text = self.menu.text_cache.render(self.scores_font, "Nenhuma pontuação disponível", (255, 255, 255))
+            shadow = self.menu.text_cache.render(self.scores_font, "Nenhuma pontuação disponível", (50, 50, 50))
             text_rect = text.get_rect(topleft=(self.width // 2 - 200, self.height // 2 - 100))
             shadow_rect = text_rect.copy()
             shadow_rect.move_ip(2, 2)
@@ -58,8 +73,8 @@ class ScoreList:
                 except ValueError:
                     formatted_date = score['timestamp']  # Usa o original se falhar
                 score_text = f"{start_idx + i + 1} - {score['name']}: {score['score']} ({formatted_date})"
-                text = self.scores_font.render(score_text, True, (255, 255, 255))
-                shadow = self.scores_font.render(score_text, True, (50, 50, 50))
+                text = self.menu.text_cache.render(self.scores_font, score_text, (255, 255, 255))
+                shadow = self.menu.text_cache.render(self.scores_font, score_text, (50, 50, 50))
                 text_rect = text.get_rect(topleft=(self.width // 2 - 200, self.height // 2 - 130 + i * 60))
                 shadow_rect = text_rect.copy()
                 shadow_rect.move_ip(2, 2)
@@ -72,9 +87,9 @@ class ScoreList:
         next_button_text = "Próximo"
         
         # Botão Anterior
-        prev_button_color = (255, 255, 0) if self.pagination_font.render(prev_button_text, True, BUTTON_COLOR).get_rect(
+        prev_button_color = (255, 255, 0) if self.menu.text_cache.render(self.pagination_font, prev_button_text, BUTTON_COLOR).get_rect(
             center=(self.width // 2 - 100, button_y)).collidepoint(mouse_pos) else BUTTON_COLOR
-        prev_button = self.pagination_font.render(prev_button_text, True, prev_button_color)
+        prev_button = self.menu.text_cache.render(self.pagination_font, prev_button_text, prev_button_color)
         prev_button_rect = prev_button.get_rect(center=(self.width // 2 - 100, button_y))
         prev_button_bg_rect = prev_button_rect.inflate(16, 8)  # Padding reduzido para botões menores
         prev_bg_color = (50, 50, 100) if prev_button_color == BUTTON_COLOR else HIGHLIGHT_COLOR
@@ -83,9 +98,9 @@ class ScoreList:
         self.menu.screen.blit(prev_button, prev_button_rect)
 
         # Botão Próximo
-        next_button_color = (255, 255, 0) if self.pagination_font.render(next_button_text, True, BUTTON_COLOR).get_rect(
+        next_button_color = (255, 255, 0) if self.menu.text_cache.render(self.pagination_font, next_button_text, BUTTON_COLOR).get_rect(
             center=(self.width // 2 + 100, button_y)).collidepoint(mouse_pos) else BUTTON_COLOR
-        next_button = self.pagination_font.render(next_button_text, True, next_button_color)
+        next_button = self.menu.text_cache.render(self.pagination_font, next_button_text, next_button_color)
         next_button_rect = next_button.get_rect(center=(self.width // 2 + 100, button_y))
         next_button_bg_rect = next_button_rect.inflate(16, 8)  # Padding reduzido para botões menores
         next_bg_color = (50, 50, 100) if next_button_color == BUTTON_COLOR else HIGHLIGHT_COLOR
@@ -96,9 +111,9 @@ class ScoreList:
         # Botão Voltar (abaixo dos botões de navegação)
         back_button_text = "Voltar (Enter/Esc)"
         back_button_y = self.height // 2 + 350
-        back_button_color = (255, 255, 0) if self.button_font.render(back_button_text, True, BUTTON_COLOR).get_rect(
+        back_button_color = (255, 255, 0) if self.menu.text_cache.render(self.button_font, back_button_text, BUTTON_COLOR).get_rect(
             center=(self.width // 2, back_button_y)).collidepoint(mouse_pos) else BUTTON_COLOR
-        back_button = self.button_font.render(back_button_text, True, back_button_color)
+        back_button = self.menu.text_cache.render(self.button_font, back_button_text, back_button_color)
         back_button_rect = back_button.get_rect(center=(self.width // 2, back_button_y))
         back_button_bg_rect = back_button_rect.inflate(20, 10)
         back_bg_color = (50, 50, 100) if back_button_color == BUTTON_COLOR else HIGHLIGHT_COLOR
@@ -123,11 +138,11 @@ class ScoreList:
                     self.current_page += 1
             elif event.type == pygame.MOUSEBUTTONDOWN and event.button == 1:
                 print("Clique do mouse detectado na tela de pontuações")
-                prev_button_rect = self.pagination_font.render("Anterior", True, (255, 255, 255)).get_rect(
+                prev_button_rect = self.menu.text_cache.render(self.pagination_font, "Anterior", (255, 255, 255)).get_rect(
                     center=(self.width // 2 - 100, self.height // 2 + 200))
-                next_button_rect = self.pagination_font.render("Próximo", True, (255, 255, 255)).get_rect(
+                next_button_rect = self.menu.text_cache.render(self.pagination_font, "Próximo", (255, 255, 255)).get_rect(
                     center=(self.width // 2 + 100, self.height // 2 + 200))
-                back_button_rect = self.button_font.render("Voltar (Enter/Esc)", True, (255, 255, 255)).get_rect(
+                back_button_rect = self.menu.text_cache.render(self.button_font, "Voltar (Enter/Esc)", (255, 255, 255)).get_rect(
                     center=(self.width // 2, self.height // 2 + 350))
                 if prev_button_rect.collidepoint(mouse_pos) and self.current_page > 0:
                     print("Página anterior selecionada via clique do mouse")
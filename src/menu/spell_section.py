@@ -26,16 +26,8 @@ class SpellsSection:
                     # Se uma runa já está selecionada, vincular a runa ao feitiço
                     if self.menu.selected_rune is not None and self.selected_item < len(self.menu.player.spell_system.spellbook):
                         rune = self.menu.player.spell_system.runes[self.menu.selected_rune]
-                        if rune.rune_type == RuneType.MAJOR:
-                            self.menu.player.spell_system.update_spell(
-                                self.selected_item + 1,
-                                rune,
-                            )
-                        elif rune.rune_type == RuneType.MINOR:
-                            self.menu.player.spell_system.update_spell(
-                                self.selected_item + 1,
-                                rune
-                            )
+                        if rune.rune_type in (RuneType.MAJOR, RuneType.MINOR):
+                            self.menu.change_spell_rune(self.selected_item + 1, self.menu.selected_rune)
                         # Resetar seleção
                         self.menu.selected_spell = None
                         self.menu.selected_rune = None
@@ -57,7 +49,7 @@ class SpellsSection:
         spells_offset_y = -400
         spells_rect = pygame.Rect(center_x + spells_offset_x, center_y + spells_offset_y, spells_width, spells_height)
         pygame.draw.rect(self.menu.screen, (100, 100, 100), spells_rect, 2)
-        spells_title = self.menu.font.render("Feitiços", True, (255, 255, 255))
+        spells_title = self.menu.text_cache.render(self.menu.font, "Feitiços", (255, 255, 255))
         self.menu.screen.blit(spells_title, (center_x + spells_offset_x + 100, center_y + spells_offset_y - 90))
 
         cell_size = spells_width // 3
@@ -0,0 +1,60 @@
+import pygame
+from collections import OrderedDict
+from typing import Tuple
+
+
+class TextCache:
+    """Textos já renderizados dos menus, por (fonte, texto, cor), com descarte LRU.
+
+    Os menus redesenham os mesmos títulos, itens e botões a cada frame; com o cache
+    cada string é rasterizada uma vez e só volta a ser renderizada se for descartada.
+    As quebras de linha (wrap) também ficam guardadas, medidas com font.size.
+    """
+
+    MAX_ENTRIES = 512
+
+    def __init__(self, max_entries: int = MAX_ENTRIES):
+        self.max_entries = max_entries
+        self.entries: "OrderedDict[tuple, object]" = OrderedDict()
+
+    def _lookup(self, key, build):
+        value = self.entries.get(key)
+        if value is None:
+            value = build()
+            self.entries[key] = value
+            if len(self.entries) > self.max_entries:
+                self.entries.popitem(last=False)  # Descarta o usado há mais tempo
+        else:
+            self.entries.move_to_end(key)
+        return value
+
+    def render(self, font: pygame.font.Font, text: str, color: Tuple[int, int, int]) -> pygame.Surface:
+        """Superfície compartilhada do texto (antialias): não deve ser alterada por quem chama."""
+        return self._lookup(("render", font, text, tuple(color)), lambda: font.render(text, True, color))
+
+    def wrap(self, text: str, font: pygame.font.Font, max_width: int) -> Tuple[str, ...]:
+        """Quebra o texto em várias linhas com base na largura máxima."""
+        return self._lookup(("wrap", font, text, max_width), lambda: self._wrap(text, font, max_width))
+
+    @staticmethod
+    def _wrap(text, font, max_width):
+        words = text.split(' ')
+        lines = []
+        current_line = ""
+
+        for word in words:
+            test_line = current_line + word + " "
+            if font.size(test_line)[0] <= max_width:  # Mede sem rasterizar
+                current_line = test_line
+            else:
+                if current_line:
+                    lines.append(current_line.strip())
+                current_line = word + " "
+
+        if current_line:
+            lines.append(current_line.strip())
+
+        return tuple(lines)
+
+    def clear(self):
+        self.entries.clear()
@@ -2,12 +2,16 @@ import pygame
 import logging
 
 class MusicManager:
-    def __init__(self):
-        pygame.mixer.init()
+    def __init__(self, enabled=True):
+        self.enabled = enabled  # Desligado no modo headless (sem placa de som)
+        if self.enabled:
+            pygame.mixer.init()
         self.logger = logging.getLogger(__name__)
 
     def load_music(self, level_name):
         """Carrega e toca a música do nível especificado ou do menu."""
+        if not self.enabled:
+            return
         music_path = f"assets/audio/soundtrack/{level_name}"
         fallback_path = "assets/audio/soundtrack/backgroundmusic.ogg"
 
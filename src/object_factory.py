@@ -8,7 +8,7 @@ from objects.dynamic_objects.rune import Rune
 from objects.dynamic_objects.player import Player
 from objects.dynamic_objects.hammer_bot import HammerBot
 from objects.dynamic_objects.drone import Drone
-from xml.etree.ElementTree import Element
+from map_data import MapObject
 from typing import Union, Optional, Dict, Any
 from asset_loader import AssetLoader
 
@@ -28,10 +28,10 @@ class ObjectFactory:
     # ------------------------------------------------------------------ #
     @staticmethod
     def create_object(
-        obj: Union[Element, Dict[str, Any]],
+        obj: Union[MapObject, Dict[str, Any]],
         player_spawn: Optional[tuple] = None,
     ) -> Optional[Any]:
-        """Cria um objeto a partir de XML ou dict."""
+        """Cria um objeto a partir de um objeto do mapa ou dict."""
         name = obj.get("name") if isinstance(obj, dict) else obj.get("name")
         type_ = obj.get("type") if isinstance(obj, dict) else obj.get("type")
 
@@ -48,19 +48,14 @@ class ObjectFactory:
 
     @staticmethod
     def _create_player(
-        obj: Union[Element, Dict[str, Any]],
+        obj: Union[MapObject, Dict[str, Any]],
     ) -> Player:
         """Cria ou devolve o player já existente."""
         pos = (float(obj.get("x", 0)), float(obj.get("y", 0)))
         size = (float(obj.get("width", 0)), float(obj.get("height", 0)))
 
         # Props customizadas (player_spawn_x/y)
-        props = {}
-        if isinstance(obj, Element):
-            properties = obj.find("properties")
-            if properties:
-                for p in properties.findall("property"):
-                    props[p.get("name")] = p.get("value")
+        props = obj.properties if isinstance(obj, MapObject) else {}
 
         spawn_pos = Vector2(pos)
         if "player_spawn_x" in props and "player_spawn_y" in props:
@@ -72,14 +67,14 @@ class ObjectFactory:
 
 
     @staticmethod
-    def _create_hammer_bot(obj: Union[Element, Dict[str, Any]], *_) -> HammerBot:
+    def _create_hammer_bot(obj: Union[MapObject, Dict[str, Any]], *_) -> HammerBot:
         pos = (float(obj.get("x", 0)), float(obj.get("y", 0)))
         size = (float(obj.get("width", 0)), float(obj.get("height", 0)))
         id_ = obj.get("id")
         return HammerBot(pos, size, id=id_)
 
     @staticmethod
-    def _create_drone_bot(obj: Union[Element, Dict[str, Any]], *_) -> Drone:
+    def _create_drone_bot(obj: Union[MapObject, Dict[str, Any]], *_) -> Drone:
         pos = (float(obj.get("x", 0)), float(obj.get("y", 0)))
         size = (float(obj.get("width", 0)), float(obj.get("height", 0)))
         id_ = obj.get("id")
@@ -87,17 +82,13 @@ class ObjectFactory:
 
     @staticmethod
     def _create_rune(
-        obj: Union[Element, Dict[str, Any]],
+        obj: Union[MapObject, Dict[str, Any]],
     ) -> Optional[Rune]:
-        if isinstance(obj, Element):
+        if isinstance(obj, MapObject):
             name = obj.get("name")
             pos = (float(obj.get("x", 0)), float(obj.get("y", 0)))
             size = (float(obj.get("width", 0)), float(obj.get("height", 0)))
-            props = {}
-            properties = obj.find("properties")
-            if properties:
-                for p in properties.findall("property"):
-                    props[p.get("name")] = p.get("value")
+            props = obj.properties
             rune_type = props.get("rune_type", "major")
             effect = props.get("effect")
         else:  # dict
@@ -121,15 +112,11 @@ class ObjectFactory:
         return Rune(pos, size, name, image, rune_type, 10, effect)
 
     @staticmethod
-    def _create_door(obj: Element, *_) -> Door:
+    def _create_door(obj: MapObject, *_) -> Door:
         name = obj.get("name")
         pos = (float(obj.get("x", 0)), float(obj.get("y", 0)))
         size = (float(obj.get("width", 0)), float(obj.get("height", 0)))
-        props = {}
-        properties = obj.find("properties")
-        if properties:
-            for p in properties.findall("property"):
-                props[p.get("name")] = p.get("value")
+        props = obj.properties
         door_spawn = (
             float(props.get("player_spawn_x", 100)),
             float(props.get("player_spawn_y", 300)),
@@ -137,7 +124,7 @@ class ObjectFactory:
         return Door(pos, size, name, door_spawn)
 
     @staticmethod
-    def _create_alarm(obj: Element, *_) -> Alarm:
+    def _create_alarm(obj: MapObject, *_) -> Alarm:
         pos = (float(obj.get("x", 0)), float(obj.get("y", 0)))
         size = (float(obj.get("width", 0)), float(obj.get("height", 0)))
         name = obj.get("name")
@@ -145,7 +132,7 @@ class ObjectFactory:
 
     @staticmethod
     def create_wave_enemy(
-        obj: Union[Element, Dict[str, Any]],
+        obj: Union[MapObject, Dict[str, Any]],
         custom_max_health: Optional[int] = None,
         custom_speed: Optional[float] = None,
     ) -> Optional[Any]:
@@ -161,14 +148,11 @@ class ObjectFactory:
         # propriedades customizadas
         can_fall = False
         facing_right = False
-        if isinstance(obj, Element):
-            props_elem = obj.find("properties")
-            if props_elem:
-                for p in props_elem.findall("property"):
-                    if p.get("name") == "can_fall":
-                        can_fall = p.get("value").lower() == "true"
-                    if p.get("name") == "facing_right":
-                        facing_right = p.get("value").lower() == "true"
+        if isinstance(obj, MapObject):
+            if "can_fall" in obj.properties:
+                can_fall = obj.properties["can_fall"].lower() == "true"
+            if "facing_right" in obj.properties:
+                facing_right = obj.properties["facing_right"].lower() == "true"
 
         if name == "hammer_bot":
             enemy = HammerBot(pos, size, custom_max_health=custom_max_health,
@@ -186,5 +170,5 @@ class ObjectFactory:
         return enemy
 
     @staticmethod
-    def create_terrain(position: tuple, size: tuple, image: pygame.Surface) -> Terrain:
+    def create_terrain(position: tuple, size: tuple, image: Optional[pygame.Surface] = None) -> Terrain:
         return Terrain(position, size, image)
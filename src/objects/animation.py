@@ -1,7 +1,14 @@
 from objects.sprite import Sprite
 from objects.animation_type import AnimationType
+from typing import Iterable
 
 class Animation:
-    def __init__(self, animation: list[Sprite], type: AnimationType):
-        self.animation = animation
+    """Sequência imutável de frames, compartilhada entre todas as instâncias que a usam.
+
+    O estado da reprodução (frame atual, timer) fica na entidade, não aqui.
+    """
+    __slots__ = ("animation", "type")
+
+    def __init__(self, animation: Iterable[Sprite], type: AnimationType):
+        self.animation = tuple(animation)
         self.type = type
@@ -1,37 +1,58 @@
 from objects.animation import Animation
 from objects.sprite import Sprite
 from objects.animation_type import AnimationType
+from asset_loader import AssetLoader
 import os
 import pygame
 import json
+from typing import Dict, Tuple
 
 class AnimationManager:
     AnimationType = AnimationType
+
+    # Conjuntos de animações já carregados, compartilhados por todo o processo.
+    # Chave: (image_path, json_path, largura, altura) ou (folder_path, animation_type)
+    _cache: Dict[tuple, Tuple[Animation, ...]] = {}
+
     def __init__(self, animationList=None):
         self.animationList = animationList if animationList is not None else []
-        
+
+    @classmethod
+    def clear_cache(cls):
+        cls._cache.clear()
 
     def load_sprites_from_folder(self, folder_path, animation_type: AnimationType):
         """Carrega sprites de uma pasta e cria uma animação, adicionando-a à lista."""
+        key = (folder_path, animation_type)
+        if key in self._cache:
+            self.animationList.extend(self._cache[key])
+            return
         sprites = []
         try:
             for filename in sorted(os.listdir(folder_path)):
                 if filename.endswith(".png"):
                     path = os.path.join(folder_path, filename)
-                    image = pygame.image.load(path).convert_alpha()
+                    image = AssetLoader.convert_surface(pygame.image.load(path))
                     sprites.append(Sprite(image))
             if not sprites:
                 print(f"Aviso: Nenhum sprite PNG encontrado em {folder_path}")
                 return
             animation = Animation(sprites, animation_type)
+            self._cache[key] = (animation,)
             self.animationList.append(animation)
         except FileNotFoundError:
             print(f"Erro: Pasta {folder_path} não encontrada!")
 
 
     def load_animations_from_json(self, size, image_path, json_path):
+        """Adiciona as animações da spritesheet à lista; disco e composição só na primeira vez."""
+        key = (image_path, json_path, size.x, size.y)
+        if key in self._cache:
+            self.animationList.extend(self._cache[key])
+            return
+
         try:
-            sheet = pygame.image.load(image_path).convert_alpha()
+            sheet = AssetLoader.convert_surface(pygame.image.load(image_path))
             with open(json_path, 'r') as f:
                 data = json.load(f)
             
@@ -40,6 +61,7 @@ class AnimationManager:
             ANCHOR_X = CHARACTER_WIDTH // 2  # 10
             ANCHOR_Y = CHARACTER_HEIGHT  # 30
 
+            animations = []
             for anim_name, frames in data.items():
                 sprites = []
                 anim_type = AnimationType[anim_name.upper()]
@@ -70,8 +92,10 @@ class AnimationManager:
                     #    print(f"Frame {i+1}: w={w}, h={h}, final_width={final_width}, final_height={final_height}, draw_x={draw_x}, draw_y={draw_y}, offset_x={sprite.offset_x}, offset_y={sprite.offset_y}")
                     sprites.append(sprite)
 
-                animation = Animation(sprites, anim_type)
-                self.animationList.append(animation)
+                animations.append(Animation(sprites, anim_type))
+
+            self._cache[key] = tuple(animations)
+            self.animationList.extend(animations)
 
         except Exception as e:
             print(f"Erro ao carregar spritesheet ou JSON: {e}")
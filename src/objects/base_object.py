@@ -6,6 +6,9 @@ from collider import Collider
 
 class Object:
 
+    marked_for_removal = False  # Padrão para objetos que nunca saem do jogo (ex: jogador, terrenos)
+    handle = None  # Id no EntityStore, atribuído quando o objeto vira entidade
+
     def __init__(self, position, size):
         self.position = Vector2(position)
         self.size = Vector2(size)
@@ -1,9 +1,12 @@
 from objects.dynamic_objects.character import Character
 from config import SPEED
 import pygame
+from sound_bank import SoundBank
 import math
 
 class Drone(Character):
+    DEATH_SFX = "assets/audio/soundEffects/enemy_death.mp3"
+
     def __init__(self, position, size, sprite=(255, 0, 0), invincible=False, 
                  max_health=30, attackable=True, damage=15, 
                  custom_speed=None, gravity=0, speed_vector=(0, 0), jump_speed=0,
@@ -246,9 +249,7 @@ class Drone(Character):
     def update_image(self):
         """Atualiza o frame de exibição do drone."""
         if self.current_animation and self.current_animation.animation:
-            sprite = self.current_animation.animation[self.current_frame].image
-            if not self.facing_right:
-                sprite = pygame.transform.flip(sprite, True, False)
+            sprite = self.current_animation.animation[self.current_frame].get_image(self.facing_right)
 
             if getattr(self, "visible", True):
                 self.image = sprite
@@ -269,7 +270,7 @@ class Drone(Character):
         print(f"Drone sofreu {enemy_damage} de dano. Vida restante: {self.health}")
 
         if self.health <= 0:
-            pygame.mixer.Sound("assets/audio/soundEffects/enemy_death.mp3").play()
+            SoundBank.get_instance().play(self.DEATH_SFX, SoundBank.HIGH)
             self.set_animation(self.animation_manager.AnimationType.DEATH)
             self.is_dying = True
             self.death_falling = True
@@ -1,11 +1,15 @@
 from objects.dynamic_objects.character import Character
 from config import SPEED, GRAVITY
+from collision_layers import TERRAIN
 import pygame
+from sound_bank import SoundBank
 from typing import Optional
 from objects.animation_manager import AnimationManager
 import json
 
 class HammerBot(Character):
+    DEATH_SFX = "assets/audio/soundEffects/enemy_death.mp3"
+
     def __init__(self, position, size, sprite=(0, 255, 0), invincible=False, 
                  max_health=40, attackable=True, damage=20, 
                  custom_speed=None, gravity=0, speed_vector=(0, 0), jump_speed=0,
@@ -78,9 +82,9 @@ class HammerBot(Character):
         right_has_platform = False
         
         for platform in platforms:
-            if left_sensor_rect.colliderect(platform.rect) and platform.colliders[0].type == "terrain":
+            if left_sensor_rect.colliderect(platform.rect) and platform.colliders[0].layer == TERRAIN:
                 left_has_platform = True
-            if right_sensor_rect.colliderect(platform.rect) and platform.colliders[0].type == "terrain":
+            if right_sensor_rect.colliderect(platform.rect) and platform.colliders[0].layer == TERRAIN:
                 right_has_platform = True
                 
         return left_has_platform, right_has_platform
@@ -187,9 +191,7 @@ class HammerBot(Character):
 
     def update_image(self):
         if self.current_animation and self.current_animation.animation:
-            sprite = self.current_animation.animation[self.current_frame].image
-            if not self.facing_right:
-                sprite = pygame.transform.flip(sprite, True, False)
+            sprite = self.current_animation.animation[self.current_frame].get_image(self.facing_right)
             self.image = sprite
             self.rect = self.image.get_rect(topleft=(self.position.x, self.position.y))
         else:
@@ -224,7 +226,7 @@ class HammerBot(Character):
         print(f"HammerBot sofreu {enemy_damage} de dano. Vida restante: {self.health}")
 
         if self.health <= 0:
-            pygame.mixer.Sound("assets/audio/soundEffects/enemy_death.mp3").play(),
+            SoundBank.get_instance().play(self.DEATH_SFX, SoundBank.HIGH)
             self.set_animation(self.animation_manager.AnimationType.DEATH)
             self.colliders[2].active = False
             self.marked_for_removal = False  # Só será marcado quando a animação terminar
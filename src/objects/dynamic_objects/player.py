@@ -1,6 +1,8 @@
 from objects.dynamic_objects.character import Character
 from config import SPEED, JUMP_SPEED, GRAVITY
 import pygame
+from sound_bank import SoundBank
+from input_manager import InputManager
 from typing import Optional
 from objects.animation_manager import AnimationManager
 from spell_system.spell_system import SpellSystem
@@ -19,15 +21,16 @@ class Player(Character):
         self.spell_system = SpellSystem()
 
 
+        sound_bank = SoundBank.get_instance()
         self.attack_sfx = {
-            self.animation_manager.AnimationType.ATTACK1: pygame.mixer.Sound("assets/audio/soundEffects/sword/Sword Attack 1.ogg"),
-            self.animation_manager.AnimationType.ATTACK2: pygame.mixer.Sound("assets/audio/soundEffects/sword/Sword Attack 2.ogg"),
-            self.animation_manager.AnimationType.ATTACK3: pygame.mixer.Sound("assets/audio/soundEffects/sword/Sword Attack 3.ogg"),
+            self.animation_manager.AnimationType.ATTACK1: sound_bank.get("assets/audio/soundEffects/sword/Sword Attack 1.ogg"),
+            self.animation_manager.AnimationType.ATTACK2: sound_bank.get("assets/audio/soundEffects/sword/Sword Attack 2.ogg"),
+            self.animation_manager.AnimationType.ATTACK3: sound_bank.get("assets/audio/soundEffects/sword/Sword Attack 3.ogg"),
         }
         self.attack_hit_sfx = {
-            self.animation_manager.AnimationType.ATTACK1: pygame.mixer.Sound("assets/audio/soundEffects/sword/Sword Impact Hit 1.ogg"),
-            self.animation_manager.AnimationType.ATTACK2: pygame.mixer.Sound("assets/audio/soundEffects/sword/Sword Impact Hit 2.ogg"),
-            self.animation_manager.AnimationType.ATTACK3: pygame.mixer.Sound("assets/audio/soundEffects/sword/Sword Impact Hit 3.ogg"),
+            self.animation_manager.AnimationType.ATTACK1: sound_bank.get("assets/audio/soundEffects/sword/Sword Impact Hit 1.ogg"),
+            self.animation_manager.AnimationType.ATTACK2: sound_bank.get("assets/audio/soundEffects/sword/Sword Impact Hit 2.ogg"),
+            self.animation_manager.AnimationType.ATTACK3: sound_bank.get("assets/audio/soundEffects/sword/Sword Impact Hit 3.ogg"),
         }
 
         self.coyote_time_max = 0.15  # tempo máximo em segundos para o coyote frame
@@ -93,7 +96,7 @@ class Player(Character):
             self.set_animation(self.animation_manager.AnimationType.IDLE1)
 
     def update(self, delta_time):
-        keys = pygame.key.get_pressed()
+        keys = InputManager.get_instance().get_pressed()
         self.update_timers(delta_time)
         self.handle_movement(keys, delta_time)
         self.handle_attack(keys)
@@ -292,7 +295,7 @@ class Player(Character):
                         self.already_hit_targets.clear()
                         # Tocar som de ataque correspondente
                     if animation_type in self.attack_sfx:
-                        self.attack_sfx[animation_type].play()
+                        SoundBank.get_instance().play(self.attack_sfx[animation_type], SoundBank.NORMAL)
 
                     else:
                         self.is_casting = False
@@ -304,9 +307,7 @@ class Player(Character):
 
     def update_image(self):
         if self.current_animation and self.current_animation.animation:
-            sprite = self.current_animation.animation[self.current_frame].image
-            if not self.facing_right:
-                sprite = pygame.transform.flip(sprite, True, False)
+            sprite = self.current_animation.animation[self.current_frame].get_image(self.facing_right)
 
             # Salve o anchor (midbottom atual) antes de mudar a imagem
             anchor = self.rect.midbottom
@@ -376,7 +377,7 @@ class Player(Character):
 
     def handle_hit(self):
         if self.last_attack and self.last_attack in self.attack_hit_sfx:
-            self.attack_hit_sfx[self.last_attack].play()
+            SoundBank.get_instance().play(self.attack_hit_sfx[self.last_attack], SoundBank.NORMAL)
         self.mana_boost_timer = self.mana_boost_duration  # Ativa o boost de regeneração de mana
             
     def handle_pickup(self, rune):
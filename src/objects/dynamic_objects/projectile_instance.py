@@ -3,19 +3,53 @@ from objects.entity_with_animation import EntityWithAnimation
 import pygame
 import math
 from typing import List
-from config import SPEED
 import random
+from sound_bank import SoundBank
 
 class ProjectileInstance(EntityWithAnimation):
-    """Representa um projétil individual disparado na tela."""
+    """Representa um projétil individual disparado na tela.
+
+    As instâncias são reaproveitadas pelo ProjectilePool: o construtor faz a parte fixa
+    (colliders, animações) e reset() prepara cada novo disparo.
+    """
+
+    # Sprite configuration for different projectile types
+    SPRITE_CONFIG = {
+        "Default": {"image_path": "assets/spells/fire/Firebolt SpriteSheet.png", "json_path": "assets/spells/fire/Firebolt SpriteSheet.json"},
+        "Fan": {"image_path": "assets/spells/fire/Firebolt SpriteSheet.png", "json_path": "assets/spells/fire/Firebolt SpriteSheet.json"},
+        "Multiple": {"image_path": "assets/spells/fire/Firebolt SpriteSheet.png", "json_path": "assets/spells/fire/Firebolt SpriteSheet.json"},
+        "Homing": {"image_path": "assets/spells/fire/Firebolt SpriteSheet.png", "json_path": "assets/spells/fire/Firebolt SpriteSheet.json"},
+        # Add more configurations here for other types, e.g.:
+        # "Ice": {"image_path": "assets/spells/ice/Icebolt SpriteSheet.png", "json_path": "assets/spells/ice/Icebolt SpriteSheet.json"},
+    }
+
     def __init__(self, position: tuple, size: tuple, speed: float, damage: float, direction: float,
                  effects: dict, major_rune_name: str, minor_rune_names: List[str], owner,
                  facing_right: bool, homing: bool = False, hit_sfx: List[pygame.mixer.Sound] = None):
         super().__init__(position=position, size=size, sprite=(255, 0, 0))
         self.name = "Projectile"
         self.tag = "projectile"
-        self.position = pygame.Vector2(position)
         self.size = pygame.Vector2(size)
+        self.already_hit_targets = set()
+        self.pooled = False  # True enquanto está livre no ProjectilePool
+        self.add_collider((0, 0), (self.size.x, self.size.y), type='body', active=True)
+        self.add_collider((0, 0), (self.size.x, self.size.y), type='attack_box', active=True)
+
+        # Animation setup
+        self.current_animation = None
+        self.current_frame = 0
+        self.animation_timer = 0
+        self.animation_speed = 0.1  # Seconds per frame, adjustable
+        self.sprite_config = None  # Spritesheet cujas animações estão em animation_manager
+
+        self.reset(position, speed, damage, direction, effects, major_rune_name, minor_rune_names,
+                   owner, facing_right, homing, hit_sfx)
+
+    def reset(self, position: tuple, speed: float, damage: float, direction: float,
+              effects: dict, major_rune_name: str, minor_rune_names: List[str], owner,
+              facing_right: bool, homing: bool = False, hit_sfx: List[pygame.mixer.Sound] = None):
+        """Prepara a instância para um novo disparo (sem ler disco nem criar colliders)."""
+        self.position = pygame.Vector2(position)
         self.speed = speed
         self.damage = damage
         self.direction = direction
@@ -31,39 +65,27 @@ class ProjectileInstance(EntityWithAnimation):
         self.marked_for_removal = False
         self.dx = math.cos(direction) if major_rune_name == "Fan" else 0
         self.dy = -math.sin(direction) if major_rune_name == "Fan" else 0
-        self.already_hit_targets = set()
-        self.add_collider((0, 0), (self.size.x, self.size.y), type='body', active=True)
-        self.add_collider((0, 0), (self.size.x, self.size.y), type='attack_box', active=True)
-
-        # Animation setup
-        self.current_animation = None
-        self.current_frame = 0
-        self.animation_timer = 0
-        self.animation_speed = 0.1  # Seconds per frame, adjustable
+        self.already_hit_targets.clear()
         self.use_animation = True  # Always use firebolt animation
 
         if self.use_animation and self.animation_manager:
-            # Sprite configuration for different projectile types
-            sprite_config = {
-                "Default": {"image_path": "assets/spells/fire/Firebolt SpriteSheet.png", "json_path": "assets/spells/fire/Firebolt SpriteSheet.json"},
-                "Fan": {"image_path": "assets/spells/fire/Firebolt SpriteSheet.png", "json_path": "assets/spells/fire/Firebolt SpriteSheet.json"},
-                "Multiple": {"image_path": "assets/spells/fire/Firebolt SpriteSheet.png", "json_path": "assets/spells/fire/Firebolt SpriteSheet.json"},
-                "Homing": {"image_path": "assets/spells/fire/Firebolt SpriteSheet.png", "json_path": "assets/spells/fire/Firebolt SpriteSheet.json"},
-                # Add more configurations here for other types, e.g.:
-                # "Ice": {"image_path": "assets/spells/ice/Icebolt SpriteSheet.png", "json_path": "assets/spells/ice/Icebolt SpriteSheet.json"},
-            }
-            
-            config = sprite_config.get(self.major_rune_name, sprite_config["Default"])
-            self.animation_manager.load_animations_from_json(
-                self.size,
-                image_path=config["image_path"],
-                json_path=config["json_path"]
-            )
+            config = self.SPRITE_CONFIG.get(self.major_rune_name, self.SPRITE_CONFIG["Default"])
+            if config is not self.sprite_config:
+                # Animações compartilhadas pelo cache do AnimationManager: só a primeira carga lê o disco
+                self.sprite_config = config
+                self.animation_manager.animationList = []
+                self.animation_manager.load_animations_from_json(
+                    self.size,
+                    image_path=config["image_path"],
+                    json_path=config["json_path"]
+                )
             if not self.animation_manager.animationList:
                 print(f"Erro: Nenhuma animação carregada para {self.major_rune_name}")
                 self.use_animation = False  # Fallback to circle if animation fails
             else:
+                self.current_animation = None  # Recomeça a animação do primeiro frame
                 self.set_animation(self.animation_manager.AnimationType.ATTACK1)
+        self.sync_position()
 
     def set_animation(self, animation_type):
         """Set the current animation based on type."""
@@ -81,51 +103,22 @@ class ProjectileInstance(EntityWithAnimation):
         print(f"Aviso: Animação {animation_type} não encontrada")
         self.use_animation = False  # Fallback to circle if animation not found
 
-    def update_animation(self, delta_time: float):
-        """Update the animation frame."""
-        if not self.use_animation or not self.animation_manager or not self.current_animation:
-            return
-
-        self.animation_timer += delta_time
-        if self.animation_timer >= self.animation_speed:
-            self.animation_timer -= self.animation_speed
-            self.current_frame = (self.current_frame + 1) % len(self.current_animation.animation)
-            self.update_image()
-
     def update_image(self):
         """Update the projectile's image based on the current animation frame."""
         if self.current_animation and self.current_animation.animation:
-            sprite = self.current_animation.animation[self.current_frame].image
-            if not self.facing_right:
-                sprite = pygame.transform.flip(sprite, True, False)
+            sprite = self.current_animation.animation[self.current_frame].get_image(self.facing_right)
             self.image = sprite
             self.rect = self.image.get_rect(topleft=(self.position.x, self.position.y))
         else:
             self.image.fill(self.sprite)  # Fallback to default sprite
 
-    def update(self, delta_time: float, max_distance: float = 500):
-        """Atualiza a posição e a animação do projétil."""
-        if self.major_rune_name == "Fan":
-            self.position.x += self.dx * (self.speed + SPEED) * delta_time
-            self.position.y += self.dy * (self.speed + SPEED) * delta_time
-            distance_traveled = math.hypot(self.position.x - self.start_x, self.position.y - self.start_y)
-        else:
-            self.position.x += self.direction * (self.speed + SPEED) * delta_time
-            distance_traveled = abs(self.position.x - self.start_x)
-
-        if distance_traveled > max_distance:
-            self.marked_for_removal = True
-
-        if self.use_animation:
-            self.update_animation(delta_time)
-
     def draw(self, surface, camera):
         """Desenha o projétil na tela."""
         screen_pos = camera.apply(pygame.Rect(self.position.x, self.position.y, 0, 0)).center
 
         if self.use_animation and self.image:
             screen_rect = camera.apply(self.rect)
-            surface.blit(self.image, screen_rect.topleft)
+            surface.blit(camera.apply_surface(self.image), screen_rect)
         else:
             # Fallback drawing method (retained for easy switching)
             color = (255, 0, 0)  # Default: red
@@ -150,4 +143,4 @@ class ProjectileInstance(EntityWithAnimation):
 
     def handle_hit(self):
         """Toca o som de colisão."""
-        random.choice(self.hit_sfx).play()
\ No newline at end of file
+        SoundBank.get_instance().play(random.choice(self.hit_sfx), SoundBank.LOW)
\ No newline at end of file
@@ -6,9 +6,9 @@ import math
 class Rune(EntityWithSprite):
     def __init__(self, position, size, name: str, image, rune_type, cost: int, effect: Optional[Callable] = None):
         super().__init__(position, size, image)
+        self.tag = "rune"
         self.add_collider((0, 0), (self.size.x, self.size.y), type='item', active=True)
         self.name = name
-        self.tag = "rune"
         self.rune_type = RuneType.MAJOR if rune_type == "major" else RuneType.MINOR
         self.cost = cost
         self.effect = effect
@@ -33,7 +33,6 @@ class ShieldInstance(EntityWithSprite):
             1: "assets/spells/multiple_shield3.png"
         }
         self.image = AssetLoader.load_image("assets/spells/shield.png" if not is_multiple else self.sprite_states.get(health, "assets/spells/multiple_shield1.png"))
-        self.image = self.image.convert_alpha()  # Garante suporte a alpha
 
     def update(self, delta_time: float, owner_shield_health, on_ground: bool):
         """Atualiza a posição, levitação e timer do escudo."""
@@ -89,6 +88,5 @@ class ShieldInstance(EntityWithSprite):
             self.health -= 1  # Decrementa uma vida, absorvendo o dano completamente
             if self.health > 0:
                 self.image = AssetLoader.load_image(self.sprite_states.get(self.health, "assets/spells/multiple_shield3.png"))
-                self.image = self.image.convert_alpha()
             else:
                 self.marked_for_removal = True  # Remove após o terceiro hit
\ No newline at end of file
@@ -1,7 +1,12 @@
 import pygame
 
 class Sprite:
-    def __init__(self, image):
+    def __init__(self, image, flipped_image=None):
         self.image = image
+        # Versão espelhada calculada uma vez no carregamento, para não alocar a cada troca de frame
+        self.flipped_image = flipped_image if flipped_image is not None else pygame.transform.flip(image, True, False)
         self.offset_x = 0  # Offset para alinhar o centro do corpo
-        self.offset_y = 0  # Offset para alinhar a base
\ No newline at end of file
+        self.offset_y = 0  # Offset para alinhar a base
+
+    def get_image(self, facing_right=True):
+        return self.image if facing_right else self.flipped_image
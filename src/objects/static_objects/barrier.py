@@ -1,8 +1,17 @@
 from objects.entity_with_animation import EntityWithAnimation
 import pygame
+from asset_loader import AssetLoader
 from typing import List
+from objects.sprite import Sprite
 
 class Barrier(EntityWithAnimation):
+    FRAME_PATHS = [
+        "assets/spells/barrier1.png",
+        "assets/spells/barrier2.png",
+        "assets/spells/barrier3.png"
+    ]
+    _frames: List[Sprite] = []  # Frames (com a versão espelhada) compartilhados entre as barreiras
+
     def __init__(self, position, size, duration: float, owner, facing_right: bool):
         super().__init__(position, size, sprite=(255, 0, 0))
         self.name = "Barrier"
@@ -21,11 +30,9 @@ class Barrier(EntityWithAnimation):
         self.use_animation = True
 
         # Load barrier animation frames
-        self.animation_frames = [
-            pygame.image.load("assets/spells/barrier1.png").convert_alpha(),
-            pygame.image.load("assets/spells/barrier2.png").convert_alpha(),
-            pygame.image.load("assets/spells/barrier3.png").convert_alpha()
-        ]
+        if not Barrier._frames:
+            Barrier._frames = [Sprite(AssetLoader.load_image(path)) for path in self.FRAME_PATHS]
+        self.animation_frames = Barrier._frames
 
         # Set initial image
         self.update_image()  # Chama update_image para configurar a imagem inicial com flip
@@ -43,10 +50,7 @@ class Barrier(EntityWithAnimation):
 
     def update_image(self):
         """Update the barrier's image based on the current animation frame."""
-        self.image = self.animation_frames[self.current_frame]
-        # Flip the image based on facing_right
-        if not self.facing_right:
-            self.image = pygame.transform.flip(self.image, True, False)
+        self.image = self.animation_frames[self.current_frame].get_image(self.facing_right)
         self.rect = self.image.get_rect(bottomleft=(self.position.x, self.position.y))
 
     def update(self, delta_time: float, *args, **kwargs):
@@ -0,0 +1,62 @@
+# parallax_background.py
+import math
+import pygame
+from typing import Dict, List, Tuple
+
+
+class ParallaxBackground:
+    """Camadas de fundo com parallax, do tamanho da tela (e não do mundo).
+
+    Cada camada é escalada uniformemente só até cobrir a altura da tela mais o quanto
+    ela percorre na vertical; na horizontal ela se repete com offset modular, então
+    cada camada custa de 2 a 4 blits por frame, independente do tamanho do mapa.
+    """
+
+    MAX_HEIGHT_RATIO = 1.5  # Altura máxima da camada em relação à tela
+
+    def __init__(self, layers: List[Dict]):
+        self.layers = layers
+
+    @classmethod
+    def scaled_size(
+        cls,
+        image_size: Tuple[int, int],
+        factor: float,
+        screen_size: Tuple[int, int],
+        world_size: Tuple[int, int],
+        camera_zoom: float
+    ) -> Tuple[int, int]:
+        """Tamanho em que a camada é guardada: tela + percurso vertical, mantendo a proporção da imagem."""
+        image_w, image_h = image_size
+        screen_w, screen_h = screen_size
+        travel = max(0.0, (world_size[1] - screen_h / camera_zoom) * factor)
+        height = math.ceil(min(screen_h + travel, screen_h * cls.MAX_HEIGHT_RATIO))
+        width = max(1, round(image_w * height / image_h))
+        return width, height
+
+    def draw(self, surface: pygame.Surface, camera):
+        screen_w, screen_h = surface.get_size()
+        max_camera_y = max(0.0, camera.world_height - screen_h / camera.zoom)
+
+        for layer in self.layers:
+            image = layer['surface']
+            factor = layer['parallax_factor']
+            width, height = image.get_size()
+
+            # Vertical: a camada anda factor * câmera; se a altura foi limitada, o percurso é comprimido
+            room = max(0, height - screen_h)
+            shift = camera.offset.y * factor
+            travel = max_camera_y * factor
+            if travel > room:
+                shift *= room / travel
+            offset_y = -min(room, max(0.0, shift))
+
+            # Horizontal: repete a camada a partir do offset modular
+            offset_x = -((camera.offset.x * factor) % width)
+            layer['offset_x'] = offset_x
+            layer['offset_y'] = offset_y
+
+            x = offset_x
+            while x < screen_w:
+                surface.blit(image, (x, offset_y))
+                x += width
@@ -0,0 +1,198 @@
+# profiler.py
+import json
+import time
+import pygame
+from collections import deque
+from typing import Deque, Dict, List, Optional, Tuple
+
+
+class _NullSection:
+    """Seção vazia devolvida quando o profiler está desligado (custo quase zero)."""
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, exc_type, exc, tb):
+        return False
+
+
+class _Section:
+    __slots__ = ("profiler", "name", "start")
+
+    def __init__(self, profiler: "FrameProfiler", name: str):
+        self.profiler = profiler
+        self.name = name
+        self.start = 0.0
+
+    def __enter__(self):
+        self.start = time.perf_counter()
+        return self
+
+    def __exit__(self, exc_type, exc, tb):
+        self.profiler._record(self.name, self.start, time.perf_counter())
+        return False
+
+
+class FrameProfiler:
+    """Mede cada fase do frame, mostra histogramas móveis na tela e exporta trace do Chrome.
+
+    Uso: ``with FrameProfiler.get_instance().section("update.collision"): ...``
+    """
+
+    HISTORY_FRAMES = 240   # Frames mostrados nos histogramas
+    TRACE_SECONDS = 10.0   # Janela de eventos guardada para o trace
+    GRAPH_MAX_MS = 33.3    # Altura máxima do gráfico (2 frames a 60 Hz)
+
+    # --------------------------------------------------------------
+    #  SINGLETON
+    # --------------------------------------------------------------
+    _instance: Optional["FrameProfiler"] = None
+
+    def __new__(cls, *args, **kwargs):
+        if cls._instance is None:
+            cls._instance = super().__new__(cls)
+        return cls._instance
+
+    # --------------------------------------------------------------
+    #  __init__ (executado apenas uma vez)
+    # --------------------------------------------------------------
+    def __init__(self):
+        if hasattr(self, "_initialized"):
+            return
+        self._initialized = True
+
+        self.enabled = False
+        self.epoch = time.perf_counter()
+        self.history: Dict[str, Deque[float]] = {}  # seção -> ms por frame
+        self.frame_totals: Dict[str, float] = {}    # seção -> ms acumulados no frame atual
+        self.events: Deque[Tuple[str, float, float]] = deque()  # (seção, início, fim) em segundos
+        self.frame_start: Optional[float] = None
+        self.font = None
+        self._null_section = _NullSection()
+
+    # --------------------------------------------------------------
+    #  COLETA
+    # --------------------------------------------------------------
+    def toggle(self):
+        self.enabled = not self.enabled
+        self.frame_start = None
+        self.frame_totals.clear()
+        if not self.enabled:
+            self.history.clear()
+            self.events.clear()
+
+    def section(self, name: str):
+        if not self.enabled:
+            return self._null_section
+        return _Section(self, name)
+
+    def _record(self, name: str, start: float, end: float):
+        self.frame_totals[name] = self.frame_totals.get(name, 0.0) + (end - start) * 1000.0
+        self.events.append((name, start, end))
+
+    def begin_frame(self):
+        if self.enabled:
+            self.frame_start = time.perf_counter()
+            self.frame_totals.clear()
+
+    def end_frame(self):
+        if not self.enabled or self.frame_start is None:
+            return
+        end = time.perf_counter()
+        self._record("frame", self.frame_start, end)
+
+        # Seções ausentes neste frame contam como zero para manter os histogramas alinhados
+        for name in self.frame_totals.keys() - self.history.keys():
+            self.history[name] = deque(maxlen=self.HISTORY_FRAMES)
+        for name, values in self.history.items():
+            values.append(self.frame_totals.get(name, 0.0))
+
+        limit = end - self.TRACE_SECONDS
+        while self.events and self.events[0][2] < limit:
+            self.events.popleft()
+        self.frame_start = None
+
+    # --------------------------------------------------------------
+    #  EXPORTAÇÃO
+    # --------------------------------------------------------------
+    def dump_chrome_trace(self, path: Optional[str] = None, seconds: Optional[float] = None) -> str:
+        """Salva os eventos dos últimos segundos no formato do chrome://tracing (Perfetto)."""
+        if path is None:
+            path = time.strftime("profile_trace_%Y%m%d_%H%M%S.json")
+        events = list(self.events)
+        if seconds is not None and events:
+            limit = events[-1][2] - seconds
+            events = [event for event in events if event[2] >= limit]
+
+        trace_events = [
+            {
+                "name": name,
+                "cat": name.split(".", 1)[0],
+                "ph": "X",
+                "ts": round((start - self.epoch) * 1_000_000, 3),
+                "dur": round((end - start) * 1_000_000, 3),
+                "pid": 1,
+                "tid": 1,
+            }
+            for name, start, end in events
+        ]
+        with open(path, "w") as file:
+            json.dump({"traceEvents": trace_events, "displayTimeUnit": "ms"}, file)
+        return path
+
+    # --------------------------------------------------------------
+    #  OVERLAY
+    # --------------------------------------------------------------
+    def summary(self) -> List[Tuple[str, float, float, float]]:
+        """(seção, média, p95, último) em ms, na ordem alfabética (pais antes dos filhos)."""
+        rows = []
+        for name in sorted(self.history):
+            values = self.history[name]
+            if not values:
+                continue
+            ordered = sorted(values)
+            p95 = ordered[min(len(ordered) - 1, int(len(ordered) * 0.95))]
+            rows.append((name, sum(values) / len(values), p95, values[-1]))
+        return rows
+
+    def draw(self, surface: pygame.Surface):
+        if not self.enabled or not self.history:
+            return
+        if self.font is None:
+            self.font = pygame.font.SysFont('consolas', 14)
+
+        rows = self.summary()
+        row_height = 18
+        graph_width = self.HISTORY_FRAMES
+        label_width = 330
+        width = label_width + graph_width + 20
+        height = row_height * len(rows) + 10
+        x0, y0 = 10, 10
+
+        panel = pygame.Surface((width, height), pygame.SRCALPHA)
+        panel.fill((0, 0, 0, 170))
+        for index, (name, mean, p95, last) in enumerate(rows):
+            y = 5 + index * row_height
+            depth = name.count(".")
+            text = f"{'  ' * depth}{name.rsplit('.', 1)[-1]:<14} avg {mean:6.2f}  p95 {p95:6.2f} ms"
+            color = (255, 255, 255) if depth == 0 else (190, 190, 190)
+            panel.blit(self.font.render(text, True, color), (5, y))
+
+            # Histograma móvel: uma barra de 1px por frame
+            graph_x = label_width
+            bar_area = row_height - 4
+            for i, value in enumerate(self.history[name]):
+                bar = min(bar_area, int(value / self.GRAPH_MAX_MS * bar_area) + (1 if value > 0 else 0))
+                if bar:
+                    bar_color = (90, 220, 90) if value < 8.3 else (230, 200, 60) if value < 16.7 else (230, 70, 70)
+                    pygame.draw.line(panel, bar_color, (graph_x + i, y + bar_area), (graph_x + i, y + bar_area - bar))
+        surface.blit(panel, (x0, y0))
+
+    # --------------------------------------------------------------
+    #  MÉTODO DE FÁBRICA
+    # --------------------------------------------------------------
+    @classmethod
+    def get_instance(cls) -> "FrameProfiler":
+        if cls._instance is None:
+            cls()
+        return cls._instance
@@ -0,0 +1,125 @@
+# replay.py
+import struct
+import sys
+import pygame
+from array import array
+from typing import List, Optional, Tuple
+
+# Teclas gravadas, na ordem dos bits da máscara de cada passo
+REPLAY_KEYS: Tuple[int, ...] = (
+    pygame.K_LEFT, pygame.K_RIGHT, pygame.K_UP, pygame.K_DOWN,
+    pygame.K_SPACE, pygame.K_q, pygame.K_1, pygame.K_2, pygame.K_3,
+)
+
+
+# Troca de runa feita no menu de pausa: (passo, feitiço 1-3, índice da runa em spell_system.runes)
+SpellChange = Tuple[int, int, int]
+
+
+class Replay:
+    """Entrada gravada de uma partida: semente, nível inicial, uma máscara de teclas por passo
+    e as trocas de runa feitas no menu de pausa (que também mudam a simulação).
+
+    Formato binário (little-endian):
+        magic "MSRP" | versão u16 | semente u64 | tamanho do nome u16 | nome utf-8
+        | quantidade de passos u32 | máscaras u16 * passos
+        | quantidade de trocas u32 | (passo u32, feitiço u16, runa u16) * trocas   (versão 2)
+    """
+
+    MAGIC = b"MSRP"
+    VERSION = 2
+    _HEADER = struct.Struct("<4sHQH")
+    _COUNT = struct.Struct("<I")
+    _SPELL_CHANGE = struct.Struct("<IHH")
+
+    def __init__(self, level_name: str, seed: int, masks: Optional[List[int]] = None,
+                 spell_changes: Optional[List[SpellChange]] = None):
+        self.level_name = level_name
+        self.seed = seed
+        self.masks = array("H", masks or [])
+        self.spell_changes: List[SpellChange] = list(spell_changes or [])
+
+    # --------------------------------------------------------------
+    #  GRAVAÇÃO E REPRODUÇÃO
+    # --------------------------------------------------------------
+    def record(self, keys):
+        """Acrescenta o estado de teclas de um passo (qualquer objeto indexável por tecla)."""
+        mask = 0
+        for bit, key in enumerate(REPLAY_KEYS):
+            if keys[key]:
+                mask |= 1 << bit
+        self.masks.append(mask)
+
+    def record_spell_change(self, spell_index: int, rune_index: int):
+        """Registra uma troca de runa; ela vale a partir do próximo passo gravado."""
+        self.spell_changes.append((len(self.masks), spell_index, rune_index))
+
+    def pressed_at(self, step: int) -> Tuple[int, ...]:
+        """Teclas pressionadas no passo; passos além do fim não têm teclas."""
+        if step >= len(self.masks):
+            return ()
+        mask = self.masks[step]
+        return tuple(key for bit, key in enumerate(REPLAY_KEYS) if mask & (1 << bit))
+
+    def spell_changes_at(self, step: int) -> List[Tuple[int, int]]:
+        """Trocas de runa (feitiço, runa) a aplicar antes do passo, na ordem em que foram feitas."""
+        return [(spell, rune) for at, spell, rune in self.spell_changes if at == step]
+
+    def __len__(self) -> int:
+        return len(self.masks)
+
+    # --------------------------------------------------------------
+    #  ARQUIVO
+    # --------------------------------------------------------------
+    def save(self, path: str):
+        name = self.level_name.encode("utf-8")
+        masks = array("H", self.masks)
+        if sys.byteorder == "big":
+            masks.byteswap()
+        with open(path, "wb") as file:
+            file.write(self._HEADER.pack(self.MAGIC, self.VERSION, self.seed, len(name)))
+            file.write(name)
+            file.write(self._COUNT.pack(len(masks)))
+            file.write(masks.tobytes())
+            file.write(self._COUNT.pack(len(self.spell_changes)))
+            for change in self.spell_changes:
+                file.write(self._SPELL_CHANGE.pack(*change))
+
+    @classmethod
+    def load(cls, path: str) -> "Replay":
+        with open(path, "rb") as file:
+            data = file.read()
+
+        magic, version, seed, name_length = cls._HEADER.unpack_from(data, 0)
+        if magic != cls.MAGIC:
+            raise ValueError(f"Arquivo de replay inválido: {path}")
+        if version not in (1, cls.VERSION):
+            raise ValueError(f"Versão de replay não suportada: {version}")
+        offset = cls._HEADER.size
+        level_name = data[offset:offset + name_length].decode("utf-8")
+        offset += name_length
+        (count,) = cls._COUNT.unpack_from(data, offset)
+        offset += cls._COUNT.size
+
+        masks = array("H")
+        masks.frombytes(data[offset:offset + count * 2])
+        if sys.byteorder == "big":
+            masks.byteswap()
+        if len(masks) != count:
+            raise ValueError(f"Replay truncado: {path}")
+        offset += count * 2
+
+        spell_changes = []
+        if version >= 2:  # A versão 1 não gravava as trocas de runa
+            try:
+                (change_count,) = cls._COUNT.unpack_from(data, offset)
+                offset += cls._COUNT.size
+                for _ in range(change_count):
+                    spell_changes.append(cls._SPELL_CHANGE.unpack_from(data, offset))
+                    offset += cls._SPELL_CHANGE.size
+            except struct.error:
+                raise ValueError(f"Replay truncado: {path}")
+
+        replay = cls(level_name, seed, spell_changes=spell_changes)
+        replay.masks = masks
+        return replay
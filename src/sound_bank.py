@@ -0,0 +1,125 @@
+# sound_bank.py
+import itertools
+import pygame
+from typing import Dict, List, Optional, Union
+from asset_loader import AssetLoader, SilentSound
+
+
+class SoundBank:
+    """Efeitos sonoros decodificados uma única vez e tocados num pool fixo de canais.
+
+    Quando todos os canais estão ocupados, o som novo rouba o canal de menor
+    prioridade (o mais antigo, em caso de empate) — desde que essa prioridade não
+    seja maior que a dele. Assim rajadas de impactos não calam sons importantes.
+    Sem mixer inicializado (headless), tudo vira no-op.
+    """
+
+    NUM_CHANNELS = 16
+
+    # Prioridades (maior = mais importante)
+    LOW = 0      # Impactos e disparos repetidos
+    NORMAL = 1   # Ações do player
+    HIGH = 2     # Mortes e eventos do nível
+
+    # --------------------------------------------------------------
+    #  SINGLETON
+    # --------------------------------------------------------------
+    _instance: Optional["SoundBank"] = None
+
+    def __new__(cls, *args, **kwargs):
+        if cls._instance is None:
+            cls._instance = super().__new__(cls)
+        return cls._instance
+
+    # --------------------------------------------------------------
+    #  __init__ (executado apenas uma vez)
+    # --------------------------------------------------------------
+    def __init__(self):
+        if hasattr(self, "_initialized"):
+            return
+        self._initialized = True
+
+        self.sounds: Dict[str, pygame.mixer.Sound] = {}  # caminho -> som decodificado
+        self.channels: List[pygame.mixer.Channel] = []
+        self.channel_priority: List[int] = []
+        self.channel_started: List[int] = []  # Ordem em que cada canal começou a tocar
+        self._play_counter = itertools.count()
+
+    # --------------------------------------------------------------
+    #  CACHE
+    # --------------------------------------------------------------
+    def get(self, path: str):
+        """Som compartilhado do caminho (decodificado na primeira chamada)."""
+        sound = self.sounds.get(path)
+        if sound is None:
+            sound = AssetLoader.load_sound(path)
+            if pygame.mixer.get_init():  # Som mudo do headless não fica no cache
+                self.sounds[path] = sound
+        return sound
+
+    def preload(self, paths):
+        for path in paths:
+            self.get(path)
+
+    def clear(self):
+        self.stop_all()
+        self.sounds.clear()
+
+    # --------------------------------------------------------------
+    #  CANAIS
+    # --------------------------------------------------------------
+    def _ensure_channels(self) -> bool:
+        if not pygame.mixer.get_init():
+            self.channels.clear()  # Mixer fechado: os canais antigos não valem mais
+            return False
+        if not self.channels:
+            pygame.mixer.set_num_channels(self.NUM_CHANNELS)
+            self.channels = [pygame.mixer.Channel(i) for i in range(self.NUM_CHANNELS)]
+            self.channel_priority = [self.LOW] * self.NUM_CHANNELS
+            self.channel_started = [0] * self.NUM_CHANNELS
+        return True
+
+    def _pick_channel(self, priority: int) -> Optional[int]:
+        victim = None
+        for index, channel in enumerate(self.channels):
+            if not channel.get_busy():
+                return index
+            if self.channel_priority[index] > priority:
+                continue
+            if (victim is None
+                    or (self.channel_priority[index], self.channel_started[index])
+                    < (self.channel_priority[victim], self.channel_started[victim])):
+                victim = index
+        return victim
+
+    def play(self, sound: Union[str, pygame.mixer.Sound], priority: int = NORMAL, volume: float = 1.0):
+        """Toca um som (ou caminho) num canal do pool; retorna o canal usado ou None se descartado."""
+        if not self._ensure_channels():
+            return None
+        if isinstance(sound, str):
+            sound = self.get(sound)
+        if isinstance(sound, SilentSound):
+            return None
+
+        index = self._pick_channel(priority)
+        if index is None:
+            return None  # Todos os canais com sons mais importantes
+        channel = self.channels[index]
+        channel.set_volume(volume)
+        channel.play(sound)
+        self.channel_priority[index] = priority
+        self.channel_started[index] = next(self._play_counter)
+        return channel
+
+    def stop_all(self):
+        for channel in self.channels:
+            channel.stop()
+
+    # --------------------------------------------------------------
+    #  MÉTODO DE FÁBRICA
+    # --------------------------------------------------------------
+    @classmethod
+    def get_instance(cls) -> "SoundBank":
+        if cls._instance is None:
+            cls()
+        return cls._instance
@@ -0,0 +1,102 @@
+# spatial_hash.py
+import pygame
+from typing import Any, Dict, List, Set, Tuple
+
+
+class SpatialHash:
+    """Grade uniforme que indexa objetos pelo retângulo que ocupam no mundo."""
+
+    def __init__(self, cell_size: int):
+        self.cell_size = max(1, int(cell_size))
+        self.cells: Dict[Tuple[int, int], Set[Any]] = {}
+        self.ranges: Dict[Any, Tuple[int, int, int, int]] = {}  # item -> (x0, y0, x1, y1) em células
+        self.order: Dict[Any, int] = {}  # item -> ordem usada para devolver consultas estáveis
+        self._next_order = 0
+
+    def _cell_range(self, rect: pygame.Rect) -> Tuple[int, int, int, int]:
+        cs = self.cell_size
+        x0 = int(rect.left // cs)
+        y0 = int(rect.top // cs)
+        # Retângulos de tamanho zero (ex: terreno crescendo) ocupam ao menos uma célula
+        x1 = int((rect.right - 1) // cs) if rect.width > 0 else x0
+        y1 = int((rect.bottom - 1) // cs) if rect.height > 0 else y0
+        return x0, y0, x1, y1
+
+    def _add_to_cells(self, item, cell_range):
+        x0, y0, x1, y1 = cell_range
+        for cx in range(x0, x1 + 1):
+            for cy in range(y0, y1 + 1):
+                bucket = self.cells.get((cx, cy))
+                if bucket is None:
+                    bucket = self.cells[(cx, cy)] = set()
+                bucket.add(item)
+
+    def _remove_from_cells(self, item, cell_range):
+        x0, y0, x1, y1 = cell_range
+        for cx in range(x0, x1 + 1):
+            for cy in range(y0, y1 + 1):
+                bucket = self.cells.get((cx, cy))
+                if bucket is not None:
+                    bucket.discard(item)
+                    if not bucket:
+                        del self.cells[(cx, cy)]
+
+    def insert(self, item, rect: pygame.Rect, order: int = None):
+        if item in self.ranges:
+            self.move(item, rect)
+        else:
+            cell_range = self._cell_range(rect)
+            self.ranges[item] = cell_range
+            self._add_to_cells(item, cell_range)
+        if order is None:
+            order = self._next_order
+            self._next_order += 1
+        self.order[item] = order
+
+    def move(self, item, rect: pygame.Rect) -> bool:
+        """Reposiciona o item; só mexe nas células se o intervalo ocupado mudou."""
+        old_range = self.ranges.get(item)
+        if old_range is None:
+            self.insert(item, rect)
+            return True
+        new_range = self._cell_range(rect)
+        if new_range == old_range:
+            return False
+        self._remove_from_cells(item, old_range)
+        self._add_to_cells(item, new_range)
+        self.ranges[item] = new_range
+        return True
+
+    def remove(self, item):
+        cell_range = self.ranges.pop(item, None)
+        if cell_range is not None:
+            self._remove_from_cells(item, cell_range)
+        self.order.pop(item, None)
+
+    def query(self, rect: pygame.Rect) -> List[Any]:
+        """Retorna os itens das células tocadas pelo retângulo, na ordem de inserção."""
+        x0, y0, x1, y1 = self._cell_range(rect)
+        if x0 == x1 and y0 == y1:
+            found = self.cells.get((x0, y0), ())
+        else:
+            found = set()
+            for cx in range(x0, x1 + 1):
+                for cy in range(y0, y1 + 1):
+                    bucket = self.cells.get((cx, cy))
+                    if bucket:
+                        found.update(bucket)
+        return sorted(found, key=self.order.__getitem__)
+
+    def clear(self, cell_size: int = None):
+        if cell_size is not None:
+            self.cell_size = max(1, int(cell_size))
+        self.cells.clear()
+        self.ranges.clear()
+        self.order.clear()
+        self._next_order = 0
+
+    def __contains__(self, item) -> bool:
+        return item in self.ranges
+
+    def __len__(self) -> int:
+        return len(self.ranges)
@@ -81,5 +81,5 @@ class Spell():
         self.cooldown = max(0.1, self.cooldown)
 
 
-    def draw(self, surface, camera):
+    def draw(self, surface, camera, alpha=1.0):
         pass
@@ -1,7 +1,7 @@
 from spell_system.rune import Rune
 from spell_system.rune_type import RuneType
 from spell_system.spell import Spell
-from typing import List
+from typing import List, Sequence
 from spell_system.spells.projectile import Projectile
 from spell_system.spells.dash import Dash
 from spell_system.spells.shield import Shield
@@ -58,17 +58,27 @@ class SpellSystem:
                 spell.current_cooldown = max(0.0, spell.current_cooldown - delta_time)
 
             # --- Atualiza projéteis ---
-            if hasattr(spell, "projectiles"):
-                spell.update(delta_time, player_pos)  # apenas lógica de projéteis
-                for proj in spell.projectiles:
-                    proj.sync_position()
+            if isinstance(spell, Projectile):
+                spell.update(delta_time, player_pos)  # apenas lógica de projéteis (já sincroniza as posições)
 
             # --- Atualiza escudos ---
-            if hasattr(spell, "shields"):
+            if isinstance(spell, Shield):
                 spell.update(delta_time)  # apenas lógica de escudos
                 for shield in spell.shields:
                     shield.sync_position()
 
+    def resolve_hits(self, targets: Sequence):
+        """Acertos dos projéteis nos alvos; chamado depois do CollisionManager no mesmo frame."""
+        for spell in self.spellbook:
+            if isinstance(spell, Projectile):
+                spell.resolve_hits(targets)
+
+    def respawn(self):
+        """Pede de novo a criação dos objetos ainda ativos dos feitiços (ex: escudos) no nível atual."""
+        for spell in self.spellbook:
+            if isinstance(spell, Shield):
+                spell.respawn()
+
     def update_spell(self, index: int, rune: Rune):
         """
         Atualiza o feitiço no índice dado, aplicando toggle de runas
@@ -2,10 +2,14 @@ from spell_system.spell import Spell
 from spell_system.rune import Rune
 from typing import List, Optional
 import pygame
+from sound_bank import SoundBank
+from input_manager import InputManager
 import math
 
 
 class Dash(Spell):
+    SFX = "assets/audio/soundEffects/spells/dash.mp3"
+
     def __init__(self, major_rune: Optional[Rune] = None, minor_runes: List[Rune] = None):
         super().__init__(
             base_attributes={"distance": 150, "mana_cost": 25, "duration": 0.15},
@@ -77,7 +81,7 @@ class Dash(Spell):
             print(f"Dash executado: direção {direction}, distância {distance}, duração {duration}, velocidade {dash_speed:.2f}")
             self.current_cooldown = self.cooldown
 
-        pygame.mixer.Sound("assets/audio/soundEffects/spells/dash.mp3").play()
+        SoundBank.get_instance().play(self.SFX, SoundBank.NORMAL)
         return mana_cost
 
 
@@ -94,7 +98,7 @@ class Dash(Spell):
 
     def _execute_fan_dash(self, direction: int):
         """Dash com runa 'Fan' — permite diagonais e vertical."""
-        keys = pygame.key.get_pressed()
+        keys = InputManager.get_instance().get_pressed()
         dx, dy = 0, 0
 
         if keys[pygame.K_UP] and not (keys[pygame.K_LEFT] or keys[pygame.K_RIGHT]):
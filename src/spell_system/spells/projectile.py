@@ -1,8 +1,10 @@
 from spell_system.spell import Spell
 from spell_system.rune import Rune
-from typing import List, Optional, Dict, Tuple
+from typing import List, Optional, Dict, Sequence, Tuple
 from objects.dynamic_objects.projectile_instance import ProjectileInstance
+from spell_system.spells.projectile_store import ProjectileStore
 import pygame
+from sound_bank import SoundBank
 import math
 import random
 from dataclasses import dataclass
@@ -18,11 +20,50 @@ class ProjectileData:
     minor_runes: List[str]
     owner: any
     facing_right: bool
-    spawn_time: Optional[int] = None
+    spawn_time: Optional[float] = None  # Segundos de simulação
     homing: bool = False
 
+class ProjectilePool:
+    """Instâncias de ProjectileInstance reaproveitadas entre disparos.
+
+    Os projéteis livres ficam numa pilha: acquire() e release() são O(1) e um
+    projétil gasto volta para o pool em vez de ir para o coletor de lixo.
+    """
+
+    def __init__(self, size: Tuple[float, float] = (10, 10), prewarm: int = 0):
+        self.size = size
+        self.free: List[ProjectileInstance] = []
+        for _ in range(prewarm):
+            self.free.append(self._new_instance())
+
+    def _new_instance(self, **kwargs) -> ProjectileInstance:
+        params = dict(position=(0, 0), speed=0, damage=0, direction=1, effects={}, major_rune_name="Default",
+                      minor_rune_names=[], owner=None, facing_right=True)
+        params.update(kwargs)
+        return ProjectileInstance(size=self.size, **params)
+
+    def acquire(self, **kwargs) -> ProjectileInstance:
+        """Projétil pronto para disparo (do pool, ou novo se o pool estiver vazio)."""
+        if not self.free:
+            return self._new_instance(**kwargs)
+        instance = self.free.pop()
+        instance.pooled = False
+        instance.reset(**kwargs)
+        return instance
+
+    def release(self, instance: ProjectileInstance) -> None:
+        if instance.pooled:
+            return  # Já devolvido
+        instance.pooled = True
+        self.free.append(instance)
+
+
 class Projectile(Spell):
     """Classe que gerencia o feitiço de projétil e suas instâncias."""
+
+    # Projéteis criados junto com o feitiço: cobre algumas rajadas em leque (5 por disparo) na tela
+    POOL_PREWARM = 16
+
     def __init__(self, major_rune: Optional[Rune] = None, minor_runes: List[Rune] = None):
         super().__init__(
             base_attributes={"damage": 10, "speed": 300, "mana_cost": 20},
@@ -30,32 +71,39 @@ class Projectile(Spell):
             minor_runes=minor_runes or [],
             cooldown=1  # Cooldown de 0.5 segundos para disparar outro projétil
         )
-        self.projectiles: List[ProjectileInstance] = []  # Projéteis ativos na tela
+        self.store = ProjectileStore()  # Projéteis ativos na tela (simulados em lote)
         self.pending_projectiles: List[ProjectileData] = []  # Projéteis esperando o tempo de spawn
         self.marked_for_removal: bool = False
-        
-        
+        self.elapsed_time: float = 0.0  # Relógio da simulação, em segundos (independe do relógio real)
+        self.pool = ProjectilePool(size=(10, 10), prewarm=self.POOL_PREWARM)
+
+        sound_bank = SoundBank.get_instance()
         self.fireball_sfx = [
-            pygame.mixer.Sound("assets/audio/soundEffects/spells/Fireball 1.ogg"),
-            pygame.mixer.Sound("assets/audio/soundEffects/spells/Fireball 2.ogg"),
-            pygame.mixer.Sound("assets/audio/soundEffects/spells/Fireball 3.ogg"),
+            sound_bank.get("assets/audio/soundEffects/spells/Fireball 1.ogg"),
+            sound_bank.get("assets/audio/soundEffects/spells/Fireball 2.ogg"),
+            sound_bank.get("assets/audio/soundEffects/spells/Fireball 3.ogg"),
         ]
         self.icebolt_sfx = [
-            pygame.mixer.Sound("assets/audio/soundEffects/spells/Ice Barrage 1.ogg"),
-            pygame.mixer.Sound("assets/audio/soundEffects/spells/Ice Barrage 2.ogg"),
+            sound_bank.get("assets/audio/soundEffects/spells/Ice Barrage 1.ogg"),
+            sound_bank.get("assets/audio/soundEffects/spells/Ice Barrage 2.ogg"),
         ]
         self.spell_hit_sfx = [
-            pygame.mixer.Sound("assets/audio/soundEffects/spells/Spell Impact 1.ogg"),
-            pygame.mixer.Sound("assets/audio/soundEffects/spells/Spell Impact 2.ogg"),
-            pygame.mixer.Sound("assets/audio/soundEffects/spells/Spell Impact 3.ogg"),
+            sound_bank.get("assets/audio/soundEffects/spells/Spell Impact 1.ogg"),
+            sound_bank.get("assets/audio/soundEffects/spells/Spell Impact 2.ogg"),
+            sound_bank.get("assets/audio/soundEffects/spells/Spell Impact 3.ogg"),
         ]
 
+    @property
+    def projectiles(self) -> List[ProjectileInstance]:
+        """Projéteis ativos, na ordem de disparo."""
+        return self.store.instances
+
     def execute(self, direction: float, owner) -> None:
         """Executa o feitiço, criando projéteis com base nas runas."""
 
         effects = {k: v for k, v in self.attributes.items() if k in ["slow", "burn"]}
         minor_rune_names = [rune.name for rune in self.minor_runes]
-        random.choice(self.fireball_sfx).play()
+        SoundBank.get_instance().play(random.choice(self.fireball_sfx), SoundBank.LOW)
 
         base_data = ProjectileData(
             direction=direction,
@@ -107,7 +155,7 @@ class Projectile(Spell):
         for i in range(3):
             # Create a copy of base_data.__dict__ and update spawn_time
             projectile_dict = base_data.__dict__.copy()
-            projectile_dict['spawn_time'] = pygame.time.get_ticks() + (i * 200)
+            projectile_dict['spawn_time'] = self.elapsed_time + (i * 0.2)
             projectile_dict['major_rune'] = "Multiple"
             projectile_data = ProjectileData(**projectile_dict)
             self.pending_projectiles.append(projectile_data)
@@ -122,10 +170,9 @@ class Projectile(Spell):
         self.pending_projectiles.append(projectile_data)
 
     def _create_projectile(self, data: ProjectileData, position: Tuple[float, float]) -> ProjectileInstance:
-        """Cria uma instância de projétil a partir dos dados fornecidos."""
-        return ProjectileInstance(
+        """Tira do pool uma instância de projétil preparada com os dados fornecidos."""
+        return self.pool.acquire(
             position=position,
-            size=(10, 10),
             speed=data.speed,
             damage=data.damage,
             direction=data.direction,
@@ -138,24 +185,37 @@ class Projectile(Spell):
             hit_sfx=self.spell_hit_sfx
         )
 
-    def draw(self, surface: pygame.Surface, camera) -> None:
-        """Desenha todos os projéteis ativos."""
-        for proj in self.projectiles:
-            proj.draw(surface, camera)
+    def draw(self, surface: pygame.Surface, camera, alpha: float = 1.0) -> None:
+        """Desenha os projéteis visíveis na posição interpolada entre os dois últimos passos."""
+        if not len(self.store):
+            return
+        view_rect = camera.get_view_rect()
+        for proj, (x, y) in zip(self.store.instances, self.store.interpolated(alpha).tolist()):
+            current = proj.rect.topleft
+            proj.rect.topleft = (round(x), round(y))
+            if proj.rect.colliderect(view_rect):
+                proj.draw(surface, camera)
+            proj.rect.topleft = current
             
 
     def update(self, delta_time: float, player_pos: Tuple[float, float]) -> None:
         """Atualiza todos os projéteis ativos e pendentes."""
-        current_time = pygame.time.get_ticks()
+        self.elapsed_time += delta_time
+        current_time = self.elapsed_time
 
         # Spawn projéteis pendentes
-        for pending in self.pending_projectiles[:]:
+        waiting = []
+        for pending in self.pending_projectiles:
             if pending.spawn_time is None or current_time >= pending.spawn_time:
-                self.projectiles.append(self._create_projectile(pending, player_pos))
-                self.pending_projectiles.remove(pending)
-
-        # Atualizar projéteis ativos
-        for proj in self.projectiles[:]:
-            proj.update(delta_time)
-            if proj.marked_for_removal:
-                self.projectiles.remove(proj)
\ No newline at end of file
+                self.store.add(self._create_projectile(pending, player_pos))
+            else:
+                waiting.append(pending)
+        self.pending_projectiles = waiting
+
+        # Atualizar projéteis ativos (acertos em alvos ficam para resolve_hits)
+        self.store.update(delta_time)
+
+    def resolve_hits(self, targets: Sequence = ()) -> None:
+        """Aplica os acertos do frame nos alvos com hurt_box (inimigos); os projéteis gastos voltam para o pool."""
+        for proj in self.store.resolve_hits(targets):
+            self.pool.release(proj)
@@ -0,0 +1,240 @@
+# projectile_store.py
+import numpy as np
+import pygame
+from typing import List, Sequence
+from collision_layers import HURT_BOX, SOLID, TAG_PROJECTILE
+from collision_manager import CollisionManager
+from config import SPEED
+from objects.dynamic_objects.projectile_instance import ProjectileInstance
+
+
+class ProjectileStore:
+    """Estado dos projéteis ativos em arrays NumPy (estrutura de arrays).
+
+    Movimento, alcance, avanço da animação e as colisões (cenário e hurt_box dos alvos)
+    são passos vetorizados por frame; os projéteis não passam pelo EntityManager nem
+    pelo CollisionManager. Cada slot continua ligado a um ProjectileInstance, que só
+    recebe o resultado (posição, frame) para o desenho. Os slots ativos ficam contíguos,
+    na ordem de disparo.
+    """
+
+    INITIAL_CAPACITY = 64
+    MAX_DISTANCE = 500  # Alcance em pixels a partir do ponto de disparo
+
+    # Campo -> (forma por slot, dtype)
+    FIELDS = {
+        "position": ((2,), np.float64),
+        "previous": ((2,), np.float64),  # Posição antes do último passo (interpolação do desenho)
+        "velocity": ((2,), np.float64),  # Pixels por segundo
+        "start": ((2,), np.float64),
+        "hit_size": ((2,), np.float64),  # Tamanho dos colliders (body e attack_box)
+        "radial": ((), np.bool_),  # Leque: alcance em linha reta; senão só na horizontal
+        "frame": ((), np.int32),
+        "frame_count": ((), np.int32),  # 0 = sem animação
+        "frame_timer": ((), np.float64),
+        "frame_duration": ((), np.float64),
+    }
+
+    def __init__(self, capacity: int = INITIAL_CAPACITY):
+        self.count = 0
+        self.capacity = 0
+        self.instances: List[ProjectileInstance] = []  # Slot i -> instância
+        self._frame = None  # (vivos, cenário, left, top, right, bottom) do último update, até resolve_hits
+        self._resize(capacity)
+
+    def __len__(self):
+        return self.count
+
+    def _resize(self, capacity: int):
+        for name, (shape, dtype) in self.FIELDS.items():
+            array = np.zeros((capacity,) + shape, dtype=dtype)
+            if self.capacity:
+                array[:self.count] = getattr(self, name)[:self.count]
+            setattr(self, name, array)
+        self.capacity = capacity
+
+    # --------------------------------------------------------------
+    #  SLOTS
+    # --------------------------------------------------------------
+    def add(self, instance: ProjectileInstance):
+        """Ocupa um slot com o projétil recém-disparado."""
+        if self.count == self.capacity:
+            self._resize(self.capacity * 2)
+        i = self.count
+
+        speed = instance.speed + SPEED
+        radial = instance.major_rune_name == "Fan"
+        if radial:
+            self.velocity[i] = (instance.dx * speed, instance.dy * speed)
+        else:
+            self.velocity[i] = (instance.direction * speed, 0.0)
+        self.radial[i] = radial
+        self.position[i] = instance.position
+        self.previous[i] = instance.position
+        self.start[i] = (instance.start_x, instance.start_y)
+
+        # As colisões são testadas aqui em lote (colliders do mesmo tamanho do projétil)
+        self.hit_size[i] = instance.size
+
+        animation = instance.current_animation if instance.use_animation else None
+        self.frame[i] = instance.current_frame
+        self.frame_count[i] = len(animation.animation) if animation else 0
+        self.frame_timer[i] = instance.animation_timer
+        self.frame_duration[i] = instance.animation_speed
+
+        self.instances.append(instance)
+        self.count += 1
+
+    def _compact(self, keep: np.ndarray) -> List[ProjectileInstance]:
+        """Remove os slots fora de keep mantendo a ordem; retorna as instâncias removidas."""
+        keep_list = keep.tolist()
+        removed = [instance for instance, kept in zip(self.instances, keep_list) if not kept]
+        if not removed:
+            return removed
+
+        kept_slots = np.flatnonzero(keep)
+        for name in self.FIELDS:
+            array = getattr(self, name)
+            array[:len(kept_slots)] = array[kept_slots]
+        self.instances = [instance for instance, kept in zip(self.instances, keep_list) if kept]
+        self.count = len(kept_slots)
+        return removed
+
+    # --------------------------------------------------------------
+    #  SIMULAÇÃO
+    # --------------------------------------------------------------
+    def update(self, delta_time: float):
+        """Avança todos os projéteis um frame: movimento, alcance, animação e cenário.
+
+        Os acertos em alvos ficam para resolve_hits, chamado depois do CollisionManager,
+        na mesma ordem em que o dano era aplicado quando os projéteis eram entidades.
+        """
+        n = self.count
+        self._frame = None
+        if n == 0:
+            return
+
+        alive = np.ones(n, dtype=bool)
+
+        # Movimento e alcance
+        position = self.position[:n]
+        self.previous[:n] = position
+        position += self.velocity[:n] * delta_time
+        travelled = position - self.start[:n]
+        distance = np.where(self.radial[:n], np.hypot(travelled[:, 0], travelled[:, 1]), np.abs(travelled[:, 0]))
+        alive &= ~(distance > self.MAX_DISTANCE)
+
+        # Animação
+        timer = self.frame_timer[:n]
+        frame = self.frame[:n]
+        animated = self.frame_count[:n] > 0
+        timer[animated] += delta_time
+        advance = animated & (timer >= self.frame_duration[:n])
+        timer[advance] -= self.frame_duration[:n][advance]
+        frame[advance] = (frame[advance] + 1) % self.frame_count[:n][advance]
+
+        # Resultado de volta nas instâncias, que só são usadas para desenhar
+        for instance, (x, y), timer_value, frame_value, advanced in zip(
+                self.instances, position.tolist(), timer.tolist(), frame.tolist(), advance.tolist()):
+            instance.position.update(x, y)
+            instance.animation_timer = timer_value
+            if advanced:
+                instance.current_frame = frame_value
+                instance.update_image()
+            else:
+                instance.rect.topleft = instance.position
+
+        # Colliders dos projéteis, com o mesmo arredondamento do pygame.Rect (metade para longe do zero)
+        left, top = np.copysign(np.floor(np.abs(position) + 0.5), position).T
+        right = left + self.hit_size[:n, 0]
+        bottom = top + self.hit_size[:n, 1]
+        # Quem tocou o cenário só sai em resolve_hits: ainda pode acertar um alvo neste frame
+        static_hit = self._hit_statics(alive, left, top, right, bottom)
+        self._frame = (alive, static_hit, left, top, right, bottom)
+
+    def interpolated(self, alpha: float) -> np.ndarray:
+        """Posições entre o passo anterior e o atual (alpha de 0 a 1), na ordem dos slots."""
+        previous = self.previous[:self.count]
+        return previous + (self.position[:self.count] - previous) * alpha
+
+    def resolve_hits(self, targets: Sequence = ()) -> List[ProjectileInstance]:
+        """Aplica os acertos do frame nos alvos e libera os slots que saíram.
+
+        Retorna as instâncias que saíram (alcance, acerto ou colisão com o cenário),
+        já marcadas para remoção, para voltarem ao pool.
+        """
+        if self._frame is None:
+            return []
+        alive, static_hit, left, top, right, bottom = self._frame
+        self._frame = None
+
+        alive &= ~self._hit_targets(targets, alive, left, top, right, bottom)
+        alive &= ~static_hit
+        removed = self._compact(alive)
+        for instance in removed:
+            instance.marked_for_removal = True
+        return removed
+
+    def _hit_statics(self, alive, left, top, right, bottom) -> np.ndarray:
+        """Teste AABB em lote contra os colliders sólidos do cenário na região dos projéteis."""
+        if not alive.any():
+            return np.zeros(len(alive), dtype=bool)
+        x0, y0 = int(left[alive].min()), int(top[alive].min())
+        bounds = pygame.Rect(x0, y0, int(right[alive].max()) - x0, int(bottom[alive].max()) - y0)
+        solids = [
+            (collider.rect.left, collider.rect.top, collider.rect.right, collider.rect.bottom)
+            for static in CollisionManager.get_instance().static_index.query(bounds)
+            for collider in static.colliders
+            if collider.active and collider.layer & SOLID
+        ]
+        if not solids:
+            return np.zeros(len(alive), dtype=bool)
+        solid_left, solid_top, solid_right, solid_bottom = np.array(solids, dtype=np.float64).T
+        overlap = ((left[:, None] < solid_right) & (right[:, None] > solid_left) &
+                   (top[:, None] < solid_bottom) & (bottom[:, None] > solid_top))
+        return alive & overlap.any(axis=1)
+
+    def _hit_targets(self, targets: Sequence, alive, left, top, right, bottom) -> np.ndarray:
+        """Teste AABB em lote entre os projéteis e o hurt_box dos alvos.
+
+        Como no CollisionManager, cada alvo leva no máximo um acerto por frame, contando
+        também o dano que ele já recebeu ali (ex: ataque corpo a corpo do jogador).
+        """
+        hit = np.zeros(len(alive), dtype=bool)
+        if not targets or not alive.any():
+            return hit
+
+        damaged = CollisionManager.get_instance().damaged_this_frame
+        hittable, boxes = [], []
+        for target in targets:
+            if target in damaged:
+                continue
+            hurt_box = next((collider for collider in target.colliders if collider.layer == HURT_BOX), None)
+            if hurt_box is None or not hurt_box.active or not hurt_box.target_tags & (1 << TAG_PROJECTILE):
+                continue
+            rect = hurt_box.rect
+            hittable.append(target)
+            boxes.append((rect.left, rect.top, rect.right, rect.bottom))
+        if not hittable:
+            return hit
+
+        box_left, box_top, box_right, box_bottom = np.array(boxes, dtype=np.float64).T
+        overlap = (alive[:, None] & (left[:, None] < box_right) & (right[:, None] > box_left) &
+                   (top[:, None] < box_bottom) & (bottom[:, None] > box_top))
+
+        # Só os alvos tocados por algum projétil chegam ao laço em Python
+        for column in np.flatnonzero(overlap.any(axis=0)).tolist():
+            target = hittable[column]
+            for slot in np.flatnonzero(overlap[:, column]).tolist():
+                instance = self.instances[slot]
+                if instance.owner is target:
+                    continue
+                if target in instance.already_hit_targets:
+                    continue
+                instance.already_hit_targets.add(target)
+                instance.handle_hit()
+                target.handle_damage(instance.damage, instance.facing_right)
+                damaged.add(target)
+                hit[slot] = True
+                break
+        return hit
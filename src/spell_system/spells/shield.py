@@ -1,8 +1,8 @@
+from command_buffer import CommandBuffer
 from spell_system.spell import Spell
 from spell_system.rune import Rune
 from objects.static_objects.barrier import Barrier
 from typing import List, Optional
-import pygame
 from objects.dynamic_objects.shield_instance import ShieldInstance
 from dataclasses import dataclass
 from typing import Optional, List, Any
@@ -14,7 +14,7 @@ class ShieldData:
     duration: float
     owner: Any
     facing_right: bool
-    spawn_time: Optional[int] = None
+    spawn_time: Optional[float] = None  # Segundos de simulação
     stack_position: int = 0  # Mantido para compatibilidade
 
 class Shield(Spell):
@@ -29,6 +29,7 @@ class Shield(Spell):
         self.pending_shields: List[ShieldData] = []  # Escudos esperando o tempo de spawn
         self.owner = None  # Referência a entidade que possui o escudo
         self.duration = 10.0  # Duração do escudo em segundos
+        self.elapsed_time = 0.0  # Relógio da simulação, em segundos (independe do relógio real)
         # self.shield_sfx = pygame.mixer.Sound("assets/audio/soundEffects/spells/Shield Activation.ogg")  # Som de ativação
         # self.shield_hit_sfx = pygame.mixer.Sound("assets/audio/soundEffects/spells/Shield Hit.ogg")  # Som de impacto
 
@@ -85,7 +86,7 @@ class Shield(Spell):
             owner=base_data.owner,
             duration=base_data.duration,
         )
-        self.shields.append(shield)
+        self._add_shield(shield)
         self.owner.shield_health = base_data.health
 
     def _handle_multiple_rune(self, base_data: ShieldData, base_position: tuple) -> None:
@@ -97,7 +98,7 @@ class Shield(Spell):
             duration=base_data.duration,
             is_multiple=True
         )
-        self.shields.append(shield)
+        self._add_shield(shield)
         # Não atualiza shield_health para "multiple"
     
     def _handle_fan_rune(self, base_data: ShieldData, base_position: tuple) -> None:
@@ -123,9 +124,27 @@ class Shield(Spell):
         )
 
         # Adiciona a barreira à lista de escudos para gerenciamento
-        self.shields.append(barrier)
+        self._add_shield(barrier)
         # Não atualiza owner.shield_health para runa "fan", conforme lógica existente
 
+    def _add_shield(self, shield) -> None:
+        """Passa a gerenciar o escudo e pede a sua criação no nível."""
+        self.shields.append(shield)
+        self._request_spawn(shield)
+
+    @staticmethod
+    def _request_spawn(shield) -> None:
+        # A barreira do leque é cenário sólido; os demais escudos são entidades
+        if isinstance(shield, Barrier):
+            CommandBuffer.get_instance().spawn_static(shield)
+        else:
+            CommandBuffer.get_instance().spawn_entity(shield)
+
+    def respawn(self) -> None:
+        """Pede de novo a criação dos escudos ativos (o nível foi recarregado com eles em cena)."""
+        for shield in self.shields:
+            self._request_spawn(shield)
+
     def _create_shield(self, data: ShieldData, base_position: tuple) -> ShieldInstance:
         """Cria uma instância de escudo a partir dos dados fornecidos."""
         return ShieldInstance(
@@ -138,13 +157,14 @@ class Shield(Spell):
 
     def update(self, delta_time: float):
         """Atualiza todos os escudos ativos e pendentes."""
-        current_time = pygame.time.get_ticks()
+        self.elapsed_time += delta_time
+        current_time = self.elapsed_time
 
         # Spawn escudos pendentes (não usado para "fan" ou "multiple" agora)
         for pending in self.pending_shields[:]:
             if pending.spawn_time is None or current_time >= pending.spawn_time:
                 shield = self._create_shield(pending, (self.owner.position.x + (20 if self.owner.facing_right else -20), self.owner.position.y))
-                self.shields.append(shield)
+                self._add_shield(shield)
                 self.pending_shields.remove(pending)
                 if not self.major_rune or self.major_rune.name == "None":
                     self.owner.shield_health = pending.health  # Atualiza apenas para "None"
@@ -158,5 +178,6 @@ class Shield(Spell):
                 shield.update(delta_time)  # Barrier não usa shield_health ou on_ground
             if shield.marked_for_removal:
                 self.shields.remove(shield)
+                CommandBuffer.get_instance().despawn(shield)
                 if shield.owner:
                     self.owner.shield_health = 0 if not self.shields else self.shields[0].health if not self.major_rune or self.major_rune.name == "None" else 0
\ No newline at end of file
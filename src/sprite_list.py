@@ -0,0 +1,99 @@
+# sprite_list.py
+import pygame
+from typing import Dict, Iterable, List, Optional
+from spatial_hash import SpatialHash
+
+
+class SpriteList(list):
+    """Lista de sprites na ordem de desenho, indexada por uma grade espacial para o culling.
+
+    Continua sendo uma lista (append/remove/in/iteração), então quem só acrescenta ou remove
+    sprites não precisa saber do índice. Sprites que se movem são reposicionados com move(),
+    chamado pelo CollisionManager a cada passo para as entidades; o desenho só consulta.
+    """
+
+    # Folga da consulta: o desenho interpola entre o passo anterior e o atual, e o índice
+    # guarda a posição do fim do passo
+    DRAW_MARGIN = 32
+
+    def __init__(self, cell_size: int, items: Iterable = ()):
+        super().__init__()
+        self.index = SpatialHash(cell_size)
+        self.areas: Dict = {}  # sprite -> área no mundo da última atualização
+        self.extend(items)
+
+    @staticmethod
+    def _bounds(sprite, bounds: Optional[pygame.Rect] = None) -> pygame.Rect:
+        """Área ocupada no mundo: o rect (ou bounds, se já calculado) e a imagem desenhada a partir do topo esquerdo."""
+        rect = sprite.rect
+        area = rect if bounds is None else bounds
+        image = getattr(sprite, "image", None)
+        if image is None:
+            return area
+        width, height = image.get_size()
+        if width <= rect.width and height <= rect.height:
+            return area
+        return area.union(pygame.Rect(rect.x, rect.y, width, height))
+
+    # --------------------------------------------------------------
+    #  OPERAÇÕES DE LISTA
+    # --------------------------------------------------------------
+    def append(self, sprite):
+        super().append(sprite)
+        if sprite not in self.index:
+            area = self.areas[sprite] = self._bounds(sprite)
+            self.index.insert(sprite, area)
+
+    def extend(self, sprites: Iterable):
+        for sprite in sprites:
+            self.append(sprite)
+
+    def insert(self, position: int, sprite):
+        super().insert(position, sprite)
+        self._reorder()
+
+    def remove(self, sprite):
+        super().remove(sprite)
+        if not super().__contains__(sprite):
+            self.index.remove(sprite)
+            self.areas.pop(sprite, None)
+
+    def remove_many(self, sprites: Iterable):
+        """Remove vários sprites numa única passada pela lista."""
+        doomed = {sprite for sprite in sprites if sprite in self.index}
+        if not doomed:
+            return
+        self[:] = [sprite for sprite in self if sprite not in doomed]
+        for sprite in doomed:
+            self.index.remove(sprite)
+            del self.areas[sprite]
+
+    def clear(self):
+        super().clear()
+        self.index.clear()
+        self.areas.clear()
+
+    def __contains__(self, sprite) -> bool:
+        return sprite in self.index
+
+    def _reorder(self):
+        for order, sprite in enumerate(self):
+            self.index.order[sprite] = order
+
+    # --------------------------------------------------------------
+    #  ÍNDICE ESPACIAL
+    # --------------------------------------------------------------
+    def move(self, sprite, bounds: Optional[pygame.Rect] = None):
+        """Atualiza a área de um sprite e a sua posição na grade (só mexe se mudou de células).
+
+        bounds: área já calculada para o sprite (ex: pela grade dinâmica do CollisionManager).
+        """
+        if sprite in self.index:
+            area = self.areas[sprite] = self._bounds(sprite, bounds)
+            self.index.move(sprite, area)
+
+    def visible(self, view_rect: pygame.Rect) -> List:
+        """Sprites cuja área intersecta a vista, na mesma ordem de desenho da lista."""
+        view = view_rect.inflate(2 * self.DRAW_MARGIN, 2 * self.DRAW_MARGIN)
+        areas = self.areas
+        return [sprite for sprite in self.index.query(view) if areas[sprite].colliderect(view)]
@@ -0,0 +1,120 @@
+# tile_layer.py
+import numpy as np
+import pygame
+from typing import Dict, List, Tuple
+
+
+class TileLayer:
+    """Camada estática de tiles pré-renderizada em blocos (chunks) já no zoom da câmera.
+
+    gids: array (linhas, colunas) do MapData, possivelmente mapeado em memória; é lido
+    só com operações do NumPy, sem virar listas Python.
+    """
+
+    CHUNK_TILES = 8  # Tamanho de cada chunk em tiles (8x8)
+
+    def __init__(self, gids: np.ndarray, tileset: Dict[int, pygame.Surface],
+                 tile_width: int, tile_height: int, zoom: float):
+        self.gids = gids
+        self.tileset = tileset
+        # Tiles com imagem no tileset: são os desenhados e os sólidos
+        self.solid = np.isin(gids, np.fromiter(tileset, dtype=gids.dtype, count=len(tileset)))
+        self.tile_width = tile_width
+        self.tile_height = tile_height
+        self.zoom = None
+        # (chunk_x, chunk_y) -> (surface, rect no mundo coberto pela surface)
+        self.chunks: Dict[Tuple[int, int], Tuple[pygame.Surface, pygame.Rect]] = {}
+        self.bake(zoom)
+
+    def bake(self, zoom: float):
+        """Compõe os tiles em superfícies por chunk, escaladas uma única vez para o zoom."""
+        self.zoom = zoom
+        self.chunks = {}
+
+        scaled_w = int(self.tile_width * zoom)
+        scaled_h = int(self.tile_height * zoom)
+        scaled_tiles = {}
+
+        rows, cols = self.gids.shape
+        size = self.CHUNK_TILES
+
+        for chunk_y in range(0, rows, size):
+            for chunk_x in range(0, cols, size):
+                block = self.solid[chunk_y:chunk_y + size, chunk_x:chunk_x + size]
+                cell_rows, cell_cols = np.nonzero(block)
+                if not len(cell_rows):
+                    continue  # Chunk vazio não ocupa memória
+
+                # Recorta a superfície ao retângulo que contém tiles
+                cell_rows += chunk_y
+                cell_cols += chunk_x
+                min_row, max_row = int(cell_rows.min()), int(cell_rows.max())
+                min_col, max_col = int(cell_cols.min()), int(cell_cols.max())
+                cells = zip(cell_rows.tolist(), cell_cols.tolist(), self.gids[cell_rows, cell_cols].tolist())
+                surface = pygame.Surface(
+                    ((max_col - min_col + 1) * scaled_w, (max_row - min_row + 1) * scaled_h),
+                    pygame.SRCALPHA
+                )
+                for row_idx, col_idx, gid in cells:
+                    tile = scaled_tiles.get(gid)
+                    if tile is None:
+                        tile = pygame.transform.scale(self.tileset[gid], (scaled_w, scaled_h))
+                        scaled_tiles[gid] = tile
+                    surface.blit(tile, ((col_idx - min_col) * scaled_w, (row_idx - min_row) * scaled_h))
+
+                world_rect = pygame.Rect(
+                    min_col * self.tile_width,
+                    min_row * self.tile_height,
+                    (max_col - min_col + 1) * self.tile_width,
+                    (max_row - min_row + 1) * self.tile_height
+                )
+                self.chunks[(chunk_x // size, chunk_y // size)] = (surface, world_rect)
+
+    def solid_rects(self) -> List[pygame.Rect]:
+        """Agrupa tiles sólidos adjacentes em retângulos maximais (fusão gulosa linha/coluna)."""
+        rows = self.solid.shape[0]
+        free = self.solid.copy()  # Sólidos ainda não cobertos por um retângulo
+
+        rects = []
+        for row_idx, col_idx in np.argwhere(self.solid).tolist():
+            if not free[row_idx, col_idx]:
+                continue
+
+            # Estende para a direita enquanto houver tiles sólidos livres
+            run = free[row_idx, col_idx:]
+            width = int(run.argmin()) if not run.all() else len(run)
+
+            # Estende para baixo enquanto a linha inteira do trecho for sólida
+            height = 1
+            while row_idx + height < rows and free[row_idx + height, col_idx:col_idx + width].all():
+                height += 1
+
+            free[row_idx:row_idx + height, col_idx:col_idx + width] = False
+            rects.append(pygame.Rect(
+                col_idx * self.tile_width,
+                row_idx * self.tile_height,
+                width * self.tile_width,
+                height * self.tile_height
+            ))
+        return rects
+
+    def draw(self, surface: pygame.Surface, camera):
+        """Desenha apenas os chunks que intersectam a área visível da câmera."""
+        if camera.zoom != self.zoom:
+            self.bake(camera.zoom)
+
+        screen_w, screen_h = surface.get_size()
+        chunk_w = self.CHUNK_TILES * self.tile_width
+        chunk_h = self.CHUNK_TILES * self.tile_height
+        first_x = int(camera.offset.x // chunk_w)
+        first_y = int(camera.offset.y // chunk_h)
+        last_x = int((camera.offset.x + screen_w / camera.zoom) // chunk_w)
+        last_y = int((camera.offset.y + screen_h / camera.zoom) // chunk_h)
+
+        for chunk_y in range(first_y, last_y + 1):
+            for chunk_x in range(first_x, last_x + 1):
+                chunk = self.chunks.get((chunk_x, chunk_y))
+                if chunk is None:
+                    continue
+                chunk_surface, world_rect = chunk
+                surface.blit(chunk_surface, camera.apply(world_rect).topleft)
@@ -1,9 +1,9 @@
-from ui.ui import Ui
+from ui.hud import HudElement
 import pygame
 import math
 from asset_loader import AssetLoader
 
-class HotBar(Ui):
+class HotBar(HudElement):
     def __init__(self, screen):
         super().__init__(screen)
         box_size = 50  # Tamanho de cada caixa (50x50 pixels)
@@ -30,7 +30,27 @@ class HotBar(Ui):
         self.dash_icon = pygame.transform.scale(dash_icon, (40, 40))
         self.shield_icon = pygame.transform.scale(shield_icon, (40, 40))
 
-    def draw(self, player):
+        # Caixa: fundo cinza com borda branca, igual para os três feitiços
+        self.box_surface = pygame.Surface((box_size, box_size))
+        self.box_surface.fill((50, 50, 50))  # Fundo
+        pygame.draw.rect(self.box_surface, (255, 255, 255), self.box_surface.get_rect(), 2)  # Borda
+
+        # Uma superfície de arco por caixa, reaproveitada a cada recomposição
+        self.arc_surfaces = [pygame.Surface((box_size, box_size), pygame.SRCALPHA) for _ in range(3)]
+
+    def _cooldown_steps(self, spell):
+        """Cooldown restante quantizado ao perímetro do arco em pixels (0 = pronto)."""
+        if spell.current_cooldown <= 0:
+            return 0
+        cooldown_ratio = spell.current_cooldown / spell.cooldown
+        radius = self.box_size // 3
+        return max(1, math.ceil(cooldown_ratio * 2 * math.pi * radius))
+
+    def state(self, player):
+        return tuple(self._cooldown_steps(spell) for spell in player.spell_system.spellbook[:3])
+
+    def render(self, player):
+        blits = []
         screen_width, screen_height = self.screen.get_size()
         total_width = (self.box_size * 3) + (self.box_spacing * 2)  # Largura total da hotbar
         start_x = (screen_width - total_width) // 2  # Centralizar horizontalmente
@@ -43,15 +63,13 @@ class HotBar(Ui):
             {"icon": self.shield_icon, "rect": pygame.Rect(start_x + (self.box_size + self.box_spacing) * 2, start_y, self.box_size, self.box_size), "spell": player.spell_system.spellbook[2]},
         ]
 
-        for item in hotbar_items:
-            # Desenhar a caixa (fundo cinza com borda branca)
-            pygame.draw.rect(self.screen, (50, 50, 50), item["rect"])  # Fundo
-            pygame.draw.rect(self.screen, (255, 255, 255), item["rect"], 2)  # Borda
+        for item, arc_surface in zip(hotbar_items, self.arc_surfaces):
+            blits.append((self.box_surface, item["rect"].topleft))
 
             # Desenhar o ícone centralizado na caixa
             icon_x = item["rect"].x + (self.box_size - 40) // 2  # Centralizar ícone (40x40) na caixa (50x50)
             icon_y = item["rect"].y + (self.box_size - 40) // 2
-            self.screen.blit(item["icon"], (icon_x, icon_y))
+            blits.append((item["icon"], (icon_x, icon_y)))
 
             # Desenhar o indicador de cooldown como um arco (gráfico de pizza)
             spell = item["spell"]
@@ -61,14 +79,10 @@ class HotBar(Ui):
                 # Ângulo do arco (0 a 360 graus, no sentido anti-horário para esvaziar a partir das 12 horas)
                 start_angle_rad = math.radians(-90 + 360 * (1 - cooldown_ratio))  # Começa ajustado pelo cooldown
                 end_angle_rad = math.radians(-90)  # Termina no topo (12 horas)
-                # Centro e raio do arco
-                center = (item["rect"].centerx, item["rect"].centery)
                 radius = self.box_size // 3  # Círculo menor (1/3 do tamanho da caixa)
-                # Criar uma superfície temporária para o arco com transparência
-                temp_surface = pygame.Surface((self.box_size, self.box_size), pygame.SRCALPHA)
-                # Desenhar o arco na superfície temporária
-                pygame.draw.arc(temp_surface, (0, 0, 0, 160),  # Preto com transparência
+                arc_surface.fill((0, 0, 0, 0))
+                pygame.draw.arc(arc_surface, (0, 0, 0, 160),  # Preto com transparência
                                 (self.box_size // 2 - radius, self.box_size // 2 - radius, radius * 2, radius * 2),
                                 start_angle_rad, end_angle_rad, radius)  # Espessura igual ao raio para círculo cheio
-                # Desenhar a superfície temporária na tela
-                self.screen.blit(temp_surface, (item["rect"].x, item["rect"].y))
\ No newline at end of file
+                blits.append((arc_surface, item["rect"].topleft))
+        return blits
@@ -0,0 +1,73 @@
+import pygame
+from typing import Hashable, List, Optional, Tuple
+from ui.ui import Ui
+
+# (superfície, posição na tela)
+Blit = Tuple[pygame.Surface, Tuple[float, float]]
+
+
+class HudElement(Ui):
+    """Elemento de HUD em modo retido: só recompõe a imagem quando o estado (quantizado) muda.
+
+    Subclasses implementam state(), que devolve uma chave hashable do que é visível
+    (ex: largura da barra em pixels), e render(), que devolve os blits do elemento em
+    coordenadas de tela. O resultado fica numa superfície cacheada desenhada com um blit.
+    """
+
+    def __init__(self, screen):
+        super().__init__(screen)
+        self.surface: Optional[pygame.Surface] = None
+        self.position = (0, 0)
+        self.state_key: Optional[Hashable] = None
+
+    def state(self, *args) -> Hashable:
+        raise NotImplementedError("Subclasse DEVE implementar o método state.")
+
+    def render(self, *args) -> List[Blit]:
+        raise NotImplementedError("Subclasse DEVE implementar o método render.")
+
+    def refresh(self, *args) -> Blit:
+        """Recompõe a superfície se o estado mudou; devolve o blit do elemento."""
+        key = self.state(*args)
+        if key != self.state_key or self.surface is None:
+            self.state_key = key
+            self._compose(self.render(*args))
+        return self.surface, self.position
+
+    def draw(self, *args):
+        self.screen.blit(*self.refresh(*args))
+
+    def _compose(self, blits: List[Blit]):
+        if not blits:
+            self.surface = pygame.Surface((0, 0), pygame.SRCALPHA)
+            return
+        bounds = pygame.Rect(blits[0][1], blits[0][0].get_size())
+        for surface, position in blits[1:]:
+            bounds.union_ip(pygame.Rect(position, surface.get_size()))
+
+        # Reaproveita a superfície enquanto o tamanho do elemento não muda
+        if self.surface is None or self.surface.get_size() != bounds.size:
+            self.surface = pygame.Surface(bounds.size, pygame.SRCALPHA)
+        else:
+            self.surface.fill((0, 0, 0, 0))
+        for surface, (x, y) in blits:
+            self.surface.blit(surface, (int(x) - bounds.x, int(y) - bounds.y))
+        self.position = bounds.topleft
+
+
+class Hud:
+    """Agrupa os elementos do HUD do nível e desenha todos numa única chamada de blits."""
+
+    def __init__(self, screen, status_bar, hotbar, score):
+        self.screen = screen
+        self.status_bar = status_bar
+        self.hotbar = hotbar
+        self.score = score
+
+    def draw(self, player, score_value):
+        blits = []
+        if player:
+            blits.append(self.status_bar.refresh(player))
+            blits.append(self.hotbar.refresh(player))
+        blits.append(self.score.refresh(score_value))
+        self.screen.blits(blits, doreturn=False)
@@ -1,15 +1,18 @@
-
-from ui.ui import Ui
+from ui.hud import HudElement
 import pygame
 
 
-class Score(Ui):
+class Score(HudElement):
     def __init__(self, screen):
         super().__init__(screen)
         self.font = pygame.font.SysFont('arial', 24)
 
-    def draw(self, score_value):
+    def state(self, score_value):
+        return score_value
+
+    def render(self, score_value):
+        # Só renderiza o texto quando a pontuação muda
         score_text = self.font.render(f'Pontuação: {score_value}', True, (255, 255, 255))
         score_rect = score_text.get_rect(topright=(self.screen.get_width() - 10, 10))
-        self.screen.blit(score_text, score_rect)
-        # In the future, replace with image-based rendering when resources are ready
\ No newline at end of file
+        # In the future, replace with image-based rendering when resources are ready
+        return [(score_text, score_rect.topleft)]
@@ -1,8 +1,8 @@
 import pygame
-from ui.ui import Ui
+from ui.hud import HudElement
 from asset_loader import AssetLoader
 
-class StatusBar(Ui):
+class StatusBar(HudElement):
     def __init__(self, screen):
         super().__init__(screen)
         # Scaling factors
@@ -52,7 +52,31 @@ class StatusBar(Ui):
         # Define icon space (for alignment with bars)
         self.icon_space = self.heart_icon.get_width() + 10 * self.scale_factor  # Icon + padding (using scale_factor for padding)
 
-    def draw(self, player):
+    def _bar_widths(self, player):
+        """Larguras em pixels das barras de vida, escudo (None se não houver) e mana."""
+        health_ratio = 0 if player.max_health <= 0 else player.health / player.max_health
+        health_ratio = max(0, min(health_ratio, 1))  # Garante entre 0 e 1
+        # Calcula o tamanho da barra com limite mínimo de 1 pixel
+        health_width = max(1, int(self.health_full_size[0] * health_ratio))
+
+        shield_width = None
+        if player.shield_health > 0:
+            # Cap shield at max_health
+            shield_ratio = min(player.shield_health / player.max_health, 1.0)  # Cap at 100% of health bar
+            shield_width = int(self.health_full_size[0] * shield_ratio)
+
+        mana_ratio = 0 if player.max_mana <= 0 else player.mana / player.max_mana
+        mana_width = max(int(self.mana_full_size[0] * mana_ratio), 0)  # <-- proteção rápida
+        return health_width, shield_width, mana_width
+
+    def state(self, player):
+        # Só muda quando alguma barra muda de largura em pixels
+        return self._bar_widths(player)
+
+    def render(self, player):
+        health_width, shield_width, mana_width = self._bar_widths(player)
+        blits = []
+
         # Positions: top-left, vertically stacked status bars
         panel_pos = (10, 10)
         padding = 5 * self.scale_factor
@@ -63,57 +87,42 @@ class StatusBar(Ui):
         health_container_y = panel_pos[1]
         # Draw icon to the left of the container
         heart_pos = (panel_pos[0], health_container_y + (self.status_bar_size[1] - self.heart_icon.get_height()) / 2)
-        self.screen.blit(self.heart_icon, heart_pos)
+        blits.append((self.heart_icon, heart_pos))
         # Draw container (status_bar_img) to the right of the icon
         health_container_x = panel_pos[0] + self.icon_space
-        self.screen.blit(self.status_bar_img, (health_container_x, health_container_y))
-        # Draw health bar inside the container, shifted left
-        health_ratio = 0 if player.max_health <= 0 else player.health / player.max_health
-        health_ratio = max(0, min(health_ratio, 1))  # Garante entre 0 e 1
-
-        # Calcula o tamanho da barra com limite mínimo de 1 pixel
-        width = max(1, int(self.health_full_size[0] * health_ratio))
-        height = max(1, self.health_full_size[1])
-        health_size = (width, height)
+        blits.append((self.status_bar_img, (health_container_x, health_container_y)))
 
+        # Draw health bar inside the container, shifted left
+        health_size = (health_width, max(1, self.health_full_size[1]))
         scaled_health = pygame.transform.scale(self.health_bar_img, health_size)
         health_pos = (
             health_container_x + padding - left_shift,
             health_container_y + (self.status_bar_size[1] - self.health_full_size[1]) / 2
         )
+        blits.append((scaled_health, health_pos))
 
-        self.screen.blit(scaled_health, health_pos)
         # Draw shield bar over health bar if shield_health > 0
-        if player.shield_health > 0:
-            # Cap shield at max_health
-            shield_ratio = min(player.shield_health / player.max_health, 1.0)  # Cap at 100% of health bar
-            shield_size = (int(self.health_full_size[0] * shield_ratio), self.health_full_size[1])
+        if shield_width is not None:
+            shield_size = (shield_width, self.health_full_size[1])
             scaled_shield = pygame.transform.scale(self.shield_bar_img, shield_size)
-            shield_pos = health_pos  # Same position as health bar
-            self.screen.blit(scaled_shield, shield_pos)
+            blits.append((scaled_shield, health_pos))  # Same position as health bar
 
-        # Mana: icon + status_bar_img + bar
         # --- MANA BAR ---
         mana_container_y = health_container_y + self.status_bar_size[1] + container_spacing
 
         # Ícone da staff
         staff_pos = (panel_pos[0], mana_container_y + (self.status_bar_size[1] - self.staff_icon.get_height()) / 2)
-        self.screen.blit(self.staff_icon, staff_pos)
+        blits.append((self.staff_icon, staff_pos))
 
         # Container da barra de mana
         mana_container_x = panel_pos[0] + self.icon_space
-        self.screen.blit(self.status_bar_img, (mana_container_x, mana_container_y))
-
-        # Calcula tamanho da barra de mana
-        mana_ratio = 0 if player.max_mana <= 0 else player.mana / player.max_mana
-        mana_width = int(self.mana_full_size[0] * mana_ratio)
-        mana_width = max(mana_width, 0)                 # <-- proteção rápida
-        mana_size = (mana_width, self.mana_full_size[1])
+        blits.append((self.status_bar_img, (mana_container_x, mana_container_y)))
 
         # Escala e desenha a barra
-        scaled_mana = pygame.transform.scale(self.mana_bar_img, mana_size)
+        scaled_mana = pygame.transform.scale(self.mana_bar_img, (mana_width, self.mana_full_size[1]))
         mana_pos = (
             mana_container_x + padding - left_shift,
             mana_container_y + (self.status_bar_size[1] - self.mana_full_size[1]) / 2
         )
-        self.screen.blit(scaled_mana, mana_pos)
\ No newline at end of file
+        blits.append((scaled_mana, mana_pos))
+        return blits
@@ -0,0 +1,70 @@
+"""Compila os mapas do Tiled (.xml) para o formato binário carregado pelo jogo (.msmap).
+
+O .msmap guarda os gids da camada de tiles como um array numpy (mapeado em memória
+no carregamento), os objetos com as propriedades já resolvidas e os dados do tileset.
+Cada arquivo registra tamanho, mtime e sha1 do XML de origem: o jogo compara tamanho e
+mtime (os.stat) e só lê o XML para conferir o sha1 quando eles mudaram. Se o XML mudar
+depois da compilação, o jogo volta a lê-lo até que os mapas sejam compilados de novo.
+
+Uso (a partir da raiz do repositório):
+    python tools/compile_maps.py                  # todos os assets/maps/*.xml
+    python tools/compile_maps.py starter level_2  # só os mapas indicados
+    python tools/compile_maps.py --check          # lista os mapas desatualizados (sai com 1 se houver)
+"""
+import argparse
+import glob
+import os
+import sys
+
+ROOT = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+sys.path.insert(0, os.path.join(ROOT, "src"))
+
+from map_data import MapData, compile_map, compiled_path  # noqa: E402
+
+MAPS_DIR = os.path.join(ROOT, "assets", "maps")
+
+
+def is_up_to_date(xml_path):
+    bundle_path = compiled_path(xml_path)
+    if not os.path.exists(bundle_path):
+        return False
+    try:
+        return MapData.load_compiled(bundle_path, xml_path) is not None
+    except (OSError, ValueError, KeyError):
+        return False
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description="Compila os mapas .xml do Tiled para .msmap.")
+    parser.add_argument("maps", nargs="*", help="Nomes dos mapas (padrão: todos os .xml de assets/maps)")
+    parser.add_argument("--check", action="store_true", help="Só verifica se os .msmap estão em dia")
+    parser.add_argument("--force", action="store_true", help="Recompila mesmo os mapas em dia")
+    args = parser.parse_args(argv)
+
+    if args.maps:
+        xml_paths = [os.path.join(MAPS_DIR, f"{name}.xml") for name in args.maps]
+    else:
+        xml_paths = sorted(glob.glob(os.path.join(MAPS_DIR, "*.xml")))
+
+    stale = []
+    for xml_path in xml_paths:
+        name = os.path.splitext(os.path.basename(xml_path))[0]
+        if not os.path.exists(xml_path):
+            print(f"{name}: XML não encontrado", file=sys.stderr)
+            stale.append(name)
+            continue
+        if not args.force and is_up_to_date(xml_path):
+            print(f"{name}: em dia")
+            continue
+        if args.check:
+            print(f"{name}: desatualizado")
+            stale.append(name)
+            continue
+        output_path = compile_map(xml_path)
+        print(f"{name}: {os.path.relpath(output_path, ROOT)} ({os.path.getsize(output_path)} bytes)")
+
+    return 1 if stale else 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())